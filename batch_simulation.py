@@ -0,0 +1,54 @@
+import argparse
+import json
+import os
+import time
+
+# The environment variable must be set before the game is imported, so pygame starts with its dummy drivers.
+# Worker processes inherit it, so they start headlessly as well.
+os.environ["CLU_HEADLESS"] = "1"
+
+from game.gameplay.batch_simulation import boardLevelCounts, makeLevelJobs, POLICIES, runBatch, summarizeResults
+from game.gameplay.level import levelsByName
+
+
+def main():
+    """Simulate many levels across several processes, then print a summary of the results of each level."""
+    levelNames = [name for name, level in levelsByName.items() if level in boardLevelCounts]
+    parser = argparse.ArgumentParser(description="Simulate many Clu Clu Land levels in parallel, without a display.")
+    parser.add_argument("--levels", nargs="+", default=levelNames, choices=sorted(levelsByName),
+                        metavar="LEVEL", help="names of the levels to simulate (default: every board's levels)")
+    parser.add_argument("--runs", type=int, default=10, help="number of times to simulate each level")
+    parser.add_argument("--players", type=int, default=1, choices=range(1, 5), help="number of players")
+    parser.add_argument("--policy", default="random",
+                        help="input policy: one of {}, or module.path:functionName".format(", ".join(POLICIES)))
+    parser.add_argument("--level-count", type=int, default=None,
+                        help="levelCount to play every level at (default: the board's first levelCount)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run, increased by 1 each run")
+    parser.add_argument("--processes", type=int, default=None, help="number of worker processes (default: CPUs)")
+    parser.add_argument("--max-frames", type=int, default=None, help="maximum number of frames to run each level")
+    parser.add_argument("--output", default=None, help="path of a JSON file to write every result to")
+    args = parser.parse_args()
+
+    jobs = makeLevelJobs(args.levels, args.runs, args.players, args.policy, args.seed, args.max_frames,
+                         args.level_count)
+    startTime = time.perf_counter()
+    results = runBatch(jobs, args.processes)
+    elapsedTime = time.perf_counter() - startTime
+    frameCount = sum(result["frames"] for result in results)
+    print("{} runs, {} frames in {:.2f}s ({:.0f} frames/s)".format(len(results), frameCount, elapsedTime,
+                                                                   frameCount / max(elapsedTime, 1e-9)))
+    print("{:<16}{:>6}{:>8}{:>10}{:>9}{:>9}{:>11}{:>10}{:>10}".format(
+        "LEVEL", "RUNS", "CLEAR", "FRAMES", "SCORE", "DEATHS", "MEAN(us)", "P95(us)", "MAX(us)"))
+    for summary in summarizeResults(results):
+        clearFrames = "-" if summary["clearFrames"] is None else "{:.0f}".format(summary["clearFrames"])
+        print("{:<16}{:>6}{:>8.0%}{:>10}{:>9.0f}{:>9.2f}{:>11.1f}{:>10.1f}{:>10.1f}".format(
+            summary["levelName"], summary["runs"], summary["clearRate"], clearFrames, summary["score"],
+            summary["deaths"], summary["frameMean"], summary["frameP95"], summary["frameMax"]))
+
+    if args.output is not None:
+        with open(args.output, "w") as outputFile:
+            json.dump(results, outputFile, indent=1)
+
+
+if __name__ == "__main__":
+    main()
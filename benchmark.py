@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+
+# The environment variable must be set before the game is imported, so pygame starts with its dummy drivers.
+os.environ["CLU_HEADLESS"] = "1"
+
+from game.gameplay.benchmark import BENCHMARKS, compareToBaseline, runBenchmarks, saveBaseline
+import game.tools.constants as c
+
+
+def main():
+    """Run the sprite and drawing benchmarks, print their results, and compare them against a saved baseline.
+
+    The program exits with a status of 1 if any benchmark is slower than its baseline by more than the tolerance.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Clu Clu Land sprite update and drawing functions.")
+    parser.add_argument("--benchmarks", nargs="+", default=None, choices=list(BENCHMARKS), metavar="NAME",
+                        help="names of the benchmarks to run (default: all of them)")
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 4, 16],
+                        help="sprite count multipliers to run each benchmark at")
+    parser.add_argument("--repeats", type=int, default=5, help="number of times to time each benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds each timing should take")
+    parser.add_argument("--baseline", default=os.path.join(c.BENCHMARK_FOLDER, "baseline.json"),
+                        help="path of the baseline file to compare against or save to")
+    parser.add_argument("--save-baseline", action="store_true", help="save these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="fraction slower than the baseline that counts as a regression")
+    args = parser.parse_args()
+
+    print("{:<30}{:>6}{:>14}{:>12}{:>10}{:>12}{:>10}".format("BENCHMARK", "SCALE", "OPS/S", "US/OP", "FRAME%",
+                                                             "PEAK KB", "BLOCKS"))
+
+    def printResult(result):
+        print("{name:<30}{scale:>6}{opsPerSecond:>14.1f}{microseconds:>12.2f}{framePercent:>10.2f}"
+              "{peakKilobytes:>12.1f}{retainedBlocks:>10}".format(**result))
+        sys.stdout.flush()
+
+    results = runBenchmarks(args.benchmarks, args.scales, args.repeats, args.min_time, printResult)
+
+    if args.save_baseline:
+        saveBaseline(results, args.baseline)
+        print("Saved baseline to {}".format(args.baseline))
+    elif os.path.exists(args.baseline):
+        comparisons = compareToBaseline(results, args.baseline, args.tolerance)
+        print("\nCompared to {}:".format(args.baseline))
+        for comparison in comparisons:
+            print("{name:<30}{scale:>6}{ratio:>10.2f}x{0}".format("  REGRESSION" if comparison["isRegression"] else "",
+                                                                **comparison))
+        if any(comparison["isRegression"] for comparison in comparisons):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,15 @@ from game.gameplay.state import checkQuitGame
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
 from game.tools.controls import controlsDicts
+from game.tools.text_cache import renderText
 
 
 def animateDemo():
     """Play the demo animation until the user presses return to cancel it."""
     pg.mixer.music.load(c.DEMO_MUSIC)
     pg.mixer.music.play()
-    playerNames = [c.DEMO_FONT.render("BUBBLES", False, c.RED), c.DEMO_FONT.render("GLOOPY", False, c.GREEN),
-                   c.DEMO_FONT.render("NEMO", False, c.BLUE), c.DEMO_FONT.render("DIZZY", False, c.YELLOW)]
+    playerNames = [renderText("BUBBLES", c.RED, c.DEMO_FONT), renderText("GLOOPY", c.GREEN, c.DEMO_FONT),
+                   renderText("NEMO", c.BLUE, c.DEMO_FONT), renderText("DIZZY", c.YELLOW, c.DEMO_FONT)]
     playerNameCoordinates = [(103, 61), (127, 61), (145, 337), (122, 337)]
 
     coverRect = pg.Rect(20, -260, 380, 260)
@@ -3,6 +3,7 @@ import pygame as pg
 import game.tools.constants as c
 from game.sprites.sprite_sheet import SpriteSheet
 from game.tools.asset_cache import playSound
+from game.tools.transform_cache import getFlippedImage, getRotatedImage
 
 
 class DemoSprite(pg.sprite.Sprite):
@@ -19,7 +20,7 @@ class DemoSprite(pg.sprite.Sprite):
 
         Instance variables:
             spriteSheet: The SpriteSheet object for the demo sprite sheet image.
-            animationFrames: An empty list. Subclasses replace this with a list of Surface objects from the
+            animationFrames: An empty list. Subclasses replace this with a tuple of shared Surface objects from the
                 SpriteSheet object.
             frameCount: An integer that increases whenever the update method is called in the subclasses.
                 Used to control when other methods should be called.
@@ -34,7 +35,7 @@ class DemoSprite(pg.sprite.Sprite):
         self.animationFrames = []
         self.coordinates = coordinates
         self.frameCount = 0
-        self.emptyImage = self.spriteSheet.getSheetImage(546, 416, 32, 32)
+        self.emptyImage = self.spriteSheet.getSharedSheetImage(546, 416, 32, 32)
         self.image = self.emptyImage
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
@@ -81,12 +82,12 @@ class PostSprite(DemoSprite):
         """Init PostSprite using the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 2 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 2 Surface objects from the SpriteSheet object.
             image: The current image to be drawn for the sprite.
                 Defaults to the first image in animationFrames.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(0, 0, 32, 32, 2)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(0, 0, 32, 32, 2)
         self.image = self.animationFrames[0]
 
     def setMonochromeImage(self):
@@ -122,7 +123,7 @@ class DemoPlayerSprite(DemoSprite):
         Instance variables:
             playerNumber: An integer one greater than demoNumber. Used over demoNumber for the sake of clarity in
                 in methods.
-            animationFrames: A list of multiple Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of multiple Surface objects from the SpriteSheet object.
                 Which Surface objects are included depends on playerNumber.
             image: The current image to be drawn for the sprite.
                 Defaults to the emptyImage.
@@ -135,13 +136,13 @@ class DemoPlayerSprite(DemoSprite):
         super().__init__(coordinates)
         self.playerNumber = demoNumber + 1
         if self.playerNumber == 1:
-            self.animationFrames = self.spriteSheet.getStripImages(0, 236, 68, 104, 5)
+            self.animationFrames = self.spriteSheet.getSharedStripImages(0, 236, 68, 104, 5)
         elif self.playerNumber == 2:
-            self.animationFrames = self.spriteSheet.getStripImages(0, 340, 68, 76, 6)
+            self.animationFrames = self.spriteSheet.getSharedStripImages(0, 340, 68, 76, 6)
         elif self.playerNumber == 3:
-            self.animationFrames = self.spriteSheet.getStripImages(0, 416, 68, 104, 9)
+            self.animationFrames = self.spriteSheet.getSharedStripImages(0, 416, 68, 104, 9)
         else:
-            self.animationFrames = self.spriteSheet.getStripImages(408, 340, 68, 76, 2)
+            self.animationFrames = self.spriteSheet.getSharedStripImages(408, 340, 68, 76, 2)
         self.image = self.animationFrames[0]
         self.rect = self.image.get_rect()
         self.animated = False
@@ -178,9 +179,9 @@ class DemoPlayerSprite(DemoSprite):
         # This is not triggered if frameCount is 0, since all sprites start on the same coordinates when the demo
         # animation begins.
         if DemoPlayerSprite.facingDirection == c.Directions.LEFT and 0 < self.frameCount:
-            self.image = pg.transform.flip(self.image, True, False)
+            self.image = getFlippedImage(self.image, True, False)
         elif DemoPlayerSprite.facingDirection == c.Directions.UP and 0 < self.frameCount:
-            self.image = pg.transform.flip(self.image, False, True)
+            self.image = getFlippedImage(self.image, False, True)
 
     def playerOneUpdate(self):
         """Change the sprite's image and coordinates based on frameCount, if it strikes a wall demo sprite.
@@ -216,7 +217,7 @@ class DemoPlayerSprite(DemoSprite):
                 else:
                     self.image = self.animationFrames[3]
                 if 23 < self.swingFrameCount < 35 and not self.clockwise:
-                    self.image = pg.transform.flip(self.image, False, True)
+                    self.image = getFlippedImage(self.image, False, True)
             elif 14 < self.swingFrameCount < 24 or 53 < self.swingFrameCount < 63:
                 if self.frameCount % 8 < 4:
                     self.image = self.animationFrames[4]
@@ -343,7 +344,7 @@ class DemoArmSprite(DemoSprite):
         """Init DemoArmSprite using the integer demoNumber and the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of multiple Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of multiple Surface objects from the SpriteSheet object.
                 Which Surface objects are included depends on playerNumber.
             extendedDirection: A Directions Enum instance of the current direction in which the sprite is
                 extended.
@@ -353,7 +354,7 @@ class DemoArmSprite(DemoSprite):
         """
         super().__init__(coordinates)
         self.demoNumber = demoNumber
-        self.animationFrames = self.spriteSheet.getStripImages(64, 0, 32, 32, 4)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(64, 0, 32, 32, 4)
         self.flipped = flipped
         self.extendedDirection = c.Directions.RIGHT
 
@@ -373,11 +374,11 @@ class DemoArmSprite(DemoSprite):
                 self.image = self.animationFrames[0]
                 if 120 < self.frameCount < 130 or 183 < self.frameCount < 193 or 246 < self.frameCount < 256 or\
                         285 < self.frameCount < 296 or 324 < self.frameCount:
-                    self.image = pg.transform.rotate(self.image, 270)
+                    self.image = getRotatedImage(self.image, 270)
                 if 129 < self.frameCount < 141 or 192 < self.frameCount < 204 or 255 < self.frameCount < 267 or\
                         295 < self.frameCount < 306:
                     self.image = self.animationFrames[1]
-                    self.image = pg.transform.rotate(self.image, 90)
+                    self.image = getRotatedImage(self.image, 90)
                 elif 111 < self.frameCount < 121 or 174 < self.frameCount < 184 or 237 < self.frameCount < 247 or\
                         276 < self.frameCount < 286 or 315 < self.frameCount < 325:
                     self.image = self.animationFrames[2]
@@ -385,7 +386,7 @@ class DemoArmSprite(DemoSprite):
                 self.image = self.emptyImage
             self.adjustPosition()
             if self.extendedDirection == c.Directions.LEFT:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
             if self.frameCount in [107, 171, 233]:
                 playSound("grab_post_move_end.wav")
 
@@ -401,9 +402,9 @@ class DemoArmSprite(DemoSprite):
                 self.flipped = True
                 self.coordinates = (self.coordinates[0], self.coordinates[1] - 88)
             if DemoPlayerSprite.facingDirection == c.Directions.LEFT:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
         if self.flipped:
-            self.image = pg.transform.flip(self.image, False, True)
+            self.image = getFlippedImage(self.image, False, True)
 
     def setCoordinates(self):
         """Change the coordinates if the demo player sprite is paused (i.e., if it is swinging)."""
@@ -454,7 +455,7 @@ class DemoGoldSprite(DemoSprite):
         """Init DemoGoldSprite using the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 11 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 11 Surface objects from the SpriteSheet object.
             animationCount: An integer tracking from where in animationFrame the sprite should take its next
                 image.
             timesFlipped: An integer tracking how many times this sprite has started its flip animation.
@@ -462,7 +463,7 @@ class DemoGoldSprite(DemoSprite):
             rect: A rect object for the sprite.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(0, 32, 68, 68, 10)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(0, 32, 68, 68, 10)
         self.animationCount = 0
         self.timesFlipped = 0
         self.flipping = False
@@ -527,14 +528,14 @@ class DemoHoleSprite(DemoSprite):
         """Init DemoHoleSprite using the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 11 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 11 Surface objects from the SpriteSheet object.
             animationCount: An integer tracking from where in animationFrame the sprite should take its next
                 image.
             image: The current image to be drawn for the sprite.
             rect: A rect object for the sprite.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(0, 100, 68, 68, 5)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(0, 100, 68, 68, 5)
         self.animationCount = 0
         self.image = self.animationFrames[0]
         self.rect = self.image.get_rect()
@@ -573,13 +574,13 @@ class DemoUrchinSprite(DemoSprite):
         """Init DemoUrchinSprite using the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 11 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 11 Surface objects from the SpriteSheet object.
             animationCount: An integer tracking the current state of the sprite's animation.
             image: The current image to be drawn for the sprite.
             rect: A rect object for the sprite.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(136, 168, 68, 68, 7)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(136, 168, 68, 68, 7)
         self.animationCount = 0
         self.audioCount = 1
         self.image = self.animationFrames[0]
@@ -641,11 +642,11 @@ class DemoWaveSprite(DemoSprite):
         """Init DemoWaveSprite using the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 11 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 11 Surface objects from the SpriteSheet object.
             rect: A rect object for the sprite.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(0, 168, 68, 68, 2)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(0, 168, 68, 68, 2)
         self.rect = self.image.get_rect()
 
     def update(self):
@@ -675,12 +676,12 @@ class DemoRubberTrapSprite(DemoSprite):
         """Init DemoRubberTrapSprite using the integer demoNumber and the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 11 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 11 Surface objects from the SpriteSheet object.
             animated: A boolean indicating whether or not the sprite is currently going through an animation.
             image: The current image to be drawn for the sprite.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(0, 520, 96, 120, 6)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(0, 520, 96, 120, 6)
         self.demoNumber = demoNumber
         self.animated = False
         self.image = self.animationFrames[0]
@@ -700,12 +701,12 @@ class DemoRubberTrapSprite(DemoSprite):
             else:
                 self.image = self.animationFrames[0]
             if 18 < self.frameCount < 30:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
             elif self.frameCount % 33 == 0:
                 self.frameCount = 0
                 self.animated = False
             if self.demoNumber == 0:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
         else:
             self.image = self.animationFrames[0]
 
@@ -722,7 +723,7 @@ class DemoRubberTrapSprite(DemoSprite):
         self.image = self.animationFrames[4]
         if self.demoNumber == 1:
             self.image = self.animationFrames[5]
-            self.image = pg.transform.flip(self.image, True, False)
+            self.image = getFlippedImage(self.image, True, False)
 
 
 class DemoWallSprite(DemoSprite):
@@ -738,14 +739,14 @@ class DemoWallSprite(DemoSprite):
         """Init DemoWallSprite using the integer demoNumber and the tuple coordinates.
 
         Instance variables:
-            animationFrames: A list of 11 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 11 Surface objects from the SpriteSheet object.
             animated: A boolean indicating whether or not the sprite is currently going through an animation.
             image: The current image to be drawn for the sprite.
                 The image to be drawn depends on demoNumber.
             rect: A rect object for the sprite.
         """
         super().__init__(coordinates)
-        self.animationFrames = self.spriteSheet.getStripImages(680, 0, 255, 564)
+        self.animationFrames = self.spriteSheet.getSharedStripImages(680, 0, 255, 564)
         self.demoNumber = demoNumber
         self.image = self.animationFrames[0]
         if demoNumber == 2:
@@ -761,7 +762,7 @@ class DemoWallSprite(DemoSprite):
         self.frameCount += 1
         if self.demoNumber == 2:
             self.image = self.animationFrames[1]
-            self.image = pg.transform.flip(self.image, True, False)
+            self.image = getFlippedImage(self.image, True, False)
 
         for sprite in c.demoGroup:
             if isinstance(sprite, DemoPlayerSprite) and self.rect.colliderect(sprite.rect) and 0 < self.frameCount\
@@ -801,8 +802,8 @@ class DemoDisplay(pg.sprite.Sprite):
         self.demoNumber = demoNumber
         self.coordinates = coordinates
 
-        self.animationFrames.extend(self.spriteSheet.getStripImages(0, 0, 380, 260))
-        self.animationFrames.extend(self.spriteSheet.getStripImages(0, 260, 380, 260))
+        self.animationFrames.extend(self.spriteSheet.getSharedStripImages(0, 0, 380, 260))
+        self.animationFrames.extend(self.spriteSheet.getSharedStripImages(0, 260, 380, 260))
 
         self.image = self.animationFrames[self.demoNumber]
         self.image.set_colorkey(c.BLACK)
@@ -838,7 +839,7 @@ class DemoNameDisplay(DemoDisplay):
             rect: A rect object for the sprite.
         """
         super().__init__(demoNumber, coordinates)
-        self.image = self.spriteSheet.getSheetImage(0, 520, 365, 70)
+        self.image = self.spriteSheet.getSharedSheetImage(0, 520, 365, 70)
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
 
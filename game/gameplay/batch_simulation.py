@@ -0,0 +1,229 @@
+import importlib
+import multiprocessing
+import random
+import statistics
+import time
+
+from game.gameplay.level import boardOneLevels, boardTwoLevels, boardThreeLevels, boardFourLevels, boardFiveLevels,\
+    levelsByName
+from game.gameplay.simulation import getLevelResult, LevelSimulation, startSimulatedGame
+from game.gameplay.player_actions import DIRECTION_CONTROLS
+import game.tools.constants as c
+from game.tools.event_bus import EventCounter
+
+
+# Each board is played at the levelCount it is first reached at during a normal game, unless a job says otherwise.
+# This keeps the players' speed and the time given the same as they would be on that board in a real game.
+boardLevelCounts = {}
+for boardLevelCount, boardList in enumerate([boardOneLevels, boardTwoLevels, boardThreeLevels, boardFourLevels,
+                                             boardFiveLevels], 1):
+    for boardLevel in boardList:
+        boardLevelCounts[boardLevel] = boardLevelCount
+
+# countedEvents associates each type of event counted during a job with the name of its count in the job's result.
+countedEvents = {c.GameEvents.PLAYER_DIED: "deaths", c.GameEvents.ENEMY_SPAWNED: "enemiesSpawned",
+                 c.GameEvents.ENEMY_KILLED: "enemiesKilled", c.GameEvents.ITEM_COLLECTED: "itemsCollected"}
+
+
+def makeIdlePolicy(seed):
+    """Make an input policy where no player ever presses anything.
+
+    Args:
+        seed: An integer to seed the policy's random choices with. Unused by this policy.
+
+    Returns:
+        None, which LevelSimulation treats as no inputs.
+    """
+    return None
+
+
+def makeRandomPolicy(seed):
+    """Make an input policy where every player presses and holds random controls.
+
+    Players in the BALL state always start moving in a random direction. Otherwise, they sometimes hold a random
+    direction for 10 to 40 frames to swing around a post, and sometimes shoot.
+    The policy uses its own random number generator, so it does not change the game's use of gameRandom.
+
+    Args:
+        seed: An integer to seed the policy's random choices with.
+
+    Returns:
+        getRandomInputs: A function that is passed a LevelSimulation object and returns its playerInputs.
+    """
+    policyRandom = random.Random(seed)
+    heldDirections = {}
+    holdCounts = {}
+
+    def getRandomInputs(simulation):
+        """Get random playerInputs for the current frame of the simulation."""
+        playerInputs = []
+        for player in simulation.playerList:
+            pressedControls = []
+            if holdCounts.get(player, 0) > 0:
+                holdCounts[player] -= 1
+            if player.playerState == c.PlayerStates.BALL:
+                pressedControls.append(policyRandom.choice(DIRECTION_CONTROLS))
+            elif policyRandom.random() < 0.04:
+                heldDirections[player] = policyRandom.choice(DIRECTION_CONTROLS)
+                holdCounts[player] = policyRandom.randint(10, 40)
+                pressedControls.append(heldDirections[player])
+            if policyRandom.random() < 0.01:
+                pressedControls.append("shoot")
+            heldControls = [heldDirections[player]] if holdCounts.get(player, 0) > 0 else []
+            playerInputs.append((pressedControls, heldControls))
+        return playerInputs
+
+    return getRandomInputs
+
+
+# POLICIES associates the name of each built-in input policy with the function that makes it.
+# Any other policy can be used by naming it in the form "module.path:functionName", where the function is passed an
+# integer seed and returns an input function, in the same way as those below.
+POLICIES = {"idle": makeIdlePolicy, "random": makeRandomPolicy}
+
+
+def getPolicy(policyName, seed):
+    """Make the input policy with the passed name.
+
+    Args:
+        policyName: The string name of a policy in POLICIES, or a string in the form "module.path:functionName".
+        seed: An integer to seed the policy's random choices with.
+
+    Returns:
+        An input function to pass to LevelSimulation.run, or None for no inputs.
+    """
+    if policyName in POLICIES:
+        return POLICIES[policyName](seed)
+    moduleName, _, functionName = policyName.partition(":")
+    return getattr(importlib.import_module(moduleName), functionName)(seed)
+
+
+def makeLevelJobs(levelNames, runsPerLevel, numberOfPlayers=1, policyName="random", baseSeed=0, maxFrames=None,
+                  levelCount=None):
+    """Make the jobs to simulate each of the passed levels a number of times.
+
+    Each job is given its own seed, counting up from baseSeed, so every job can be rerun exactly.
+
+    Args:
+        levelNames: A list of the string names of the levels to simulate, as in levelsByName.
+        runsPerLevel: An integer number of times to simulate each level.
+        numberOfPlayers: An integer showing how many players play each level.
+        policyName: The string name of the input policy to use, as passed to getPolicy.
+        baseSeed: The integer seed of the first job.
+        maxFrames: An integer limit on how many frames each level can run for. Defaults to None, meaning there is
+            no limit.
+        levelCount: An integer levelCount to play every level at. Defaults to None, meaning that each level is
+            played at the levelCount its board is first reached at.
+
+    Returns:
+        jobs: A list of dicts, each describing one simulation to run with runSimulationJob.
+    """
+    jobs = []
+    for levelName in levelNames:
+        for _ in range(runsPerLevel):
+            jobs.append({"index": len(jobs), "levelName": levelName, "levelCount": levelCount,
+                         "numberOfPlayers": numberOfPlayers, "policy": policyName, "seed": baseSeed + len(jobs),
+                         "maxFrames": maxFrames})
+    return jobs
+
+
+def runSimulationJob(job):
+    """Simulate a single level as described by a job from makeLevelJobs, timing every frame.
+
+    Args:
+        job: A dict describing the simulation to run.
+
+    Returns:
+        result: A dict holding the job's description, the results from getLevelResult, how many times each event in
+            countedEvents was published, and statistics on how many microseconds each frame took to simulate.
+    """
+    level = levelsByName[job["levelName"]]
+    levelCount = job["levelCount"] if job["levelCount"] is not None else boardLevelCounts.get(level, 1)
+    playerList, playerArmList, gameOverTextStates = startSimulatedGame(job["numberOfPlayers"], job["seed"])
+    simulation = LevelSimulation(playerList, playerArmList, level, levelCount, gameOverTextStates)
+    inputFunction = getPolicy(job["policy"], job["seed"])
+
+    frameTimes = []
+    eventCounter = EventCounter(countedEvents)
+    eventCounter.start()
+    while not simulation.isFinished and (job["maxFrames"] is None or simulation.stepCount < job["maxFrames"]):
+        playerInputs = inputFunction(simulation) if inputFunction is not None else None
+        startTime = time.perf_counter()
+        simulation.step(playerInputs)
+        frameTimes.append(time.perf_counter() - startTime)
+    eventCounter.stop()
+
+    frameTimes.sort()
+    result = dict(job)
+    result.update(getLevelResult(simulation))
+    result.update({countedEvents[eventType]: count for eventType, count in eventCounter.counts.items()})
+    result.update({"finished": simulation.isFinished,
+                   "frameMean": 1e6 * statistics.mean(frameTimes) if frameTimes else 0,
+                   "frameP95": 1e6 * frameTimes[int(0.95 * (len(frameTimes) - 1))] if frameTimes else 0,
+                   "frameMax": 1e6 * frameTimes[-1] if frameTimes else 0})
+    return result
+
+
+def runBatch(jobs, processes=None, callback=None):
+    """Run every job in a pool of worker processes.
+
+    Each worker process has its own copy of every sprite group and class variable, so the jobs cannot affect each
+    other. The game should be running in headless mode (See HEADLESS in constants.py) before this is called, so
+    that the workers inherit it.
+
+    Args:
+        jobs: A list of job dicts, as made by makeLevelJobs.
+        processes: An integer number of worker processes to use. Defaults to None, meaning one for each CPU.
+            If it is 1, the jobs are run in this process instead.
+        callback: A function that is passed each result as soon as it is finished. Defaults to None.
+
+    Returns:
+        results: A list of the result dicts from runSimulationJob, in the same order as jobs.
+    """
+    results = []
+    if processes == 1:
+        resultIterator = map(runSimulationJob, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes)
+        chunkSize = max(1, len(jobs) // (4 * (processes or multiprocessing.cpu_count())))
+        resultIterator = pool.imap_unordered(runSimulationJob, jobs, chunkSize)
+    try:
+        for result in resultIterator:
+            results.append(result)
+            if callback is not None:
+                callback(result)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    results.sort(key=lambda result: result["index"])
+    return results
+
+
+def summarizeResults(results):
+    """Aggregate the results of many jobs by level.
+
+    Args:
+        results: A list of result dicts from runSimulationJob.
+
+    Returns:
+        summaries: A list of dicts, one for each level in the order they first appear in results, holding how many
+            runs there were, the fraction of them that cleared the level, the average frames taken to clear it,
+            the average score and deaths, and the average and worst frame times in microseconds.
+    """
+    resultsByLevel = {}
+    for result in results:
+        resultsByLevel.setdefault(result["levelName"], []).append(result)
+    summaries = []
+    for levelName, levelResults in resultsByLevel.items():
+        clearFrames = [result["frames"] for result in levelResults if result["cleared"]]
+        summaries.append({"levelName": levelName, "runs": len(levelResults),
+                          "clearRate": len(clearFrames) / len(levelResults),
+                          "clearFrames": statistics.mean(clearFrames) if clearFrames else None,
+                          "score": statistics.mean(sum(result["scores"]) for result in levelResults),
+                          "deaths": statistics.mean(result["deaths"] for result in levelResults),
+                          "frameMean": statistics.mean(result["frameMean"] for result in levelResults),
+                          "frameP95": statistics.mean(result["frameP95"] for result in levelResults),
+                          "frameMax": max(result["frameMax"] for result in levelResults)})
+    return summaries
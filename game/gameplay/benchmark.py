@@ -0,0 +1,402 @@
+import gc
+import json
+import os
+import random
+import time
+import tracemalloc
+
+from game.gameplay.draw_level import blitLevelData, scrollLevelData
+from game.gameplay.gold_engine import GoldEngine, np
+from game.gameplay.level import levelsByName
+from game.gameplay.setup_level import setLevelConstants, setLevelSprites
+from game.gameplay.simulation import startSimulatedGame
+from game.sprites.gold import GoldSprite
+from game.sprites.player import PlayerSprite
+from game.sprites.trap import RubberTrapSprite
+from game.sprites.urchin import UrchinSprite
+import game.tools.constants as c
+from game.tools.sprite_pool import getPooledSprite
+
+
+# Every benchmark is played on the same level, with the same seed, so that the results can be compared between runs.
+BENCHMARK_LEVEL = "HEART"
+BENCHMARK_SEED = 0
+FRAME_BUDGET = 1 / c.FPS
+
+
+class UnthrottledClock:
+    """Stand in for CLOCK while a benchmark runs, so functions that wait for the next frame do not wait at all."""
+
+    def tick(self, framerate=0):
+        """Return immediately instead of waiting to keep the frame rate below framerate.
+
+        Returns:
+            0, as no time is spent waiting.
+        """
+        return 0
+
+
+def startBenchmark(numberOfPlayers=1):
+    """Reset the game and prepare the benchmark level's sprites, as at the start of its first playthrough.
+
+    Args:
+        numberOfPlayers: An integer showing how many players to create.
+
+    Returns:
+        playerList: A list of all PlayerSprite objects created.
+        level: The Level object the benchmark is played on.
+        benchmarkRandom: A random.Random object to place the benchmark's extra sprites with.
+    """
+    level = levelsByName[BENCHMARK_LEVEL]
+    playerList, _, _ = startSimulatedGame(min(numberOfPlayers, 4), BENCHMARK_SEED)
+    playerList.extend(PlayerSprite(num % 4 + 1) for num in range(4, numberOfPlayers))
+    PlayerSprite.currentLevel = level
+    setLevelSprites(level)
+    setLevelConstants(1)
+    return playerList, level, random.Random(BENCHMARK_SEED)
+
+
+def getRandomTile(benchmarkRandom):
+    """Get the (x, y) tile position of a random tile inside of the level boundaries.
+
+    Args:
+        benchmarkRandom: A random.Random object to choose the tile with.
+
+    Returns:
+        A tuple in the form (x, y).
+    """
+    return benchmarkRandom.randint(1, 10), benchmarkRandom.randint(1, 7)
+
+
+def setUpGoldUpdate(scale):
+    """Prepare the level's gold sprites, along with 28 more for each scale above 1, in a mix of states.
+
+    Returns:
+        updateGold: A function that updates every gold sprite once, as in one frame of gameplay.
+    """
+    _, _, benchmarkRandom = startBenchmark()
+    for _ in range(28 * (scale - 1)):
+        x, y = getRandomTile(benchmarkRandom)
+        gold = getPooledSprite(GoldSprite)
+        gold.isHorizontal = benchmarkRandom.random() < 0.5
+        if gold.isHorizontal:
+            gold.setCoordinates(-1 + 48 * x, 25 + 48 * y)
+        else:
+            gold.setCoordinates(-25 + 48 * x, 49 + 48 * y)
+    goldStates = [c.OtherStates.OFF_SCREEN, c.OtherStates.REVEALED, c.OtherStates.UPSIDE_DOWN,
+                  c.OtherStates.FLIPPING_UP]
+    for num, gold in enumerate(c.goldGroup):
+        gold.goldState = goldStates[num % len(goldStates)]
+
+    def updateGold():
+        GoldSprite.globalFrameCount += 1
+        for gold in c.goldGroup:
+            gold.update()
+    return updateGold
+
+
+def setUpGoldEngineStep(scale):
+    """Prepare the same gold sprites as setUpGoldUpdate, to be updated by a GoldEngine.
+
+    Returns:
+        stepGold: A function that updates every gold sprite once with the engine, as in one frame of gameplay.
+    """
+    setUpGoldUpdate(scale)
+    c.goldGroup.engine = GoldEngine(c.goldGroup.sprites())
+
+    def stepGold():
+        GoldSprite.globalFrameCount += 1
+        c.goldGroup.update()
+    return stepGold
+
+
+def createUrchins(scale):
+    """Create 4 moving urchin sprites for each scale, at random intersections of the level.
+
+    Args:
+        scale: An integer multiplier for how many sprites to create.
+    """
+    _, _, benchmarkRandom = startBenchmark()
+    for _ in range(4 * scale):
+        x, y = getRandomTile(benchmarkRandom)
+        urchin = getPooledSprite(UrchinSprite)
+        urchin.setCoordinates(-1 + 48 * x, 1 + 48 * y)
+        urchin.enemyState = c.EnemyStates.MOVING
+        urchin.changeImage("move", 0)
+        urchin.setRandomDirection()
+
+
+def setUpUrchinUpdate(scale):
+    """Prepare 4 moving urchin sprites for each scale.
+
+    Returns:
+        updateUrchins: A function that updates every urchin sprite once, as in one frame of gameplay.
+    """
+    createUrchins(scale)
+
+    def updateUrchins():
+        for urchin in c.enemyGroup:
+            urchin.update()
+    return updateUrchins
+
+
+def setUpUrchinMove(scale):
+    """Prepare 4 moving urchin sprites for each scale.
+
+    Returns:
+        moveUrchins: A function that moves every urchin sprite once.
+    """
+    createUrchins(scale)
+
+    def moveUrchins():
+        for urchin in c.enemyGroup:
+            urchin.moveSprite()
+    return moveUrchins
+
+
+def setUpPlayers(scale, playerState):
+    """Prepare 4 player sprites for each scale, at random places on the level, in the MOVING or SWINGING state.
+
+    Whenever a player leaves that state (Such as by hitting a wall or falling into a black hole), it is put back
+    into that state at the place it started, so the players keep doing the same work every frame.
+
+    Returns:
+        updatePlayers: A function that updates every player sprite once, as in one frame of gameplay.
+    """
+    playerList, _, benchmarkRandom = startBenchmark(4 * scale)
+    startPositions = []
+    for player in playerList:
+        x, y = getRandomTile(benchmarkRandom)
+        startPositions.append((48 * x, 49 + 48 * y, benchmarkRandom.choice(["up", "down", "left", "right"]),
+                               benchmarkRandom.randrange(0, 360, 15)))
+
+    def resetPlayer(player, startPosition):
+        x, y, direction, angle = startPosition
+        player.lives = 5
+        player.initialize(x, y)
+        player.startMoving(direction)
+        if playerState == c.PlayerStates.SWINGING:
+            player.playerState = c.PlayerStates.SWINGING
+            player.swingingArmCoordinates = (x + 36, y - 13)
+            player.currentAngle = angle
+
+    for player, startPosition in zip(playerList, startPositions):
+        resetPlayer(player, startPosition)
+
+    def updatePlayers():
+        for player, startPosition in zip(playerList, startPositions):
+            if player.playerState != playerState:
+                resetPlayer(player, startPosition)
+            player.update()
+    return updatePlayers
+
+
+def setUpRubberTrapUpdate(scale):
+    """Prepare the level's rubber trap sprites, along with 8 more for each scale above 1, in a mix of states.
+
+    Returns:
+        updateTraps: A function that updates every rubber trap sprite once, as in one frame of gameplay.
+    """
+    playerList, _, benchmarkRandom = startBenchmark()
+    playerList[0].initialize(48, 49)
+    for _ in range(8 * (scale - 1)):
+        x, y = getRandomTile(benchmarkRandom)
+        trap = getPooledSprite(RubberTrapSprite)
+        trap.isHorizontal = benchmarkRandom.random() < 0.5
+        if trap.isHorizontal:
+            trap.setCoordinates(-14 + 48 * x, 14 + 48 * y)
+        else:
+            trap.setCoordinates(-36 + 48 * x, 36 + 48 * y)
+    trapStates = [c.OtherStates.OFF_SCREEN, c.OtherStates.REVEALED, c.OtherStates.TRIGGERED]
+    for num, trap in enumerate(c.rubberGroup):
+        trap.trapState = trapStates[num % len(trapStates)]
+        trap.collidingPlayer = playerList[0]
+
+    def updateTraps():
+        for trap in c.rubberGroup:
+            if trap.trapState == c.OtherStates.REVEALED and trap.frameCount == 0:
+                trap.trapState = c.OtherStates.TRIGGERED
+            trap.update()
+    return updateTraps
+
+
+def setUpBlitLevelData(scale, animate=False):
+    """Prepare 2 players, and the level's gold, rubber trap and black hole sprites, along with 28 more gold
+    sprites for each scale above 1.
+
+    Returns:
+        blitLevel: A function that draws the level data once, as in one frame of gameplay.
+    """
+    setUpGoldUpdate(scale)
+    level = levelsByName[BENCHMARK_LEVEL]
+    playerList = [player for player in c.playerGroup]
+
+    def blitLevel():
+        blitLevelData(playerList, level, len(c.goldGroup), 500, animate)
+    return blitLevel
+
+
+def setUpScrollLevelData(scale):
+    """Prepare the level and its sprites as in setUpBlitLevelData.
+
+    Returns:
+        scrollLevel: A function that scrolls the level off-screen once. This draws 75 frames, without waiting
+            between them.
+    """
+    setUpGoldUpdate(scale)
+    level = levelsByName[BENCHMARK_LEVEL]
+    playerList = [player for player in c.playerGroup]
+
+    def scrollLevel():
+        c.displayGroup.empty()
+        scrollLevelData(playerList, level, len(c.goldGroup), 500, 1, 0)
+    return scrollLevel
+
+
+# BENCHMARKS associates the name of every benchmark with the function that prepares it.
+# Each of these functions is passed an integer scale, and returns a function to time that runs one operation.
+BENCHMARKS = {
+    "GoldSprite.update": setUpGoldUpdate,
+    "UrchinSprite.update": setUpUrchinUpdate,
+    "UrchinSprite.moveSprite": setUpUrchinMove,
+    "PlayerSprite.update moving": lambda scale: setUpPlayers(scale, c.PlayerStates.MOVING),
+    "PlayerSprite.update swinging": lambda scale: setUpPlayers(scale, c.PlayerStates.SWINGING),
+    "RubberTrapSprite.update": setUpRubberTrapUpdate,
+    "blitLevelData": setUpBlitLevelData,
+    "blitLevelData animate": lambda scale: setUpBlitLevelData(scale, True),
+    "scrollLevelData": setUpScrollLevelData,
+}
+if np is not None:
+    BENCHMARKS["GoldEngine.step"] = setUpGoldEngineStep
+
+
+def timeOperations(operation, operationCount):
+    """Get how many seconds it takes to run an operation a number of times, with garbage collection disabled.
+
+    Args:
+        operation: The function to run.
+        operationCount: An integer number of times to run it.
+
+    Returns:
+        A float number of seconds.
+    """
+    isGcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        startTime = time.perf_counter()
+        for _ in range(operationCount):
+            operation()
+        return time.perf_counter() - startTime
+    finally:
+        if isGcEnabled:
+            gc.enable()
+
+
+def runBenchmark(name, scale=1, repeats=5, minimumTime=0.2):
+    """Time and measure the memory allocated by one benchmark.
+
+    The operation is first run enough times to take at least minimumTime seconds, and then timed that many times
+    in each of several repeats. The fastest repeat is used, as the slower ones only measure interference from the
+    rest of the computer.
+    The memory allocated is measured in a separate run with tracemalloc, as tracing slows the operation down.
+
+    Args:
+        name: The string name of the benchmark in BENCHMARKS.
+        scale: An integer multiplier for how many sprites the benchmark uses.
+        repeats: An integer number of times to time the operation.
+        minimumTime: A float minimum number of seconds each repeat should take.
+
+    Returns:
+        result: A dict holding the benchmark's name and scale, the number of operations per second, the
+            microseconds per operation, the percent of one frame's time budget each operation takes, the peak
+            kilobytes allocated per operation, and the number of memory blocks still allocated after the
+            operations are run.
+    """
+    oldClock = c.CLOCK
+    c.CLOCK = UnthrottledClock()
+    try:
+        operation = BENCHMARKS[name](scale)
+        operationCount = 1
+        while timeOperations(operation, operationCount) < minimumTime and operationCount < 1000000:
+            operationCount *= 2
+        bestTime = min(timeOperations(operation, operationCount) for _ in range(repeats)) / operationCount
+
+        gc.collect()
+        tracemalloc.start()
+        operation()
+        tracemalloc.reset_peak()
+        startSize, _ = tracemalloc.get_traced_memory()
+        startSnapshot = tracemalloc.take_snapshot()
+        allocationCount = max(1, min(operationCount, 100))
+        for _ in range(allocationCount):
+            operation()
+        _, peakSize = tracemalloc.get_traced_memory()
+        endSnapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        retainedBlocks = sum(stat.count_diff for stat in endSnapshot.compare_to(startSnapshot, "filename"))
+    finally:
+        c.CLOCK = oldClock
+    return {"name": name, "scale": scale, "opsPerSecond": 1 / bestTime, "microseconds": 1e6 * bestTime,
+            "framePercent": 100 * bestTime / FRAME_BUDGET, "peakKilobytes": (peakSize - startSize) / 1024,
+            "retainedBlocks": retainedBlocks}
+
+
+def runBenchmarks(names=None, scales=(1,), repeats=5, minimumTime=0.2, callback=None):
+    """Run several benchmarks at several scales.
+
+    Args:
+        names: A list of the string names of the benchmarks to run. Defaults to None, meaning every benchmark.
+        scales: A list of the integer scales to run each benchmark at.
+        repeats: An integer number of times to time each operation.
+        minimumTime: A float minimum number of seconds each repeat should take.
+        callback: A function that is passed each result as soon as it is finished. Defaults to None.
+
+    Returns:
+        results: A list of result dicts from runBenchmark.
+    """
+    results = []
+    for name in names or BENCHMARKS:
+        for scale in scales:
+            results.append(runBenchmark(name, scale, repeats, minimumTime))
+            if callback is not None:
+                callback(results[-1])
+    return results
+
+
+def saveBaseline(results, filePath):
+    """Write benchmark results to a JSON file, to compare later results against.
+
+    Args:
+        results: A list of result dicts from runBenchmark.
+        filePath: The string path of the file to write.
+    """
+    folder = os.path.dirname(filePath)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(filePath, "w") as baselineFile:
+        json.dump(results, baselineFile, indent=1)
+
+
+def compareToBaseline(results, filePath, tolerance=0.1):
+    """Compare benchmark results against a baseline written by saveBaseline.
+
+    Args:
+        results: A list of result dicts from runBenchmark.
+        filePath: The string path of the baseline file.
+        tolerance: A float fraction that a benchmark can be slower than its baseline before it counts as a
+            regression.
+
+    Returns:
+        comparisons: A list with one dict for each result that has a baseline, holding its name and scale, the
+            ratio of its time to the baseline's time, and whether it is a regression.
+    """
+    with open(filePath, "r") as baselineFile:
+        baselineResults = {(result["name"], result["scale"]): result for result in json.load(baselineFile)}
+    comparisons = []
+    for result in results:
+        baselineResult = baselineResults.get((result["name"], result["scale"]))
+        if baselineResult is not None:
+            ratio = result["microseconds"] / baselineResult["microseconds"]
+            comparisons.append({"name": result["name"], "scale": result["scale"], "ratio": ratio,
+                                "isRegression": ratio > 1 + tolerance})
+    return comparisons
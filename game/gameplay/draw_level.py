@@ -1,12 +1,15 @@
 import pygame as pg
+import weakref
 
 from game.gameplay.level import BonusLevel
-from game.gameplay.score_level import scoreLevel, checkIfScoresBonusPoints, compareHighScore
+from game.gameplay.score_level import scoreLevel, checkLevelEndBonuses, compareHighScore
 from game.gameplay.state import checkPauseGameWithInput, checkQuitGame
 from game.sprites.gold import GoldSprite
 from game.sprites.display import DisplayIconSprite, FullDisplaySprite, HalfDisplaySprite
 from game.tools.asset_cache import playSound
+from game.tools.event_bus import eventBus
 import game.tools.constants as c
+from game.tools.text_cache import renderText
 
 
 playerFontColors = [c.HOT_PINK, c.GREEN, c.BLUE, c.YELLOW]
@@ -25,43 +28,18 @@ def blitLevelData(playerList, level, goldCount, time, animate=False):
         goldCount: An integer representing how many gold sprites are currently unrevealed (either invisible or
             face-down).
         time: An integer representing the time the players have remaining to complete the level.
-        animate: A boolean indicating if this function should update the gold and black hole sprites, causing
-            them to be animated.
+        animate: A boolean indicating if this function should update the gold sprites and animate the black hole
+            sprites.
             This is only to be set to True when the level is completed or all players have run out of lives, as
             the main playLevel function automatically updates all sprites on its own in all other cases.
     """
-    playerLivesData = []
-    for num, player in enumerate(playerList):
-        playerLivesData.append([c.FONT.render("<", False, playerFontColors[num]),
-                                c.FONT.render("{}".format(min(player.lives, 9)), False, c.WHITE),
-                                c.FONT.render(">", False, playerFontColors[num])])
-    timeText = c.FONT.render("TIME,{:03d}".format(time), False, c.WHITE)
-
-    # The location of where the players' lives are shown depends on the number of players.
-    # If there are one or two players, player one's lives are displayed on the left and player two's on the right
-    # If there are three or four players, player one's lives are displayed on the far left, player two's on the
-    # mid-left, player three's on the mid-right, and player four's on the far right.
-    if len(playerList) < 3:
-        livesDataCoordinates = [(42, 16), (428, 16)]
-    else:
-        livesDataCoordinates = [(5, 16), (62, 16), (408, 16), (467, 16)]
-
     c.SCREEN.blit(level.image, (0, 0))
-
-    # Bonus levels blit the time count in a different location, and blit the word 'BONUS!' instead of the gold
-    # count (Also in a different location from the standard gold count location).
-    if isinstance(level, BonusLevel):
-        bonusWordText = c.FONT.render("BONUS!", False, c.WHITE)
-        c.SCREEN.blit(bonusWordText, (210, 210))
-        c.SCREEN.blit(timeText, (192, 242))
-    else:
-        goldText = c.FONT.render("LAST,{:02d}".format(goldCount), False, c.WHITE)
-        c.SCREEN.blit(goldText, (132, 16))
-        c.SCREEN.blit(timeText, (262, 16))
+    for _, text, coords in getLevelTextBlits(level, goldCount, time):
+        c.SCREEN.blit(text, coords)
     if animate:
         GoldSprite.globalFrameCount += 1
         for hole in c.blackHoleGroup:
-            hole.update()
+            hole.animate()
         for gold in c.goldGroup:
             gold.update()
             c.SCREEN.blit(gold.image, gold.coordinates)
@@ -72,13 +50,310 @@ def blitLevelData(playerList, level, goldCount, time, animate=False):
         c.SCREEN.blit(hole.image, hole.coordinates)
     for trap in c.rubberGroup:
         c.SCREEN.blit(trap.image, trap.coordinates)
+    for _, text, coords in getLivesTextBlits(playerList):
+        c.SCREEN.blit(text, coords)
+
+
+def getLevelTextBlits(level, goldCount, time):
+    """Get the time remaining and gold remaining text to be drawn over the level image.
+
+    Bonus levels show the time count in a different location, and show the word 'BONUS!' instead of the gold
+    count (Also in a different location from the standard gold count location).
+
+    Args:
+        level: A Level object representing the current level being played.
+        goldCount: An integer representing how many gold sprites are currently unrevealed (either invisible or
+            face-down).
+        time: An integer representing the time the players have remaining to complete the level.
+
+    Returns:
+        textBlits: A list of (string, Surface, coordinates) tuples, in the order they should be drawn.
+            The string is the rendered text, which only changes when the Surface object's contents change.
+    """
+    timeString = "TIME,{:03d}".format(time)
+    timeText = renderText(timeString)
+    if isinstance(level, BonusLevel):
+        bonusWordText = renderText("BONUS!")
+        return [("BONUS!", bonusWordText, (210, 210)), (timeString, timeText, (192, 242))]
+    goldString = "LAST,{:02d}".format(goldCount)
+    goldText = renderText(goldString)
+    return [(goldString, goldText, (132, 16)), (timeString, timeText, (262, 16))]
+
+
+def getLivesTextBlits(playerList):
+    """Get the players' lives text to be drawn over the level image.
+
+    The location of where the players' lives are shown depends on the number of players.
+    If there are one or two players, player one's lives are displayed on the left and player two's on the right
+    If there are three or four players, player one's lives are displayed on the far left, player two's on the
+    mid-left, player three's on the mid-right, and player four's on the far right.
+    Because the < > symbols should be slightly closer to the number of lives than the standard text width would
+    allow, the life count is placed 13 pixels after the <, and the > is placed 15 frames after the life count.
+
+    Args:
+        playerList: A list of all PlayerSprite objects in the game.
+
+    Returns:
+        textBlits: A list of (string, Surface, coordinates) tuples, in the order they should be drawn.
+            The string is the rendered text, which only changes when the Surface object's contents change.
+    """
+    if len(playerList) < 3:
+        livesDataCoordinates = [(42, 16), (428, 16)]
+    else:
+        livesDataCoordinates = [(5, 16), (62, 16), (408, 16), (467, 16)]
+    textBlits = []
+    for num, (player, coords) in enumerate(zip(playerList, livesDataCoordinates)):
+        livesString = "{}".format(min(player.lives, 9))
+        textBlits.append(("<{}".format(num), renderText("<", playerFontColors[num]), coords))
+        coords = (coords[0] + 13, coords[1])
+        textBlits.append((livesString, renderText(livesString), coords))
+        coords = (coords[0] + 15, coords[1])
+        textBlits.append((">{}".format(num), renderText(">", playerFontColors[num]), coords))
+    return textBlits
+
+
+class DirtyRectRenderer:
+    """Draw the level and its sprites during gameplay, only redrawing the regions of the screen that change.
+
+    Every frame, everything that would be drawn to the screen is recorded in order instead of being drawn.
+    Once the frame is finished, the recorded draws are compared with those of the previous frame. Only the
+    regions covered by draws that appeared, disappeared, moved, or changed image are redrawn, and only those
+    regions are passed to pg.display.update.
+    Within each of those regions, the level image and every recorded draw overlapping it are redrawn in order, so
+    the screen ends up exactly as it would if the whole frame were redrawn.
+
+    Gold sprites that are face-down or invisible and rubber trap sprites that have not been revealed do not change
+    their image until a GOLD_STATE_CHANGED or TRAP_REVEALED event is published for them. Instead of being recorded
+    every frame, these idle sprites are drawn once onto staticLayer, a Surface the size of the screen that is
+    recorded in their place. staticLayer is transparent wherever it is filled with its MAGENTA color key, which is
+    faster to draw than per-pixel alpha. When an event is published for one of them, it is erased from staticLayer
+    the next time it is drawn, and is recorded separately until it is idle again.
+
+    If isDirtyMode is False, everything is drawn directly to the screen and the whole display is updated every
+    frame instead.
+
+    Class variables:
+        staticGoldStates: A tuple of the OtherStates Enum instances in which a gold sprite's image does not change.
+        liveRenderers: A WeakSet of every renderer in dirty mode, which gold and trap events are passed to.
+
+    Attributes:
+        isDirtyMode: A boolean indicating if only the changed regions of the screen should be redrawn.
+    """
 
-    # Because the < > symbols should be slightly closer to the number of lives than the standard text width would
-    # allow, the life count is placed 13 pixels after the <, and the > is placed 15 frames after the life count.
-    for fontData, coords in zip(playerLivesData, livesDataCoordinates):
-        for num, text in enumerate(fontData):
-            c.SCREEN.blit(text, coords)
-            coords = (coords[0] + 13, coords[1]) if num == 0 else (coords[0] + 15, coords[1])
+    staticGoldStates = (c.OtherStates.UPSIDE_DOWN, c.OtherStates.OFF_SCREEN)
+    liveRenderers = weakref.WeakSet()
+
+    def __init__(self, isDirtyMode=None):
+        """Init DirtyRectRenderer using the boolean isDirtyMode.
+
+        If isDirtyMode is None, the DIRTY_RECT_RENDERING constant is used instead.
+
+        Instance variables:
+            level: The Level object whose image was drawn in the current frame.
+            background: The Surface object the level image was drawn with in the previous frame.
+                If the level's image changes (Such as from an ItemClock sprite), the whole screen is redrawn.
+            currentBlits: A list of (key, token, Surface, rect) tuples recorded in the current frame.
+                The key identifies what is being drawn, and the token changes whenever its appearance does.
+            previousBlits: A dict associating each key drawn in the previous frame with its (token, Surface,
+                rect) tuple.
+            isDrawingFrame: A boolean indicating if startFrame has been called since the display was last
+                updated.
+            isInvalidated: A boolean indicating if the whole screen must be redrawn in the next frame, such as
+                when something else has drawn to the screen.
+            staticLayer: The color-keyed Surface object that idle sprites are drawn onto, or None until the first
+                frame is started.
+            staticBlits: A dict associating each sprite drawn onto staticLayer with the (Surface, rect) tuple it
+                was drawn with, in the order they were drawn.
+            idleSprites: A set of the sprites that are idle, but have not been drawn onto staticLayer yet.
+            staleSprites: A set of the sprites on staticLayer that an event has been published for.
+            staticDirtyRects: A list of the rect objects of staticLayer that changed in the current frame.
+            isStaticLayerRecorded: A boolean indicating if staticLayer has been recorded in the current frame.
+        """
+        if isDirtyMode is None:
+            isDirtyMode = c.DIRTY_RECT_RENDERING
+        self.isDirtyMode = isDirtyMode
+        self.level = self.background = None
+        self.currentBlits = []
+        self.previousBlits = {}
+        self.isDrawingFrame = False
+        self.isInvalidated = True
+        self.staticLayer = None
+        self.staticBlits = {}
+        self.idleSprites = set()
+        self.staleSprites = set()
+        self.staticDirtyRects = []
+        self.isStaticLayerRecorded = False
+        if isDirtyMode:
+            DirtyRectRenderer.liveRenderers.add(self)
+
+    def invalidate(self):
+        """Make the next frame redraw the whole screen."""
+        self.isInvalidated = True
+
+    def resetStaticLayer(self):
+        """Clear staticLayer, and find the sprites that are idle so they can be drawn onto it.
+
+        This is called at the start of each level, and whenever the renderer is invalidated, as sprites may have
+        changed without publishing events since then (Such as when a snapshot is restored).
+        """
+        screenSize = c.SCREEN.get_size()
+        if self.staticLayer is None or self.staticLayer.get_size() != screenSize:
+            self.staticLayer = pg.Surface(screenSize)
+            self.staticLayer.set_colorkey(c.MAGENTA)
+        self.staticLayer.fill(c.MAGENTA)
+        self.staticBlits = {}
+        self.idleSprites = {gold for gold in c.goldGroup if gold.goldState in self.staticGoldStates}
+        self.idleSprites.update(trap for trap in c.rubberGroup if trap.trapState == c.OtherStates.OFF_SCREEN)
+        self.staleSprites = set()
+
+    def startFrame(self, playerList, level, goldCount, time):
+        """Begin a frame by drawing (or recording) the level data, as in blitLevelData.
+
+        Args:
+            playerList: A list of all PlayerSprite objects in the game.
+            level: A Level object representing the current level being played.
+            goldCount: An integer representing how many gold sprites are currently unrevealed.
+            time: An integer representing the time the players have remaining to complete the level.
+        """
+        self.isDrawingFrame = True
+        if not self.isDirtyMode:
+            blitLevelData(playerList, level, goldCount, time)
+            return
+        if self.isInvalidated or level is not self.level:
+            self.resetStaticLayer()
+        for sprite in [sprite for sprite in self.staleSprites if not sprite.alive()]:
+            self.eraseStaticSprite(sprite)
+        self.level = level
+        self.currentBlits = []
+        self.staticDirtyRects = []
+        self.isStaticLayerRecorded = False
+        for text, image, coords in getLevelTextBlits(level, goldCount, time):
+            self.addBlit(("text", coords), text, image, coords)
+        for hole in c.blackHoleGroup:
+            self.addBlit(("under", hole), hole.image, hole.image, hole.coordinates)
+        # Traps are drawn again with rubberGroup, so idle traps can be left out here.
+        for trap in c.rubberGroup:
+            if trap not in self.staticBlits and trap not in self.idleSprites:
+                self.addBlit(("under", trap), trap.image, trap.image, trap.coordinates)
+        for text, image, coords in getLivesTextBlits(playerList):
+            self.addBlit(("text", coords), text, image, coords)
+
+    def drawSprite(self, sprite):
+        """Draw (or record) a sprite's image at its coordinates.
+
+        Sprite coordinates are casted to integers before drawing them to the screen, as player sprites'
+        coordinates are measured in sub-pixels.
+        Idle sprites are drawn onto staticLayer instead, and staticLayer is recorded in place of the first of them
+        drawn each frame.
+
+        Args:
+            sprite: The sprite object to be drawn.
+        """
+        coords = (int(sprite.coordinates[0]), int(sprite.coordinates[1]))
+        if not self.isDirtyMode:
+            c.SCREEN.blit(sprite.image, coords)
+            return
+        if sprite in self.staleSprites:
+            self.eraseStaticSprite(sprite)
+        elif sprite in self.idleSprites:
+            self.idleSprites.remove(sprite)
+            rect = self.staticLayer.blit(sprite.image, coords)
+            self.staticBlits[sprite] = (sprite.image, pg.Rect(coords, sprite.image.get_size()))
+            self.staticDirtyRects.append(rect)
+        if sprite in self.staticBlits:
+            if not self.isStaticLayerRecorded:
+                self.addBlit("static", self.staticLayer, self.staticLayer, (0, 0))
+                self.isStaticLayerRecorded = True
+        else:
+            self.addBlit(sprite, sprite.image, sprite.image, coords)
+
+    def eraseStaticSprite(self, sprite):
+        """Erase a sprite from staticLayer, redrawing any other sprites on staticLayer that overlapped it.
+
+        Args:
+            sprite: The sprite object to be erased, which must be in staleSprites.
+        """
+        self.staleSprites.remove(sprite)
+        rect = self.staticBlits.pop(sprite)[1]
+        self.staticLayer.set_clip(rect)
+        self.staticLayer.fill(c.MAGENTA)
+        for image, staticRect in self.staticBlits.values():
+            if staticRect.colliderect(rect):
+                self.staticLayer.blit(image, staticRect)
+        self.staticLayer.set_clip(None)
+        self.staticDirtyRects.append(rect)
+
+    def markSpriteChanged(self, sprite, isIdle):
+        """Note that an event was published for a gold or trap sprite, so that staticLayer is kept up to date.
+
+        Args:
+            sprite: The GoldSprite or RubberTrapSprite object that the event was published for.
+            isIdle: A boolean indicating if the sprite's image will not change in its new state.
+        """
+        if sprite in self.staticBlits:
+            self.staleSprites.add(sprite)
+        if isIdle:
+            self.idleSprites.add(sprite)
+        else:
+            self.idleSprites.discard(sprite)
+
+    def addBlit(self, key, token, image, coords):
+        """Record a Surface object to be drawn at the passed coordinates this frame.
+
+        Args:
+            key: A hashable object identifying what is being drawn. Each key should only be recorded once per
+                frame.
+            token: An object that only compares unequal to the previous frame's token when the drawn image's
+                contents change.
+            image: The Surface object to be drawn.
+            coords: A tuple location to draw the image at.
+        """
+        self.currentBlits.append((key, token, image, pg.Rect(coords, image.get_size())))
+
+    def updateDisplay(self):
+        """Finish the current frame, drawing and updating only the changed regions of the screen.
+
+        If no frame was started (Such as while the game is paused, or during the end of a level), the whole
+        display is updated and the next frame redraws the whole screen.
+
+        Returns:
+            dirtyRects: A list of the rect objects that were updated, or None if the whole display was updated.
+        """
+        if not self.isDrawingFrame or not self.isDirtyMode:
+            pg.display.update()
+            self.isDrawingFrame = False
+            self.invalidate()
+            return None
+        self.isDrawingFrame = False
+
+        if self.isInvalidated or self.level.image is not self.background:
+            dirtyRects = [c.SCREEN.get_rect()]
+        else:
+            dirtyRects = self.staticDirtyRects
+            previousBlits = self.previousBlits
+            for key, token, image, rect in self.currentBlits:
+                previousBlit = previousBlits.pop(key, None)
+                if previousBlit is None:
+                    dirtyRects.append(rect)
+                elif previousBlit[0] != token or previousBlit[2] != rect:
+                    dirtyRects.append(rect.union(previousBlit[2]))
+            dirtyRects.extend(previousBlit[2] for previousBlit in previousBlits.values())
+            screenRect = c.SCREEN.get_rect()
+            dirtyRects = [dirtyRect.clip(screenRect) for dirtyRect in dirtyRects if screenRect.colliderect(dirtyRect)]
+
+        blitRects = [blit[3] for blit in self.currentBlits]
+        for dirtyRect in dirtyRects:
+            c.SCREEN.set_clip(dirtyRect)
+            c.SCREEN.blit(self.level.image, dirtyRect, dirtyRect)
+            for index in dirtyRect.collidelistall(blitRects):
+                c.SCREEN.blit(self.currentBlits[index][2], blitRects[index])
+        c.SCREEN.set_clip(None)
+        pg.display.update(dirtyRects)
+
+        self.previousBlits = {key: (token, image, rect) for key, token, image, rect in self.currentBlits}
+        self.background = self.level.image
+        self.isInvalidated = False
+        return dirtyRects
 
 
 def scrollLevelData(playerList, level, goldCount, time, levelCount, highScore):
@@ -106,10 +381,10 @@ def scrollLevelData(playerList, level, goldCount, time, levelCount, highScore):
     level.initialize()
 
     for num, player in enumerate(playerList):
-        playerLivesData.append([c.FONT.render("<", False, playerFontColors[num]),
-                                c.FONT.render("{}".format(min(player.lives, 9)), False, c.WHITE),
-                                c.FONT.render(">", False, playerFontColors[num])])
-    timeText = c.FONT.render("TIME,{:03d}".format(time), False, c.WHITE)
+        playerLivesData.append([renderText("<", playerFontColors[num]),
+                                renderText("{}".format(min(player.lives, 9))),
+                                renderText(">", playerFontColors[num])])
+    timeText = renderText("TIME,{:03d}".format(time))
 
     # The location of where the players' lives are shown depends on the number of players.
     # If there are one or two players, player one's lives are displayed on the left and player two's on the right
@@ -121,8 +396,8 @@ def scrollLevelData(playerList, level, goldCount, time, levelCount, highScore):
         livesDataCoordinates = [(5, 16), (62, 16), (408, 16), (467, 16)]
 
     highScore = compareHighScore(playerList, highScore)
-    highScoreText = c.FONT.render("TOP,{:06d}".format(highScore), False, c.WHITE)
-    levelText = c.FONT.render("<<<<< CLU,CLU,LAND,,{:02d} >>>>>".format(levelCount % 100), False, c.WHITE)
+    highScoreText = renderText("TOP,{:06d}".format(highScore))
+    levelText = renderText("<<<<< CLU,CLU,LAND,,{:02d} >>>>>".format(levelCount % 100))
 
     if len(playerList) < 3:
         playerTextCoordinates = [(162, 497), (162, 721)]
@@ -132,8 +407,8 @@ def scrollLevelData(playerList, level, goldCount, time, levelCount, highScore):
         scoreDataCoordinates = [(55, 524), (309, 524), (55, 748), (309, 748)]
 
     for num, player in enumerate(playerList):
-        playerTextData.append(c.FONT.render("< PLAYER {} >".format(num + 1), False, c.WHITE))
-        playerScoreData.append(c.FONT.render("{:06d}PTS.".format(player.score % 1000000), False, c.WHITE))
+        playerTextData.append(renderText("< PLAYER {} >".format(num + 1)))
+        playerScoreData.append(renderText("{:06d}PTS.".format(player.score % 1000000)))
 
         # Which displays are used in the end-of-level animation depends on the number of players.
         # If there are one or two players, the full-sized displays are used, with player one on top and player two
@@ -158,11 +433,11 @@ def scrollLevelData(playerList, level, goldCount, time, levelCount, highScore):
         # Bonus levels blit the time count in a different location, and blit the word 'BONUS!' instead of the gold
         # count (Also in a different location from the standard gold count location).
         if isinstance(level, BonusLevel):
-            bonusWordText = c.FONT.render("BONUS!", False, c.WHITE)
+            bonusWordText = renderText("BONUS!")
             c.SCREEN.blit(bonusWordText, (210, 210 - scrollCount))
             c.SCREEN.blit(timeText, (192, 242 - scrollCount))
         else:
-            goldText = c.FONT.render("LAST,{:02d}".format(goldCount), False, c.WHITE)
+            goldText = renderText("LAST,{:02d}".format(goldCount))
             c.SCREEN.blit(goldText, (132, 16 - scrollCount))
             c.SCREEN.blit(timeText, (262, 16 - scrollCount))
 
@@ -175,7 +450,7 @@ def scrollLevelData(playerList, level, goldCount, time, levelCount, highScore):
             # The gold, black hole, and text sprites still update every frame as they scroll, so they continue being
             # animated, as the main playLevel function is not called during this loop.
             for hole in c.blackHoleGroup:
-                hole.update()
+                hole.animate()
                 c.SCREEN.blit(hole.image, (hole.coordinates[0], hole.coordinates[1] - scrollCount))
         for gold in c.goldGroup:
             gold.update()
@@ -229,8 +504,8 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
     iconCountText = []
     frameCount = 0
 
-    levelText = c.FONT.render("<<<<< CLU,CLU,LAND,,{:02d} >>>>>".format(levelCount % 100), False, c.WHITE)
-    timeText = c.FONT.render("TIME,{:03d}".format(time), False, c.WHITE)
+    levelText = renderText("<<<<< CLU,CLU,LAND,,{:02d} >>>>>".format(levelCount % 100))
+    timeText = renderText("TIME,{:03d}".format(time))
 
     if len(playerList) < 3:
         playerTextCoordinates = [(162, 47), (162, 271)]
@@ -256,27 +531,17 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
     # All of the bonus font objects default to an empty string. They are only updated as a relevant string if the
     # appropriate bonus is earned.
     bonusEarnedText = bonusScoreText = bonusLevelCompletionText = bonusLevelCompletionScore =\
-        c.FONT.render("", False, c.WHITE)
+        renderText("")
 
-    # Standard bonus points cannot be scored during a bonus level in a one-player game.
-    if isinstance(level, BonusLevel) and len(playerList) == 1:
-        doesScoreBonus, bonusScoringIndex = False, 0
-    else:
-        doesScoreBonus, bonusScoringIndex = checkIfScoresBonusPoints(playerList, scoreBonus)
-
-    # The bonus completion points are only earned if the players collect all 66 gold bars on the bonus stage.
-    if isinstance(level, BonusLevel) and sum([player.goldCollectedCount for player in playerList]) == 66:
-        doesScoreBonusCompletion = True
-    else:
-        doesScoreBonusCompletion = False
+    doesScoreBonus, bonusScoringIndex, doesScoreBonusCompletion = checkLevelEndBonuses(playerList, level, scoreBonus)
 
     for num, player in enumerate(playerList):
         playerDisplayIcons.append(DisplayIconSprite(num + 1, len(playerList)))
-        playerTextData.append(c.FONT.render("< PLAYER {} >".format(num + 1), False, c.WHITE))
-        playerScoreData.append(c.FONT.render("{:06d}PTS.".format(player.score % 1000000), False, c.WHITE))
-        playerLivesData.append([c.FONT.render("<", False, c.WHITE),
-                                c.FONT.render("{}".format(min(player.lives, 9)), False, c.WHITE),
-                                c.FONT.render(">", False, c.WHITE)])
+        playerTextData.append(renderText("< PLAYER {} >".format(num + 1)))
+        playerScoreData.append(renderText("{:06d}PTS.".format(player.score % 1000000)))
+        playerLivesData.append([renderText("<"),
+                                renderText("{}".format(min(player.lives, 9))),
+                                renderText(">")])
         player.coordinates = playerSpriteCoordinates[num]
 
         # Which displays are used in the end-of-level animation depends on the number of players.
@@ -297,22 +562,21 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
         if any(player.lives > 0 for player in playerList):
             if frameCount == 32:
                 highScore, iconCount = scoreLevel(playerList, level, time, highScore, stepToScore=0)
-                timeText = c.FONT.render("TIME,000", False, c.WHITE)
+                timeText = renderText("TIME,000")
 
             # These steps are skipped during bonus levels, as there are no enemies to score.
             elif frameCount == 64 and not isinstance(level, BonusLevel):
                 for icon in playerDisplayIcons:
                     icon.setIconImage()
-                iconCountText = [c.FONT.render("+00", False, c.WHITE) for _ in playerList]
+                iconCountText = [renderText("+00") for _ in playerList]
             elif frameCount == 96 and not isinstance(level, BonusLevel):
                 highScore, iconCount = scoreLevel(playerList, level, time, highScore, stepToScore=1)
                 iconCountText = []
                 for num, player in enumerate(playerList):
-                    iconCountText.append(c.FONT.render("+{:02d}".format(iconCount[num] % 100), False,
-                                                       c.WHITE))
+                    iconCountText.append(renderText("+{:02d}".format(iconCount[num] % 100)))
 
             elif frameCount == 128:
-                iconCountText = [c.FONT.render("+00", False, c.WHITE) for _ in playerList]
+                iconCountText = [renderText("+00") for _ in playerList]
                 for icon in playerDisplayIcons:
                     icon.setIconImage()
 
@@ -324,8 +588,7 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
                 highScore, iconCount = scoreLevel(playerList, level, time, highScore, stepToScore=2)
                 iconCountText = []
                 for player in playerList:
-                    iconCountText.append(c.FONT.render("+{:02d}".format(player.goldCollectedCount % 100), False,
-                                                       c.WHITE))
+                    iconCountText.append(renderText("+{:02d}".format(player.goldCollectedCount % 100)))
 
             elif frameCount == 188:
                 for player in playerList:
@@ -335,8 +598,8 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
                     if playerList[bonusScoringIndex].score > highScore:
                         highScore = playerList[bonusScoringIndex].score
                     playSound("earn_bonus.wav")
-                    bonusEarnedText = c.FONT.render("BONUS", False, c.WHITE)
-                    bonusScoreText = c.FONT.render("2000!", False, c.WHITE)
+                    bonusEarnedText = renderText("BONUS")
+                    bonusScoreText = renderText("2000!")
                 if doesScoreBonusCompletion:
                     for player in playerList:
                         if player.lives > 0:
@@ -347,8 +610,8 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
                     # True).
                     if not doesScoreBonus:
                         playSound("earn_bonus.wav")
-                    bonusLevelCompletionText = c.FONT.render("PERFECT", False, c.WHITE)
-                    bonusLevelCompletionScore = c.FONT.render("3000!", False, c.WHITE)
+                    bonusLevelCompletionText = renderText("PERFECT")
+                    bonusLevelCompletionScore = renderText("3000!")
         if frameCount == 442:
             return
 
@@ -357,9 +620,9 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
         # Every frame, update the text displaying the players' scores and the high score, in case these values have
         # changed since the previous frame.
         for player in playerList:
-            scoreText.append(c.FONT.render("{:06d}PTS.".format(player.score % 1000000), False, c.WHITE))
+            scoreText.append(renderText("{:06d}PTS.".format(player.score % 1000000)))
         highScore = compareHighScore(playerList, highScore)
-        highScoreText = c.FONT.render("TOP,{:06d}".format(highScore), False, c.WHITE)
+        highScoreText = renderText("TOP,{:06d}".format(highScore))
 
         c.SCREEN.fill(level.backgroundColor)
         checkQuitGame()
@@ -409,3 +672,30 @@ def blitLevelEndData(playerList, level, time, levelCount, highScore, scoreBonus)
 
         pg.display.update()
         c.CLOCK.tick(c.FPS)
+
+
+def markGoldChanged(gold, oldState, newState):
+    """Pass a GOLD_STATE_CHANGED event on to every DirtyRectRenderer, so they can update their staticLayer.
+
+    Args:
+        gold: The GoldSprite object whose state changed.
+        oldState: The OtherStates Enum instance of the sprite's old state, or None.
+        newState: The OtherStates Enum instance of the sprite's new state, or None.
+    """
+    for renderer in DirtyRectRenderer.liveRenderers:
+        renderer.markSpriteChanged(gold, newState in DirtyRectRenderer.staticGoldStates)
+
+
+def markTrapChanged(trap, player):
+    """Pass a TRAP_REVEALED event on to every DirtyRectRenderer, so they can update their staticLayer.
+
+    Args:
+        trap: The RubberTrapSprite object that was revealed.
+        player: The PlayerSprite object that revealed it.
+    """
+    for renderer in DirtyRectRenderer.liveRenderers:
+        renderer.markSpriteChanged(trap, False)
+
+
+eventBus.subscribe(c.GameEvents.GOLD_STATE_CHANGED, markGoldChanged)
+eventBus.subscribe(c.GameEvents.TRAP_REVEALED, markTrapChanged)
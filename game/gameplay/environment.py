@@ -0,0 +1,230 @@
+from game.gameplay.level import getLevelOrder
+from game.gameplay.simulation import LevelSimulation, startSimulatedGame
+from game.gameplay.player_actions import DIRECTION_CONTROLS
+from game.gameplay.snapshot import GameSnapshot
+import game.tools.constants as c
+
+
+# ACTIONS lists the actions each player can take in a frame of a GameEnvironment, in order of their index.
+# "none" releases every control, each direction presses and holds that direction, and "shoot" fires a sonic wave
+# without holding any direction. Each direction followed by "+shoot" holds that direction while firing a sonic wave, as
+# a player can do in the middle of a swing.
+# actionControls holds the direction each action holds, or None, and whether it shoots, for each action in ACTIONS.
+ACTIONS = ("none",) + DIRECTION_CONTROLS + ("shoot",) + tuple(direction + "+shoot" for direction in DIRECTION_CONTROLS)
+actionControls = tuple((action.split("+")[0] if action.split("+")[0] in DIRECTION_CONTROLS else None,
+                        action.endswith("shoot")) for action in ACTIONS)
+
+
+class GameEnvironment:
+    """Play full games one frame at a time, in the style of a reinforcement learning environment.
+
+    reset starts a new game, and each call to step runs exactly one frame of gameplay logic with a LevelSimulation,
+    taking one action for each player instead of reading keyboard events. When a level ends, the next level of the
+    game begins during the same step, as in simulateGame. Nothing is drawn, no music is played and the clock is
+    never waited on, so the game runs as fast as the CPU allows. The game must be running in headless mode (See
+    HEADLESS in constants.py), so that there is no display window or audio.
+
+    Each action is an index into ACTIONS. A direction is pressed on the first frame it is chosen, and held on the
+    frames after that, as a player holding down a direction key would. Changing between a direction and the same
+    direction with "+shoot" keeps holding it, without pressing it again. It is also pressed again every frame the
+    player is in the BALL state, as a held direction does nothing until it is pressed.
+    getSnapshot and restoreSnapshot store and return to the complete state of a game, so a game can be rewound, or
+    played forward from the same frame many times by a search.
+
+    Attributes:
+        numberOfPlayers: An integer showing how many players play each game.
+        maxFrames: An integer limit on how many frames each game can run for, or None if there is no limit.
+        pixelObserver: A PixelObserver object that render draws each frame with, or None if the game is never
+            drawn.
+        simulation: The LevelSimulation object of the current level, or None before reset is first called.
+    """
+
+    def __init__(self, numberOfPlayers=1, maxFrames=None, pixelObserver=None):
+        """Init GameEnvironment using the integers numberOfPlayers and maxFrames, and the PixelObserver object
+        pixelObserver.
+
+        Instance variables:
+            levelOrder: A list of Level objects in the order they are played this game.
+            levelIndex: An integer index of the current level in levelOrder.
+            previousActions: A list of the index of the action each player took in the previous frame.
+            scores: A list of each player's score after the previous frame.
+            frameCount: An integer count of how many frames have been run this game.
+            isDone: A boolean indicating if the game has ended.
+
+        Raises:
+            RuntimeError: If the game is not running in headless mode.
+        """
+        if not c.HEADLESS:
+            raise RuntimeError("GameEnvironment requires headless mode. Set the CLU_HEADLESS environment variable to 1 "
+                               "before the game is imported.")
+        self.numberOfPlayers = numberOfPlayers
+        self.maxFrames = maxFrames
+        self.pixelObserver = pixelObserver
+        self.simulation = None
+        self.levelOrder = []
+        self.levelIndex = 0
+        self.previousActions = [0] * numberOfPlayers
+        self.scores = [0] * numberOfPlayers
+        self.frameCount = 0
+        self.isDone = True
+
+    def reset(self, seed=None):
+        """Start a new game, in the same way as startGame.
+
+        Args:
+            seed: An integer to seed gameRandom with. Defaults to None, meaning that a new seed is chosen at random.
+
+        Returns:
+            observation: A dict describing the first frame of the game, as returned by getObservation.
+        """
+        playerList, playerArmList, gameOverTextStates = startSimulatedGame(self.numberOfPlayers, seed)
+        self.levelOrder = getLevelOrder()
+        self.levelIndex = 0
+        self.simulation = LevelSimulation(playerList, playerArmList, self.levelOrder[0], 1, gameOverTextStates)
+        self.previousActions = [0] * self.numberOfPlayers
+        self.scores = [0] * self.numberOfPlayers
+        self.frameCount = 0
+        self.isDone = False
+        return self.getObservation()
+
+    def step(self, actions):
+        """Run one frame of the game, with each player taking the passed action.
+
+        Args:
+            actions: A list with the integer index in ACTIONS of each player's action.
+
+        Returns:
+            observation: A dict describing the game after the frame, as returned by getObservation.
+            rewards: A list of how many points each player scored during the frame.
+            isDone: A boolean indicating if the game has ended, either because every player has run out of lives
+                or because maxFrames frames have been run.
+            info: A dict holding the current levelCount, and whether the frame ended a level and cleared it.
+
+        Raises:
+            RuntimeError: If the game has already ended, and reset has not been called since.
+        """
+        rewards, isDone, info = self.runFrame(actions)
+        return self.getObservation(), rewards, isDone, info
+
+    def runFrame(self, actions):
+        """Run one frame of the game as step does, without describing the game afterwards.
+
+        Args:
+            actions: A list with the integer index in ACTIONS of each player's action.
+
+        Returns:
+            rewards: A list of how many points each player scored during the frame.
+            isDone: A boolean indicating if the game has ended.
+            info: A dict holding the current levelCount, and whether the frame ended a level and cleared it.
+
+        Raises:
+            RuntimeError: If the game has already ended, and reset has not been called since.
+        """
+        if self.isDone:
+            raise RuntimeError("GameEnvironment.step was called after the game ended. Call reset to start a new game.")
+        simulation = self.simulation
+        simulation.step(self.getPlayerInputs(actions))
+        self.frameCount += 1
+        info = {"levelCount": simulation.levelCount, "levelFinished": simulation.isFinished,
+                "levelCleared": simulation.isCleared}
+        if simulation.isFinished:
+            self.startNextLevel()
+
+        playerList = self.simulation.playerList
+        rewards = [player.score - score for player, score in zip(playerList, self.scores)]
+        self.scores = [player.score for player in playerList]
+        self.isDone = all(player.playerState == c.PlayerStates.DEAD for player in playerList) or\
+            (self.maxFrames is not None and self.frameCount >= self.maxFrames)
+        return rewards, self.isDone, info
+
+    def getPlayerInputs(self, actions):
+        """Turn each player's action into the controls they press and hold this frame.
+
+        Args:
+            actions: A list with the integer index in ACTIONS of each player's action.
+
+        Returns:
+            playerInputs: A list with one (pressedControls, heldControls) tuple for each player, as used by
+                applyPlayerInputs.
+        """
+        playerInputs = []
+        for num, (player, action) in enumerate(zip(self.simulation.playerList, actions)):
+            direction, isShooting = actionControls[action]
+            pressedControls = []
+            heldControls = []
+            if direction is not None:
+                if direction != actionControls[self.previousActions[num]][0] or\
+                        player.playerState == c.PlayerStates.BALL:
+                    pressedControls.append(direction)
+                heldControls.append(direction)
+            if isShooting:
+                pressedControls.append("shoot")
+            playerInputs.append((pressedControls, heldControls))
+            self.previousActions[num] = action
+        return playerInputs
+
+    def startNextLevel(self):
+        """Begin the next level of the game, as simulateGame does, unless every player has run out of lives."""
+        simulation = self.simulation
+        if all(player.playerState == c.PlayerStates.DEAD for player in simulation.playerList):
+            return
+        self.levelIndex += 1
+        if self.levelIndex == len(self.levelOrder):
+            self.levelIndex = 1
+        self.simulation = LevelSimulation(simulation.playerList, simulation.playerArmList,
+                                          self.levelOrder[self.levelIndex], simulation.levelCount + 1,
+                                          simulation.gameOverTextStates, simulation.highScore)
+
+    def getSnapshot(self):
+        """Store the complete state of the game, so it can be returned to with restoreSnapshot.
+
+        Returns:
+            A GameSnapshot object of the current frame, holding the state of this GameEnvironment as its extraState.
+        """
+        return GameSnapshot(self.simulation, (tuple(self.levelOrder), self.levelIndex, tuple(self.previousActions),
+                                              tuple(self.scores), self.frameCount, self.isDone))
+
+    def restoreSnapshot(self, snapshot):
+        """Return the game to the frame a snapshot was taken at, so that it continues exactly as it did from there.
+
+        Args:
+            snapshot: A GameSnapshot object returned by getSnapshot, taken in the world that is now active.
+        """
+        self.simulation = snapshot.restore()
+        levelOrder, self.levelIndex, previousActions, scores, self.frameCount, self.isDone = snapshot.extraState
+        self.levelOrder = list(levelOrder)
+        self.previousActions = list(previousActions)
+        self.scores = list(scores)
+        if self.pixelObserver is not None:
+            self.pixelObserver.renderer.invalidate()
+
+    def render(self, out=None):
+        """Draw the current frame of the game with pixelObserver, and get it as a pixel observation.
+
+        Args:
+            out: A NumPy array to write the observation to, as passed to PixelObserver.observe. Defaults to None.
+
+        Returns:
+            The NumPy array of the observation, as returned by PixelObserver.observe.
+        """
+        self.pixelObserver.draw(self.simulation)
+        return self.pixelObserver.observe(out)
+
+    def getObservation(self):
+        """Describe the current state of the game.
+
+        Returns:
+            observation: A dict holding the levelCount, timeCount and goldCount of the current level, and lists
+                describing each player, enemy and gold sprite. Players are described by their coordinates, state,
+                facing direction, lives and score, enemies by their coordinates and state, and gold sprites by
+                their coordinates and state. States and directions are given by the names of their Enum instances.
+        """
+        simulation = self.simulation
+        return {"levelCount": simulation.levelCount, "timeCount": simulation.timeCount,
+                "goldCount": simulation.goldCount,
+                "players": [{"coordinates": player.coordinates, "state": player.playerState.name,
+                             "facing": player.facingDirection.name, "lives": player.lives, "score": player.score}
+                            for player in simulation.playerList],
+                "enemies": [{"coordinates": enemy.coordinates, "state": enemy.enemyState.name}
+                            for enemy in c.enemyGroup],
+                "gold": [{"coordinates": gold.coordinates, "state": gold.goldState.name} for gold in c.goldGroup]}
@@ -0,0 +1,84 @@
+import game.tools.constants as c
+from game.tools.event_bus import eventBus
+
+
+# Every state a gold sprite can be in falls in one of three groups. Hidden gold has never been revealed, face up gold
+# is showing its gold side, and upside down gold has been flipped back over. Both hidden and upside down gold count
+# towards the gold remaining in a level.
+hiddenStates = frozenset([c.OtherStates.OFF_SCREEN])
+faceUpStates = frozenset([c.OtherStates.REVEALED, c.OtherStates.FLIPPING_UP, c.OtherStates.DELAYED_UP])
+upsideDownStates = frozenset([c.OtherStates.UPSIDE_DOWN, c.OtherStates.FLIPPING_DOWN, c.OtherStates.DELAYED_DOWN])
+
+
+class GoldCounters:
+    """Keep live counts of the gold sprites in each group of states, and of the gold each player has collected.
+
+    The counts are changed by the GOLD_STATE_CHANGED and GOLD_COLLECTED events the gold sprites publish to the
+    eventBus whenever one is created, killed, changes its goldState, or is collected, so the gold sprites never have
+    to be counted again.
+
+    Attributes:
+        hiddenCount: An integer count of the gold sprites that are in one of the hiddenStates.
+        faceUpCount: An integer count of the gold sprites that are in one of the faceUpStates.
+        upsideDownCount: An integer count of the gold sprites that are in one of the upsideDownStates.
+        collectedCounts: A dict associating each playerNumber with how many gold sprites that player has collected
+            this level.
+    """
+
+    def __init__(self):
+        """Init GoldCounters."""
+        self.hiddenCount = self.faceUpCount = self.upsideDownCount = 0
+        self.collectedCounts = {}
+
+    @property
+    def remainingCount(self):
+        """The integer count of the gold sprites that have not yet been revealed."""
+        return self.hiddenCount + self.upsideDownCount
+
+    @property
+    def collectedCount(self):
+        """The integer count of the gold sprites collected by every player this level."""
+        return sum(self.collectedCounts.values())
+
+    def changeCount(self, goldState, change):
+        """Add to the count of the group of states a goldState is in.
+
+        Args:
+            goldState: An OtherStates Enum instance, or None for no state.
+            change: The integer to add to the count.
+        """
+        if goldState in hiddenStates:
+            self.hiddenCount += change
+        elif goldState in faceUpStates:
+            self.faceUpCount += change
+        elif goldState in upsideDownStates:
+            self.upsideDownCount += change
+
+    def goldStateChanged(self, gold, oldState, newState):
+        """Move a gold sprite from the count of its old state to the count of its new state.
+
+        Args:
+            gold: The GoldSprite object whose state changed.
+            oldState: The OtherStates Enum instance of the sprite's old state, or None if it was just created.
+            newState: The OtherStates Enum instance of the sprite's new state, or None if it was just killed.
+        """
+        self.changeCount(oldState, -1)
+        self.changeCount(newState, 1)
+
+    def goldCollected(self, gold, player):
+        """Count a gold sprite collected by a player.
+
+        Args:
+            gold: The GoldSprite object that was collected.
+            player: The PlayerSprite object that collected it.
+        """
+        self.collectedCounts[player.playerNumber] = self.collectedCounts.get(player.playerNumber, 0) + 1
+
+    def resetCollectedCounts(self):
+        """Reset the gold collected by each player, as a new level begins."""
+        self.collectedCounts = {}
+
+
+goldCounters = GoldCounters()
+eventBus.subscribe(c.GameEvents.GOLD_STATE_CHANGED, goldCounters.goldStateChanged)
+eventBus.subscribe(c.GameEvents.GOLD_COLLECTED, goldCounters.goldCollected)
@@ -0,0 +1,188 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from game.sprites.gold import GoldSprite
+import game.tools.constants as c
+from game.tools.transform_cache import getFlippedImage, getRotatedImage
+
+
+# goldStateList includes every state a gold sprite can be in. The engine stores each sprite's state as its index in
+# goldStateList, and any other state as -1, which the engine never changes.
+goldStateList = (c.OtherStates.REVEALED, c.OtherStates.UPSIDE_DOWN, c.OtherStates.FLIPPING_UP,
+                 c.OtherStates.FLIPPING_DOWN, c.OtherStates.OFF_SCREEN, c.OtherStates.DELAYED_UP,
+                 c.OtherStates.DELAYED_DOWN)
+stateCodes = {state: code for code, state in enumerate(goldStateList)}
+REVEALED, UPSIDE_DOWN, FLIPPING_UP, FLIPPING_DOWN, OFF_SCREEN, DELAYED_UP, DELAYED_DOWN = range(len(goldStateList))
+
+# Each sprite's image is stored as an index into its image table, made by getImageTable. Indices 0 through 7 are its
+# animation frames.
+FLASH_INDEX = 8
+EMPTY_INDEX = 9
+
+
+def getDirectionStep(passingDirection):
+    """Get which way a gold sprite cycles through its animation frames while it flips.
+
+    Args:
+        passingDirection: A Directions Enum instance of the direction the player was facing upon passing the sprite.
+
+    Returns:
+        -1 if passingDirection is up or left, or 1 otherwise.
+    """
+    if passingDirection in [c.Directions.UP, c.Directions.LEFT]:
+        return -1
+    return 1
+
+
+def getImageTable(gold):
+    """Get every image a gold sprite can show, already rotated and flipped as its rotateImage method would.
+
+    Args:
+        gold: The GoldSprite object to get the images of.
+
+    Returns:
+        imageTable: A tuple of the sprite's 8 animation frames, its flash image, and its empty image.
+    """
+    imageTable = gold.animationFrames + (gold.flashImage, gold.emptyImage)
+    if gold.isHorizontal:
+        imageTable = tuple(getFlippedImage(getRotatedImage(image, 270), True, False) for image in imageTable)
+    for image in imageTable:
+        image.set_colorkey(c.BLACK)
+    return imageTable
+
+
+class GoldEngine:
+    """Update every gold sprite of a level at once, storing their states as NumPy arrays.
+
+    Each call to step changes every sprite's state, frameCount and animationCount in the same way calling each of
+    their update methods would, using a few array operations instead of a method call for each sprite. Each
+    sprite's image is then only set if it has changed, along with its goldState when it finishes flipping or
+    waiting. Any PointsSprites are created in the same order as they would be by the sprites' update methods.
+    While the engine is running, its arrays are the source of each sprite's frameCount and animationCount. The
+    sprites' own frameCount and animationCount are only set again when the engine stops.
+    The engine is only used when GOLD_ENGINE is True and NumPy is installed (See constants.py). Its results are the
+    same as updating each gold sprite, so replays play back the same with or without it.
+
+    Attributes:
+        sprites: A list of every gold sprite the engine updates, in the same order as goldGroup.
+    """
+
+    def __init__(self, sprites):
+        """Init GoldEngine using the list of GoldSprite objects sprites.
+
+        Instance variables:
+            indices: A dict associating each gold sprite with its index in sprites and in each array.
+            states: An array of each sprite's goldState, stored as its index in goldStateList.
+            frameCounts: An array of each sprite's frameCount.
+            animationCounts: An array of each sprite's animationCount.
+            directionSteps: An array of each sprite's direction step, as returned by getDirectionStep.
+            alreadyRevealed: A boolean array of whether each sprite has already been revealed.
+            imageIndices: An array of the index of each sprite's current image in its image table, or -1 if it
+                has not been set by the engine yet.
+            imageTables: A list of each sprite's image table, as returned by getImageTable.
+        """
+        self.sprites = list(sprites)
+        self.indices = {gold: num for num, gold in enumerate(self.sprites)}
+        self.states = np.array([stateCodes.get(gold.goldState, -1) for gold in self.sprites], dtype=np.int8)
+        self.frameCounts = np.array([gold.frameCount for gold in self.sprites], dtype=np.int32)
+        self.animationCounts = np.array([gold.animationCount for gold in self.sprites], dtype=np.int8)
+        self.directionSteps = np.array([getDirectionStep(gold.passingDirection) for gold in self.sprites],
+                                       dtype=np.int8)
+        self.alreadyRevealed = np.array([gold.alreadyRevealed for gold in self.sprites], dtype=bool)
+        self.imageIndices = np.full(len(self.sprites), -1, dtype=np.int8)
+        self.imageTables = [getImageTable(gold) for gold in self.sprites]
+
+    def setState(self, gold):
+        """Copy a sprite's goldState into the engine, after it has been changed outside of the engine.
+
+        Args:
+            gold: The GoldSprite object whose goldState has changed.
+        """
+        self.states[self.indices[gold]] = stateCodes.get(gold.goldState, -1)
+
+    def loadSprite(self, gold):
+        """Copy a sprite's goldState, frameCount, passingDirection and alreadyRevealed into the engine, after a
+        player has passed over it.
+
+        Args:
+            gold: The GoldSprite object that was passed over.
+        """
+        num = self.indices[gold]
+        self.states[num] = stateCodes.get(gold.goldState, -1)
+        self.frameCounts[num] = gold.frameCount
+        self.directionSteps[num] = getDirectionStep(gold.passingDirection)
+        self.alreadyRevealed[num] = gold.alreadyRevealed
+
+    def step(self):
+        """Update every gold sprite once, as calling each of their update methods would."""
+        if not self.sprites:
+            return
+        states, frameCounts, animationCounts = self.states, self.frameCounts, self.animationCounts
+        frameCounts += 1
+
+        # Every mask is taken before any state changes, as each sprite's update method only acts on the state it
+        # had when it was called.
+        isFlippingUp = states == FLIPPING_UP
+        isFlipping = isFlippingUp | (states == FLIPPING_DOWN)
+        isDelayedUp = states == DELAYED_UP
+        isDelayedDown = states == DELAYED_DOWN
+        isFacingUp = (states == REVEALED) | isDelayedUp
+        isFacingDown = (states == UPSIDE_DOWN) | isDelayedDown
+
+        imageIndices = self.imageIndices.copy()
+        imageIndices[isFacingUp] = 3 if GoldSprite.globalFrameCount % 12 < 6 else FLASH_INDEX
+        animationCounts[isFacingUp] = 3
+        imageIndices[isFacingDown] = 7
+        animationCounts[states == UPSIDE_DOWN] = 7
+        imageIndices[states == OFF_SCREEN] = EMPTY_INDEX
+
+        # Flipping sprites move one animation frame every 3 frames, wrapping around from 7 to 0 or from 0 to 7.
+        isTurning = isFlipping & (frameCounts % 3 == 0)
+        animationCounts[isTurning] = (animationCounts[isTurning] + self.directionSteps[isTurning]) % 8
+        imageIndices[isFlipping] = animationCounts[isFlipping]
+
+        isDoneFlipping = isFlipping & (frameCounts % 36 == 0)
+        isDoneWaiting = (isDelayedUp | isDelayedDown) & (frameCounts % 10 == 0)
+        states[isDoneFlipping & isFlippingUp] = DELAYED_UP
+        states[isDoneFlipping & ~isFlippingUp] = DELAYED_DOWN
+        states[isDoneWaiting & isDelayedUp] = REVEALED
+        states[isDoneWaiting & isDelayedDown] = UPSIDE_DOWN
+        isRevealing = isDoneFlipping & isFlippingUp & ~self.alreadyRevealed
+        self.alreadyRevealed |= isRevealing
+        frameCounts[isDoneFlipping | (frameCounts % 360 == 0)] = 0
+
+        # None of the state changes above move a sprite to a different group of states in goldCounters.
+        for num in np.flatnonzero(isDoneFlipping | isDoneWaiting):
+            self.sprites[num].goldState = goldStateList[states[num]]
+        for num in np.flatnonzero(isRevealing):
+            self.sprites[num].reveal()
+        for num in np.flatnonzero(imageIndices != self.imageIndices):
+            self.sprites[num].image = self.imageTables[num][imageIndices[num]]
+        self.imageIndices = imageIndices
+
+        if GoldSprite.globalFrameCount % 12 == 0:
+            GoldSprite.globalFrameCount = 0
+
+    def stop(self):
+        """Copy the engine's frameCounts and animationCounts back into the sprites, and remove the engine from
+        goldGroup, so the sprites are updated one at a time from then on."""
+        for num, gold in enumerate(self.sprites):
+            gold.frameCount = int(self.frameCounts[num])
+            gold.animationCount = int(self.animationCounts[num])
+        if c.goldGroup.engine is self:
+            c.goldGroup.engine = None
+
+
+def startGoldEngine():
+    """Start a GoldEngine for every sprite in goldGroup, if GOLD_ENGINE is True and NumPy is installed.
+
+    Returns:
+        The GoldEngine object now updating goldGroup, or None if the gold sprites are updated one at a time.
+    """
+    if c.goldGroup.engine is not None:
+        c.goldGroup.engine.stop()
+    if c.GOLD_ENGINE and np is not None:
+        c.goldGroup.engine = GoldEngine(c.goldGroup.sprites())
+    return c.goldGroup.engine
@@ -1,8 +1,9 @@
 import pygame
-import random
 
 from game.tools.asset_cache import getImage
 import game.tools.constants as c
+from game.tools.game_random import gameRandom
+from game.tools.spatial_grid import SpatialGrid
 
 
 class Level:
@@ -23,12 +24,12 @@ class Level:
         and goldTilesVertical.
 
         Instance variables:
-            image: A None type object. Subclasses replace this with a Surface object of the image to be drawn for
-                the current level.
-            standardImage: A None type object. Subclasses replace this with a Surface object of the image to be
-                seen in standard play of the current level.
-            lightImage: A None type object. Subclasses replace this with a Surface object of a lighter variant of
-                the image to be seen in standard play of the current level.
+            image: A None type object. Replaced with the Surface object of the image to be drawn for the current
+                level whenever the level is initialized.
+            standardImageFile: A None type object. Subclasses replace this with the string file name of the image
+                to be seen in standard play of the current level.
+            lightImageFile: A None type object. Subclasses replace this with the string file name of a lighter
+                variant of the image to be seen in standard play of the current level.
                 Designed to be used when an ItemClock object is active, or to give the illusion of the level
                 flashing.
             backgroundColor: A tuple indicating the color of the level's background.
@@ -41,11 +42,16 @@ class Level:
                 rows can have items spawned on them.
             levelBorderRects: An empty list. Subclasses replace this with a list of rect objects that form the
                 boundaries of the level.
+            borderGrid: A SpatialGrid object indexing the rects in levelBorderRects.
+                Replaced with a new, filled in SpatialGrid object whenever the level is initialized, and never
+                changed afterwards, so that each game world can keep its own (See world.py).
+            boardSize: A tuple of the width and height of the level, in pixels. Sprites that cross over the left
+                or right edge of the level reappear at the opposite edge.
             isFlashing: A boolean indicating if the level should be in a flashing animation, switching between
                 its standardImage and lightImage.
             frameCount: An integer that increases whenever the flashBoard method is called.
         """
-        self.image = self.standardImage = self.lightImage = None
+        self.image = self.standardImageFile = self.lightImageFile = None
         self.backgroundColor = c.BLACK
         self.rubberTilesHorizontal = rubberTilesHorizontal
         self.rubberTilesVertical = rubberTilesVertical
@@ -56,14 +62,49 @@ class Level:
         self.blackHolePositions = []
         self.itemTiles = []
         self.levelBorderRects = []
+        self.borderGrid = SpatialGrid()
+        self.boardSize = c.SCREEN_SIZE
         self.isFlashing = False
         self.frameCount = 0
 
+    @property
+    def standardImage(self):
+        """The Surface object of the image to be seen in standard play of the level.
+
+        The image is only loaded the first time it is used, so that creating every level when the game starts does
+        not load every background image.
+        """
+        return getImage(c.BACKGROUND_FOLDER, self.standardImageFile)
+
+    @property
+    def lightImage(self):
+        """The Surface object of a lighter variant of standardImage, loaded the first time it is used."""
+        return getImage(c.BACKGROUND_FOLDER, self.lightImageFile)
+
+    def loadImages(self):
+        """Load the level's standard and light images ahead of time, if they have not been loaded already."""
+        getImage(c.BACKGROUND_FOLDER, self.standardImageFile)
+        getImage(c.BACKGROUND_FOLDER, self.lightImageFile)
+
     def initialize(self):
         """Set the relevant variables of the level to their initial values."""
         self.isFlashing = False
         self.image = self.standardImage
         self.frameCount = 0
+        self.borderGrid = SpatialGrid()
+        for levelRect in self.levelBorderRects:
+            self.borderGrid.insert(levelRect, levelRect)
+
+    def isCollidingWithBorder(self, rect):
+        """Check if the passed rect is colliding with any of the level boundary's rects.
+
+        Args:
+            rect: A rect object to check for collision.
+
+        Returns:
+            A boolean representing whether rect collides with any rect in levelBorderRects.
+        """
+        return any(rect.colliderect(levelRect) for levelRect in self.borderGrid.query(rect))
 
     def flashBoard(self):
         """Switch the level's image between standardImage and flashingImage every 6 frames."""
@@ -91,11 +132,10 @@ class BoardOneLevel(Level):
         goldTilesHorizontal, and goldTilesVertical.
 
         Instance variables:
-            standardImage: The image to be drawn for the level during standard gameplay.
-            lightImage: A lighter variant of standardImage, designed to be used when an ItemClock object is
-                active, or to give the illusion of the level flashing.
-            image: The current image to be drawn for the level.
-                Defaults to the standardImage.
+            standardImageFile: The string file name of the image to be drawn for the level during standard
+                gameplay.
+            lightImageFile: The string file name of a lighter variant of the standard image, designed to be used
+                when an ItemClock object is active, or to give the illusion of the level flashing.
             backgroundColor: A tuple indicating the color of the level's background.
             playerStartPositions: A list of four tuples indicating which columns and rows each player starts on.
             blackHolePositions: A list of four tuples indicating which columns and rows each black hole sprite
@@ -106,9 +146,8 @@ class BoardOneLevel(Level):
             levelBorderRects: A list of rect objects that form the boundaries of the level.
         """
         super().__init__(rubberTilesHorizontal, rubberTilesVertical, goldTilesHorizontal, goldTilesVertical)
-        self.standardImage = getImage(c.BACKGROUND_FOLDER, "background_1A.png")
-        self.lightImage = getImage(c.BACKGROUND_FOLDER, "background_1B.png")
-        self.image = self.standardImage
+        self.standardImageFile = "background_1A.png"
+        self.lightImageFile = "background_1B.png"
         self.backgroundColor = c.DARK_RED
         self.playerStartPosition = [(1, 1), (9, 1), (2, 7), (8, 7)]
         self.blackHolePositions = [(5, 4)]
@@ -137,11 +176,10 @@ class BoardTwoLevel(Level):
         goldTilesHorizontal, and goldTilesVertical.
 
         Instance variables:
-            standardImage: The image to be drawn for the level during standard gameplay.
-            lightImage: A lighter variant of standardImage, designed to be used when an ItemClock object is
-                active, or to give the illusion of the level flashing.
-            image: The current image to be drawn for the level.
-                Defaults to the standardImage.
+            standardImageFile: The string file name of the image to be drawn for the level during standard
+                gameplay.
+            lightImageFile: The string file name of a lighter variant of the standard image, designed to be used
+                when an ItemClock object is active, or to give the illusion of the level flashing.
             backgroundColor: A tuple indicating the color of the level's background.
             playerStartPositions: A list of four tuples indicating which columns and rows each player starts on.
             blackHolePositions: A list of four tuples indicating which columns and rows each black hole sprite
@@ -152,9 +190,8 @@ class BoardTwoLevel(Level):
             levelBorderRects: A list of rect objects that form the boundaries of the level.
         """
         super().__init__(rubberTilesHorizontal, rubberTilesVertical, goldTilesHorizontal, goldTilesVertical)
-        self.standardImage = getImage(c.BACKGROUND_FOLDER, "background_2A.png")
-        self.lightImage = getImage(c.BACKGROUND_FOLDER, "background_2B.png")
-        self.image = self.standardImage
+        self.standardImageFile = "background_2A.png"
+        self.lightImageFile = "background_2B.png"
         self.backgroundColor = c.DARK_GREEN
         self.playerStartPosition = [(4, 0), (6, 0), (1, 5), (9, 5)]
         self.blackHolePositions = [(2, 6), (8, 6)]
@@ -183,11 +220,10 @@ class BoardThreeLevel(Level):
         goldTilesHorizontal, and goldTilesVertical.
 
         Instance variables:
-            standardImage: The image to be drawn for the level during standard gameplay.
-            lightImage: A lighter variant of standardImage, designed to be used when an ItemClock object is
-                active, or to give the illusion of the level flashing.
-            image: The current image to be drawn for the level.
-                Defaults to the standardImage.
+            standardImageFile: The string file name of the image to be drawn for the level during standard
+                gameplay.
+            lightImageFile: The string file name of a lighter variant of the standard image, designed to be used
+                when an ItemClock object is active, or to give the illusion of the level flashing.
             backgroundColor: A tuple indicating the color of the level's background.
             playerStartPositions: A list of four tuples indicating which columns and rows each player starts on.
             blackHolePositions: A list of four tuples indicating which columns and rows each black hole sprite
@@ -198,9 +234,8 @@ class BoardThreeLevel(Level):
             levelBorderRects: A list of rect objects that form the boundaries of the level.
         """
         super().__init__(rubberTilesHorizontal, rubberTilesVertical, goldTilesHorizontal, goldTilesVertical)
-        self.standardImage = getImage(c.BACKGROUND_FOLDER, "background_3A.png")
-        self.lightImage = getImage(c.BACKGROUND_FOLDER, "background_3B.png")
-        self.image = self.standardImage
+        self.standardImageFile = "background_3A.png"
+        self.lightImageFile = "background_3B.png"
         self.backgroundColor = c.DARK_BLUE
         self.playerStartPosition = [(5, 1), (5, 6), (1, 3), (9, 3)]
         self.blackHolePositions = [(4, 4), (6, 4)]
@@ -228,11 +263,10 @@ class BoardFourLevel(Level):
         goldTilesHorizontal, and goldTilesVertical.
 
         Instance variables:
-            standardImage: The image to be drawn for the level during standard gameplay.
-            lightImage: A lighter variant of standardImage, designed to be used when an ItemClock object is
-                active, or to give the illusion of the level flashing.
-            image: The current image to be drawn for the level.
-                Defaults to the standardImage.
+            standardImageFile: The string file name of the image to be drawn for the level during standard
+                gameplay.
+            lightImageFile: The string file name of a lighter variant of the standard image, designed to be used
+                when an ItemClock object is active, or to give the illusion of the level flashing.
             backgroundColor: A tuple indicating the color of the level's background.
             playerStartPositions: A list of four tuples indicating which columns and rows each player starts on.
             blackHolePositions: A list of four tuples indicating which columns and rows each black hole sprite
@@ -243,9 +277,8 @@ class BoardFourLevel(Level):
             levelBorderRects: A list of rect objects that form the boundaries of the level.
         """
         super().__init__(rubberTilesHorizontal, rubberTilesVertical, goldTilesHorizontal, goldTilesVertical)
-        self.standardImage = getImage(c.BACKGROUND_FOLDER, "background_4A.png")
-        self.lightImage = getImage(c.BACKGROUND_FOLDER, "background_4B.png")
-        self.image = self.standardImage
+        self.standardImageFile = "background_4A.png"
+        self.lightImageFile = "background_4B.png"
         self.backgroundColor = c.PURPLE
         self.playerStartPosition = [(4, 0), (6, 0), (1, 7), (9, 7)]
         self.blackHolePositions = [(2, 2), (8, 2), (4, 6), (6, 6)]
@@ -276,11 +309,10 @@ class BoardFiveLevel(Level):
         goldTilesHorizontal, and goldTilesVertical.
 
         Instance variables:
-            standardImage: The image to be drawn for the level during standard gameplay.
-            lightImage: A lighter variant of standardImage, designed to be used when an ItemClock object is
-                active, or to give the illusion of the level flashing.
-            image: The current image to be drawn for the level.
-                Defaults to the standardImage.
+            standardImageFile: The string file name of the image to be drawn for the level during standard
+                gameplay.
+            lightImageFile: The string file name of a lighter variant of the standard image, designed to be used
+                when an ItemClock object is active, or to give the illusion of the level flashing.
             backgroundColor: A tuple indicating the color of the level's background.
             activeRubberTraps: A list of tuples indicating which columns and rows have horizontal rubber traps
                 which begin the game in an active state.
@@ -293,9 +325,8 @@ class BoardFiveLevel(Level):
             levelBorderRects: A list of rect objects that form the boundaries of the level.
         """
         super().__init__(rubberTilesHorizontal, rubberTilesVertical, goldTilesHorizontal, goldTilesVertical)
-        self.standardImage = getImage(c.BACKGROUND_FOLDER, "background_5A.png")
-        self.lightImage = getImage(c.BACKGROUND_FOLDER, "background_5B.png")
-        self.image = self.standardImage
+        self.standardImageFile = "background_5A.png"
+        self.lightImageFile = "background_5B.png"
         self.backgroundColor = c.DARK_ORANGE
         self.activeRubberTraps = [(1, 4), (9, 4)]
         self.playerStartPosition = [(1, 0), (9, 0), (4, 7), (6, 7)]
@@ -322,11 +353,10 @@ class BonusLevel(Level):
             goldTilesHorizontal: A list of tuples indicating which columns and rows to place horizontal gold
                 sprites.
             goldTilesVertical: A list of tuples indicating which columns and rows to place vertical gold sprites.
-            standardImage: The image to be drawn for the level during standard gameplay.
-            lightImage: A lighter variant of standardImage, designed to be used when an ItemClock object is
-                active, or to give the illusion of the level flashing.
-            image: The current image to be drawn for the level.
-                Defaults to the standardImage.
+            standardImageFile: The string file name of the image to be drawn for the level during standard
+                gameplay.
+            lightImageFile: The string file name of a lighter variant of the standard image, designed to be used
+                when an ItemClock object is active, or to give the illusion of the level flashing.
             backgroundColor: A tuple indicating the color of the level's background.
             playerStartPositions: A list of four tuples indicating which columns and rows each player starts on.
             levelBorderRects: A list of rect objects that form the boundaries of the level.
@@ -339,9 +369,8 @@ class BonusLevel(Level):
                              (9, 2), (2, 3), (3, 3), (8, 3), (9, 3), (2, 4), (3, 4), (8, 4), (9, 4), (2, 5), (3, 5),
                              (8, 5), (9, 5), (2, 6), (3, 6), (4, 6), (5, 6), (6, 6), (7, 6), (8, 6), (9, 6)]
         super().__init__([], [], goldTilesHorizontal, goldTilesVertical)
-        self.standardImage = getImage(c.BACKGROUND_FOLDER, "background_6A.png")
-        self.lightImage = getImage(c.BACKGROUND_FOLDER, "background_6B.png")
-        self.image = self.standardImage
+        self.standardImageFile = "background_6A.png"
+        self.lightImageFile = "background_6B.png"
         self.backgroundColor = c.DARK_RED
         self.playerStartPosition = [(4, 1), (6, 1), (3, 6), (7, 6)]
         self.levelBorderRects = [pygame.Rect(0, 0, 512, 36), pygame.Rect(188, 186, 136, 94),
@@ -349,6 +378,95 @@ class BonusLevel(Level):
                                  pygame.Rect(477, 0, 39, 448)]
 
 
+class TiledLevel(Level):
+    """Create a new object of a larger, synthetic level, made of copies of another level placed in a grid.
+
+    Each copy is placed 10 columns to the right of, or 9 rows below, the previous copy, so that the outer walls of
+    neighboring copies overlap. Tiles shared by two copies only hold one gold sprite, rubber trap or item.
+    Tiled levels are not part of the normal level order, and are not included in levelsByName. They are designed to
+    be used by the stress test (See stress.py), to play levels with many more sprites than usual.
+
+    Attributes:
+        baseLevel: The Level object that is copied. This should not be a BonusLevel, as the tiled level is never
+            treated as a bonus level.
+        columns: An integer showing how many copies of baseLevel are placed side by side.
+        rows: An integer showing how many copies of baseLevel are placed above one another.
+    """
+
+    def __init__(self, baseLevel, columns=1, rows=1):
+        """Init TiledLevel using the Level object baseLevel and the integers columns and rows.
+
+        The players start on the tiles they would start on in the top-left copy of baseLevel.
+
+        Instance variables:
+            tileOffsets: A list of (column, row) tuples of how far each copy of baseLevel is moved, in tiles.
+            tiledImages: A dict associating the file name of each of baseLevel's images with a Surface object of
+                that image tiled to the size of the level. Each tiled image is made the first time it is used.
+        """
+        self.baseLevel = baseLevel
+        self.columns = columns
+        self.rows = rows
+        self.tileOffsets = [(10 * column, 9 * row) for row in range(rows) for column in range(columns)]
+        super().__init__(self.getTileCopies(baseLevel.rubberTilesHorizontal),
+                         self.getTileCopies(baseLevel.rubberTilesVertical),
+                         self.getTileCopies(baseLevel.goldTilesHorizontal),
+                         self.getTileCopies(baseLevel.goldTilesVertical))
+        self.standardImageFile = baseLevel.standardImageFile
+        self.lightImageFile = baseLevel.lightImageFile
+        self.backgroundColor = baseLevel.backgroundColor
+        self.activeRubberTraps = self.getTileCopies(baseLevel.activeRubberTraps)
+        self.playerStartPosition = list(baseLevel.playerStartPosition)
+        self.blackHolePositions = self.getTileCopies(baseLevel.blackHolePositions)
+        self.itemTiles = self.getTileCopies(baseLevel.itemTiles)
+        self.levelBorderRects = [levelRect.move(48 * x, 48 * y) for (x, y) in self.tileOffsets
+                                 for levelRect in baseLevel.levelBorderRects]
+        self.boardSize = (c.SCREEN_SIZE[0] + 480 * (columns - 1), c.SCREEN_SIZE[1] + 432 * (rows - 1))
+        self.tiledImages = {}
+
+    def getTileCopies(self, tiles):
+        """Get the tiles of every copy of baseLevel from a list of the tiles in baseLevel.
+
+        Args:
+            tiles: A list of (column, row) tuples in baseLevel.
+
+        Returns:
+            tileCopies: A list of (column, row) tuples in this level, without any duplicates.
+        """
+        tileCopies = {}
+        for (offsetX, offsetY) in self.tileOffsets:
+            for (x, y) in tiles:
+                tileCopies.setdefault((x + offsetX, y + offsetY))
+        return list(tileCopies)
+
+    def getTiledImage(self, imageFile):
+        """Get a Surface object of one of baseLevel's images, tiled in the same way as the level's tiles.
+
+        Args:
+            imageFile: The string file name of the image to tile.
+
+        Returns:
+            The tiled Surface object, the size of boardSize.
+        """
+        if imageFile not in self.tiledImages:
+            image = getImage(c.BACKGROUND_FOLDER, imageFile)
+            tiledImage = pygame.Surface(self.boardSize).convert(image)
+            tiledImage.fill(self.backgroundColor)
+            for (x, y) in self.tileOffsets:
+                tiledImage.blit(image, (48 * x, 48 * y))
+            self.tiledImages[imageFile] = tiledImage
+        return self.tiledImages[imageFile]
+
+    @property
+    def standardImage(self):
+        """The Surface object of baseLevel's standardImage, tiled to the size of the level."""
+        return self.getTiledImage(self.standardImageFile)
+
+    @property
+    def lightImage(self):
+        """The Surface object of baseLevel's lightImage, tiled to the size of the level."""
+        return self.getTiledImage(self.lightImageFile)
+
+
 # Create an instance of each of the 41 different level patterns. This ensures that there is exactly one copy of each
 # level pattern at all times, with the gold tiles and rubber trap tiles in the proper locations.
 HEART = BoardOneLevel([], [(4, 3), (7, 3)],
@@ -553,6 +671,26 @@ boardFiveLevels = [SPIDER, LETTER_X, BOX, DIAMOND, INVERTED_DIAMOND, BOX_PLUS, C
 
 listOfAllBoardsPastOne = [boardTwoLevels, boardThreeLevels, boardFourLevels, boardFiveLevels]
 
+# levelsByName associates the name of each level instance with that instance, so levels can be chosen by name (Such as
+# by the batch simulation runner).
+levelsByName = {name: value for name, value in globals().items() if isinstance(value, Level)}
+levelNames = {level: name for name, level in levelsByName.items()}
+
+
+def getLevelName(level):
+    """Get the name of a level, as used in levelsByName.
+
+    Args:
+        level: A Level object. If it is a TiledLevel, it is named after its baseLevel, followed by its columns and
+            rows (Such as "HEART_3x2").
+
+    Returns:
+        The string name of the level.
+    """
+    if isinstance(level, TiledLevel):
+        return "{}_{}x{}".format(getLevelName(level.baseLevel), level.columns, level.rows)
+    return levelNames[level]
+
 
 def getLevelOrder():
     """Get a random order of the 21 levels to be played, including one of the boardOneLevels, one of the bonus
@@ -568,12 +706,12 @@ def getLevelOrder():
     Returns:
         newLevelOrder: A list of Level objects in the order to be played.
     """
-    random.shuffle(boardOneLevels)
-    newLevelOrder = [boardOneLevels[0]]
-    for boardList in listOfAllBoardsPastOne:
-        random.shuffle(boardList)
+    # The level lists are shuffled as copies, so the order only depends on the state of gameRandom, and not on the
+    # order chosen for any previous games.
+    newLevelOrder = [gameRandom.choice(boardOneLevels)]
+    shuffledBoardLists = [gameRandom.sample(boardList, len(boardList)) for boardList in listOfAllBoardsPastOne]
     for num in range(4):
-        for boardList in listOfAllBoardsPastOne:
+        for boardList in shuffledBoardLists:
             newLevelOrder.append(boardList[num])
         newLevelOrder.append(BONUS_LEVEL)
     return newLevelOrder
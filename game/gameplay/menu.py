@@ -3,6 +3,7 @@ import pygame as pg
 from game.gameplay.state import checkQuitGame
 import game.tools.constants as c
 from game.tools.controls import controlsDicts
+from game.tools.text_cache import renderText
 
 
 def displayChangeControlMenu(titleImageOne, titleImageTwo, subtitleImage, numberOfPlayers):
@@ -49,7 +50,7 @@ def displayChangeControlMenu(titleImageOne, titleImageTwo, subtitleImage, number
         controlsList = ["shoot", "pause", "up", "down", "left", "right", "none"]
         controlToChange = controlsList[controlChangeIndex]
         c.SCREEN.fill(c.BLACK)
-        subtitleText = c.FONT.render("SECRETS OF OLD CLU CLU LAND", False, c.WHITE)
+        subtitleText = renderText("SECRETS OF OLD CLU CLU LAND")
         c.SCREEN.blit(subtitleText, (42, 275))
         for sprite in [titleImageOne, titleImageTwo, subtitleImage]:
             c.SCREEN.blit(sprite.image, sprite.coordinates)
@@ -63,10 +64,9 @@ def displayChangeControlMenu(titleImageOne, titleImageTwo, subtitleImage, number
         elif controlChangeIndex == 5:
             textCoordinates = setTextCoordinates(0, numberOfPlayers)
         if numberOfPlayers == 1:
-            controlInputText = c.FONT.render("SELECT '{}' BUTTON".format(controlToChange.upper()), False, c.WHITE)
+            controlInputText = renderText("SELECT '{}' BUTTON".format(controlToChange.upper()))
         else:
-            controlInputText = c.FONT.render("P{} '{}' BUTTON".format(currentPlayerIndex, controlToChange.upper()),
-                                             False, c.WHITE)
+            controlInputText = renderText("P{} '{}' BUTTON".format(currentPlayerIndex, controlToChange.upper()))
 
         # The text onscreen flashes every 30 frames.
         if frameCount % 60 < 30:
@@ -139,14 +139,14 @@ def chooseNumberOfPlayers(titleImageOne, titleImageTwo, subtitleImage, textToDis
     """
     for sprite in [subtitleImage, titleImageOne, titleImageTwo]:
         sprite.setTitleImage()
-    subtitleText = c.FONT.render("SECRETS OF OLD CLU CLU LAND", False, c.WHITE)
-    playerNumbersText = [c.FONT.render("1 PLAYER", False, c.CYAN),
-                         c.FONT.render("2 PLAYER", False, c.CYAN),
-                         c.FONT.render("3 PLAYER", False, c.CYAN),
-                         c.FONT.render("4 PLAYER", False, c.CYAN)]
+    subtitleText = renderText("SECRETS OF OLD CLU CLU LAND")
+    playerNumbersText = [renderText("1 PLAYER", c.CYAN),
+                         renderText("2 PLAYER", c.CYAN),
+                         renderText("3 PLAYER", c.CYAN),
+                         renderText("4 PLAYER", c.CYAN)]
     playerTextCoordinates = [(60, 310), (320, 310), (60, 370), (320, 370)]
-    optionText = c.FONT.render(textToDisplay, False, c.CYAN)
-    cursorText = c.FONT.render(">", False, c.ORANGE)
+    optionText = renderText(textToDisplay, c.CYAN)
+    cursorText = renderText(">", c.ORANGE)
     cursorLocation = (40, 310)
 
     # Since the word "GAME" has fewer characters than the word "CONTROLS", the text's coordinates are all adjusted 30
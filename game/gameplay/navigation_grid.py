@@ -0,0 +1,229 @@
+import pygame as pg
+
+import game.tools.constants as c
+from game.tools.event_bus import eventBus
+
+
+# A dict associating each Level object that has been played with its borderEdges, as a level's boundaries never change.
+levelBorderEdges = {}
+
+
+class NavigationGrid:
+    """Store which positions along each of the current level's tiles block an urchin sprite, so that the urchin
+    sprites' bounce checks are a table lookup instead of a collision check against the level.
+
+    Urchin sprites only move along lanes, the rows and columns that connect the centers of the level's tiles. For
+    every tile, the table stores the tile's two edges: the positions from the tile's center to the center of the tile
+    to its right, and the positions from the tile's center to the center of the tile below it. Each edge holds, for
+    each of its 48 positions, whether an urchin's rect there collides with the level's boundaries, or whether its
+    collisionRect there collides with a gold sprite or rubber trap sprite that is not in the OFF_SCREEN state. These
+    are the same collision checks the urchin sprites would otherwise make, so every lookup gives the same result.
+
+    The level's boundaries never change, so the edges are first built for every tile from the boundaries alone, and
+    stored in borderEdges. When a level starts, only the tiles next to a revealed gold sprite or rubber trap sprite
+    have their edges built again with the obstacles included. Whenever a gold sprite is revealed or hidden, or a
+    rubber trap sprite is revealed (Found through the GOLD_STATE_CHANGED and TRAP_REVEALED events of the eventBus),
+    only the edges of the tiles next to that sprite are built again.
+    Positions that are not on a lane, such as where an urchin was pushed by a player, are checked for collision
+    directly.
+
+    Class variables:
+        tileSize: An integer width and height of each of the level's tiles, in pixels.
+        rectSize: A tuple of the width and height of an urchin sprite's rect.
+        collisionOffset: An integer distance from the topleft of an urchin sprite's rect to the topleft of its
+            collisionRect, along both axes.
+        collisionSize: A tuple of the width and height of an urchin sprite's collisionRect.
+
+    Attributes:
+        level: The Level object the edges were built for, or None before the first level.
+        borderEdges: A dict associating the (column, row) of each tile with a tuple of its right and down edges. Each
+            edge is a tuple of 48 booleans showing whether an urchin's rect at each position collides with any of
+            the level's boundary rects.
+        tileEdges: A dict associating the (column, row) of each tile with a tuple of its right and down edges. Each
+            edge is a tuple of 48 booleans showing whether an urchin at each position is blocked by the level's
+            boundaries, a gold sprite, or a rubber trap sprite.
+    """
+    tileSize = 48
+    rectSize = (34, 34)
+    collisionOffset = 8
+    collisionSize = (18, 18)
+
+    def __init__(self):
+        """Init NavigationGrid."""
+        self.level = None
+        self.borderEdges = {}
+        self.tileEdges = {}
+
+    def reset(self, level):
+        """Build the edges of every tile in the level, starting from its borderEdges. This should be called after
+        the level's gold sprites and rubber trap sprites have been placed.
+
+        The tiles one column or row past each edge of the level are included, as urchin sprites reappear there after
+        crossing over the left or right edge of the level. The borderEdges of each level are only built the first
+        time it is played, and are stored in levelBorderEdges.
+
+        Args:
+            level: A Level object representing the level about to be played.
+        """
+        self.level = level
+        if level not in levelBorderEdges:
+            tiles = [(column, row) for column in range(-2, level.boardSize[0] // self.tileSize + 2)
+                     for row in range(-1, level.boardSize[1] // self.tileSize + 2)]
+            levelBorderEdges[level] = {tile: (self.getBorderEdge(tile, False), self.getBorderEdge(tile, True))
+                                       for tile in tiles}
+        self.borderEdges = self.tileEdges = levelBorderEdges[level]
+        self.updateTilesNear([gold.collisionRect for gold in c.goldGroup
+                              if gold.goldState != c.OtherStates.OFF_SCREEN] +
+                             [rubberTrap.collisionRect for rubberTrap in c.rubberGroup
+                              if rubberTrap.trapState != c.OtherStates.OFF_SCREEN])
+
+    def getEdgePositions(self, tile, isVertical):
+        """Get the topleft positions an urchin sprite's rect passes through along one of a tile's edges.
+
+        Args:
+            tile: A tuple of the (column, row) of the tile.
+            isVertical: A boolean showing whether to get the tile's down edge, rather than its right edge.
+
+        Returns:
+            A list of 48 (x, y) tuples, starting at the tile's center.
+        """
+        x, y = self.tileSize * tile[0] - 1, self.tileSize * tile[1] + 1
+        if isVertical:
+            return [(x, y + offset) for offset in range(self.tileSize)]
+        return [(x + offset, y) for offset in range(self.tileSize)]
+
+    def getBorderEdge(self, tile, isVertical):
+        """Check which positions along one of a tile's edges collide with the level's boundaries.
+
+        Args:
+            tile: A tuple of the (column, row) of the tile.
+            isVertical: A boolean showing whether to check the tile's down edge, rather than its right edge.
+
+        Returns:
+            A tuple of 48 booleans, one for each position along the edge.
+        """
+        positions = self.getEdgePositions(tile, isVertical)
+        edgeRect = pg.Rect(positions[0], self.rectSize).union(pg.Rect(positions[-1], self.rectSize))
+        borderRects = [levelRect for levelRect in self.level.borderGrid.query(edgeRect)
+                       if edgeRect.colliderect(levelRect)]
+        if not borderRects:
+            return (False,) * self.tileSize
+        return tuple(pg.Rect(position, self.rectSize).collidelist(borderRects) != -1 for position in positions)
+
+    def getObstacleEdge(self, tile, isVertical):
+        """Check which positions along one of a tile's edges collide with a gold sprite or rubber trap sprite that
+        is not in the OFF_SCREEN state.
+
+        Args:
+            tile: A tuple of the (column, row) of the tile.
+            isVertical: A boolean showing whether to check the tile's down edge, rather than its right edge.
+
+        Returns:
+            A tuple of 48 booleans, one for each position along the edge.
+        """
+        collisionRects = [pg.Rect((x + self.collisionOffset, y + self.collisionOffset), self.collisionSize)
+                          for (x, y) in self.getEdgePositions(tile, isVertical)]
+        edgeRect = collisionRects[0].union(collisionRects[-1])
+        obstacleRects = [gold.collisionRect for gold in c.goldGrid.query(edgeRect)
+                         if gold.goldState != c.OtherStates.OFF_SCREEN and edgeRect.colliderect(gold.collisionRect)]
+        obstacleRects.extend(rubberTrap.collisionRect for rubberTrap in c.rubberGrid.query(edgeRect)
+                             if rubberTrap.trapState != c.OtherStates.OFF_SCREEN and
+                             edgeRect.colliderect(rubberTrap.collisionRect))
+        if not obstacleRects:
+            return (False,) * self.tileSize
+        return tuple(collisionRect.collidelist(obstacleRects) != -1 for collisionRect in collisionRects)
+
+    def getTileEdges(self, tile):
+        """Combine a tile's borderEdges with the gold sprites and rubber trap sprites currently blocking its edges.
+
+        Args:
+            tile: A tuple of the (column, row) of the tile.
+
+        Returns:
+            A tuple of the tile's right and down edges, each a tuple of 48 booleans.
+        """
+        return tuple(tuple(isBorder or isObstacle for isBorder, isObstacle in
+                           zip(borderEdge, self.getObstacleEdge(tile, isVertical)))
+                     for borderEdge, isVertical in zip(self.borderEdges[tile], (False, True)))
+
+    def updateTilesNear(self, rects):
+        """Build the edges of every tile whose edges pass close enough to any of the passed rects to collide with it.
+
+        tileEdges is replaced with an updated copy rather than changed, so a GameSnapshot can keep the dict itself.
+
+        Args:
+            rects: A list of the collisionRects of gold sprites or rubber trap sprites that were revealed or hidden.
+        """
+        reach = self.tileSize + self.collisionOffset + self.collisionSize[0]
+        tiles = {(column, row) for rect in rects
+                 for column in range((rect.left - reach) // self.tileSize, rect.right // self.tileSize + 1)
+                 for row in range((rect.top - reach) // self.tileSize, rect.bottom // self.tileSize + 1)}
+        tileEdges = dict(self.tileEdges)
+        for tile in tiles:
+            if tile in tileEdges:
+                tileEdges[tile] = self.getTileEdges(tile)
+        self.tileEdges = tileEdges
+
+    def isBlocked(self, rect, collisionRect):
+        """Check if an urchin sprite with the passed rect and collisionRect is blocked by the level's boundaries, a
+        gold sprite, or a rubber trap sprite.
+
+        Args:
+            rect: The urchin sprite's rect object, checked for collision with the level's boundaries.
+            collisionRect: The urchin sprite's collisionRect, checked for collision with gold and rubber traps.
+
+        Returns:
+            A boolean representing whether rect collides with any rect in the level's levelBorderRects, or
+            collisionRect collides with a gold or rubber trap sprite that is not in the OFF_SCREEN state.
+        """
+        column, xOffset = divmod(rect.x + 1, self.tileSize)
+        row, yOffset = divmod(rect.y - 1, self.tileSize)
+        edges = self.tileEdges.get((column, row))
+        if edges is not None and rect.size == self.rectSize:
+            if yOffset == 0:
+                return edges[0][xOffset]
+            elif xOffset == 0:
+                return edges[1][yOffset]
+        return self.level.isCollidingWithBorder(rect) or self.isBlockedByObstacle(collisionRect)
+
+    def isBlockedByObstacle(self, rect):
+        """Check if the passed rect is colliding with any revealed gold sprites or rubber trap sprites.
+
+        Args:
+            rect: A rect object to check for collision.
+
+        Returns:
+            A boolean representing whether rect collides with a gold or rubber trap sprite that is not in the
+            OFF_SCREEN state.
+        """
+        return any(rect.colliderect(gold.collisionRect) for gold in c.goldGrid.query(rect)
+                   if gold.goldState != c.OtherStates.OFF_SCREEN) or\
+            any(rect.colliderect(rubberTrap.collisionRect) for rubberTrap in c.rubberGrid.query(rect)
+                if rubberTrap.trapState != c.OtherStates.OFF_SCREEN)
+
+    def goldStateChanged(self, gold, oldState, newState):
+        """Build the edges near a gold sprite again if it was revealed or hidden.
+
+        Args:
+            gold: The GoldSprite object whose state changed.
+            oldState: The OtherStates Enum instance of the sprite's old state, or None if it was just created.
+            newState: The OtherStates Enum instance of the sprite's new state, or None if it was just killed.
+        """
+        if self.level is not None and\
+                (oldState == c.OtherStates.OFF_SCREEN) != (newState == c.OtherStates.OFF_SCREEN):
+            self.updateTilesNear([gold.collisionRect])
+
+    def trapRevealed(self, trap, player):
+        """Build the edges near a rubber trap sprite again, as it was revealed.
+
+        Args:
+            trap: The RubberTrapSprite object that was revealed.
+            player: The PlayerSprite object that revealed it.
+        """
+        if self.level is not None:
+            self.updateTilesNear([trap.collisionRect])
+
+
+navigationGrid = NavigationGrid()
+eventBus.subscribe(c.GameEvents.GOLD_STATE_CHANGED, navigationGrid.goldStateChanged)
+eventBus.subscribe(c.GameEvents.TRAP_REVEALED, navigationGrid.trapRevealed)
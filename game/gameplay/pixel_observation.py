@@ -0,0 +1,107 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+import pygame as pg
+
+from game.gameplay.draw_level import DirtyRectRenderer
+import game.tools.constants as c
+
+
+# grayscaleWeights are the amounts of red, green and blue light in each shade of grey, as used by ITU-R BT.601.
+grayscaleWeights = (0.299, 0.587, 0.114)
+
+
+class PixelObserver:
+    """Draw the frames of a simulated level to an offscreen Surface whose pixels are stored in a NumPy array, so
+    that agents can observe exactly what a player would see without copying the screen.
+
+    The Surface is created with pg.image.frombuffer, so it shares its memory with the pixels array instead of
+    holding its own copy. Drawing to the Surface changes the array directly, and the array never needs to be locked
+    the way the arrays from pygame.surfarray do. Frames are drawn with a DirtyRectRenderer, so only the regions that
+    changed since the previous drawn frame are redrawn.
+    Observations can be downsampled, by keeping only every downsample-th row and column of pixels, and converted to
+    grayscale. Downsampling only changes how the array is viewed, so it never copies anything. Converting to
+    grayscale is done with a single NumPy pass over the downsampled pixels. Since downsampling skips pixels, very thin
+    details can be lost at large downsample factors.
+    NumPy must be installed to use this class.
+
+    Attributes:
+        isGrayscale: A boolean indicating if observations are converted to grayscale.
+        downsample: An integer factor to divide the width and height of observations by. This must divide both the
+            width and height of the screen evenly.
+        pixels: A NumPy array of uint8 values with the shape (height, width, 4), holding the red, green and blue
+            values of each pixel of surface, followed by an unused byte.
+        surface: The Surface object that frames are drawn to, sharing its memory with pixels.
+        renderer: The DirtyRectRenderer object that draws each frame.
+        observationShape: A tuple of the shape of each observation array.
+    """
+
+    def __init__(self, isGrayscale=False, downsample=1):
+        """Init PixelObserver using the boolean isGrayscale and the integer downsample.
+
+        Instance variables:
+            view: A NumPy array viewing the red, green and blue values of every downsample-th row and column of
+                pixels, without copying them.
+            weights: A NumPy array of the float32 grayscaleWeights.
+            grayPixels: A NumPy array of float32 values that grayscale observations are written to, or None if
+                observations are not converted to grayscale.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+            ValueError: If downsample does not evenly divide the width and height of the screen.
+        """
+        if np is None:
+            raise RuntimeError("PixelObserver requires NumPy to be installed.")
+        width, height = c.SCREEN_SIZE
+        if downsample < 1 or width % downsample or height % downsample:
+            raise ValueError("A downsample factor of {} does not evenly divide the screen size {}.".format(
+                downsample, c.SCREEN_SIZE))
+        self.isGrayscale = isGrayscale
+        self.downsample = downsample
+        self.pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self.surface = pg.image.frombuffer(self.pixels, c.SCREEN_SIZE, "RGBX")
+        self.renderer = DirtyRectRenderer(True)
+        self.view = self.pixels[::downsample, ::downsample, :3]
+        self.weights = np.array(grayscaleWeights, dtype=np.float32)
+        self.grayPixels = np.empty(self.view.shape[:2], dtype=np.float32) if isGrayscale else None
+        self.observationShape = self.view.shape[:2] if isGrayscale else self.view.shape
+
+    def draw(self, simulation):
+        """Draw the current frame of a simulated level to surface, as playLevel would draw it to the screen.
+
+        Args:
+            simulation: The LevelSimulation object of the level, which must be in the active world.
+        """
+        screen = c.SCREEN
+        c.SCREEN = self.surface
+        try:
+            self.renderer.startFrame(simulation.playerList, simulation.level, simulation.goldCount,
+                                     simulation.timeCount)
+            for group in c.allGroups:
+                for sprite in group:
+                    self.renderer.drawSprite(sprite)
+            self.renderer.updateDisplay()
+        finally:
+            c.SCREEN = screen
+
+    def observe(self, out=None):
+        """Get the most recently drawn frame as an observation.
+
+        Args:
+            out: A NumPy array of observationShape to write the observation to. Defaults to None, meaning that the
+                observation is returned without being copied if possible.
+
+        Returns:
+            observation: If isGrayscale is False, a uint8 array of the red, green and blue values of each pixel,
+                with the shape (height, width, 3). Without out, this is a view of pixels, which changes when the
+                next frame is drawn.
+                If isGrayscale is True, a float32 array of the brightness of each pixel, from 0 to 255, with the
+                shape (height, width). Without out, this is grayPixels, which is overwritten by the next call.
+        """
+        if not self.isGrayscale:
+            if out is None:
+                return self.view
+            np.copyto(out, self.view)
+            return out
+        return np.matmul(self.view, self.weights, out=self.grayPixels if out is None else out)
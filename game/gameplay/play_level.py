@@ -1,8 +1,10 @@
 import pygame as pg
+import time
 
-from game.gameplay.draw_level import blitLevelData, blitLevelEndData, scrollLevelData
+from game.gameplay.draw_level import blitLevelData, blitLevelEndData, DirtyRectRenderer, scrollLevelData
+from game.gameplay.gold_counters import goldCounters
 from game.gameplay.level import BonusLevel
-from game.gameplay.player_actions import shootWave
+from game.gameplay.player_actions import applyPlayerInputs, DIRECTION_CONTROLS
 from game.gameplay.setup_level import setLevelConstants, setLevelSprites, setLevelTime
 from game.gameplay.state import checkPauseGame, checkQuitGame
 from game.sprites.gold import GoldSprite
@@ -12,9 +14,18 @@ from game.sprites.urchin import UrchinSprite
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
 from game.tools.controls import controlsDicts
+from game.tools.event_bus import eventBus
+from game.tools.profiler import FrameProfiler, NullProfiler
+from game.tools.timestep import FixedTimestep
 
 
-def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates, highScore):
+# newGameOverPlayers collects the players who publish a GAME_OVER event during a frame. playLevel and LevelSimulation
+# move them into their own lists with addGameOverIndexes at the end of every frame of gameplay, so it is always empty
+# between frames.
+newGameOverPlayers = []
+
+
+def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates, highScore, inputLog=None):
     """Play the current level. Update and draw all sprites every frame, count down the timer, and control the
     state of the players and game depending on which keys are pressed.
 
@@ -26,6 +37,8 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
         gameOverTextStates: A list of four TextStates Enum instances, representing whether the gameOverTextSprite
             instances have been created for the player corresponding to that index.
         highScore: An integer showing the current high score.
+        inputLog: An InputLog object to record the inputs of every tick of gameplay in.
+            Defaults to None, meaning that no inputs are recorded.
 
     Returns:
         playerList: A list of all PlayerSprite objects in the game.
@@ -44,17 +57,26 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
         if value == c.TextStates.ONSCREEN:
             gameOverTextStates[index] = c.TextStates.OFF_SCREEN
 
+    # gameOverIndexes lists the index of each player who has run out of lives. Players who run out of lives during the
+    # level are added to it from their GAME_OVER events, instead of every player's state being checked every frame.
+    # isGameOver tracks if every player has run out of lives and their game over text has moved off-screen. It can
+    # only change when a game over text sprite moves off-screen.
+    gameOverIndexes = [num for num, player in enumerate(playerList) if player.playerState == c.PlayerStates.DEAD]
+    isGameOver = all(value == c.TextStates.OFF_SCREEN for value in gameOverTextStates)
+
     # scoreBonus tracks if the player should earn bonus points for completing the level quickly. If they complete the
     # level before the timer reaches targetTimeCount, the bonus is earned. If the timer ever reaches targetTimeCount,
     # scoringBonus is set to False for the current level.
-    # playingLowTime music tracks if the music being played is the 'low time' music. If the timer increases above 200
-    # while it's playing the 'low time' music, it loads and plays the standard music instead.
     # timeReachedZero tracks if the timer has already reached 0, so it only kills all players once at that point.
     # gameOverStarted tracks if the code to intialize a game over has begun. Initializing a game over takes
     scoreBonus = True
-    playingLowTimeMusic = timeReachedZero = gameOverStarted = False
+    timeReachedZero = gameOverStarted = False
+    renderer = DirtyRectRenderer()
+    scheduler = FixedTimestep()
+    profiler = FrameProfiler() if c.PROFILE_FRAMES else NullProfiler()
+    profileName = time.strftime("profile_%Y%m%d_%H%M%S_level{:02d}".format(levelCount % 100))
     c.SCREEN.fill(level.backgroundColor)
-    goldCount = len(c.goldGroup)
+    goldCount = getRemainingGoldCount()
     blitLevelData(playerList, level, goldCount, timeCount)
     pg.display.update()
     pg.mixer.music.load(c.LEVEL_START_MUSIC)
@@ -63,8 +85,7 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
     # There is a delay of 360 frames before the level is playable, to allow the level start music to finish playing.
     while frameCount < 360:
         checkQuitGame()
-        frameCount += 1
-        c.CLOCK.tick(c.FPS)
+        frameCount = min(360, frameCount + scheduler.waitForTicks())
 
     # The event queue is cleared after the delay to ensure that no keys pressed as the level loads take effect
     # afterwards.
@@ -77,67 +98,78 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
     pg.mixer.music.play(-1)
     for num, player in enumerate(playerList):
         player.initialize(48 * level.playerStartPosition[num][0], 49 + 48 * level.playerStartPosition[num][1])
+    if inputLog is not None:
+        inputLog.startLevel()
+
+    # The low time music starts when a TIME_LOW event is published, unless a game over text sprite is onscreen. In
+    # that case, initializeGameOverSprite starts it once the text moves off-screen instead.
+    def playLowTimeMusic(lowTimeCount):
+        """Play the low time music. This is subscribed to TIME_LOW events until the level ends."""
+        if not any(value == c.TextStates.ONSCREEN for value in gameOverTextStates):
+            pg.mixer.music.load(c.LOW_TIME_MUSIC)
+            pg.mixer.music.stop()
+            pg.mixer.music.play(-1)
+
+    eventBus.subscribe(c.GameEvents.TIME_LOW, playLowTimeMusic)
 
     # This loop continues until either all players have run out of lives, or the level is completed.
+    # Each loop runs one tick of game logic. The scheduler decides how many ticks are run before each frame is drawn,
+    # so that the gameplay keeps the same speed even if drawing falls behind. Only the last of those ticks draws.
+    ticksDue = 1
     while True:
-        pausedPlayerNumber = checkPauseGame(pausedPlayerNumber)
-        checkQuitGame()
-        for event in pg.event.get():
-            if event.type == pg.KEYDOWN:
-                for num, player in enumerate(playerList):
-
-                    # Players who have run out of lives cannot pause the game.
-                    # After pausing, the queue is cleared to ensure that no keys pressed while the game prepares to
-                    # pause will take effect while paused.
-                    if event.key == controlsDicts[num]["pause"] and player.playerState != c.PlayerStates.DEAD:
-                        pg.mixer.music.pause()
-                        playSound("pause_unpause.wav")
-                        pausedPlayerNumber = num + 1
-                        pg.time.delay(1000)
-                        pg.event.clear()
-
-                    # If the player presses a direction key while in the BALL state, the move in the direction pressed.
-                    # If they are in an 'active' state, the player's arm is extended.
-                    if event.key in [controlsDicts[num]["up"], controlsDicts[num]["down"],
-                                     controlsDicts[num]["left"], controlsDicts[num]["right"]]:
-                        if player.playerState == c.PlayerStates.BALL:
-                            directionChosen = [key for key, val in controlsDicts[num].items()
-                                               if val == event.key][0]
-                            player.startMoving(directionChosen)
-                        elif player.playerState in [c.PlayerStates.MOVING, c.PlayerStates.SWINGING,
-                                                    c.PlayerStates.FINISHED_SWINGING]:
-                            directionChosen = [key for key, val in controlsDicts[num].items()
-                                               if val == event.key][0]
-                            playerArmList[num].extendArm(directionChosen)
-                    if event.key == controlsDicts[num]["shoot"] and not player.isFrozen:
-                        shootWave(player)
-        heldKeys = pg.key.get_pressed()
-
-        # Every frame, check if each player is pressing any direction keys.
-        # If the player is not and they are in a swinging state, they stop swinging.
-        for num, player in enumerate(playerList):
-            if not any((heldKeys[keyType] for keyType in [controlsDicts[num]["up"],
-                                                          controlsDicts[num]["down"],
-                                                          controlsDicts[num]["left"],
-                                                          controlsDicts[num]["right"]])):
-                playerArmList[num].armState = c.ArmStates.OFF_SCREEN
-
-                # The player's state is set to MOVING if they are still facing the same direction as when they began
-                # swinging.
-                # Otherwise, it is set to FINISHED_SWINGING, so they have a brief period to pass over a black hole
-                # sprite that may be beneath them.
-                if player.playerState in [c.PlayerStates.SWINGING, c.PlayerStates.HITTING_PLAYER_SWINGING]:
-                    if player.facingDirection == player.initialSwingDirection:
-                        player.playerState = c.PlayerStates.MOVING
-                    else:
-                        player.playerState = c.PlayerStates.FINISHED_SWINGING
-                    player.frameCount = 0
-                    player.adjustPosition()
 
-        goldCount = len([gold for gold in c.goldGroup if gold.goldState in [c.OtherStates.UPSIDE_DOWN,
-                                                                            c.OtherStates.FLIPPING_DOWN,
-                                                                            c.OtherStates.DELAYED_DOWN,
-                                                                            c.OtherStates.OFF_SCREEN]])
+        # Time spent paused is not run as ticks once the game is unpaused.
+        if pausedPlayerNumber != 0:
+            pausedPlayerNumber = checkPauseGame(pausedPlayerNumber)
+            scheduler.reset()
+            ticksDue = 1
+        ticksDue -= 1
+        isDrawingTick = ticksDue == 0
+
+        # Each part of the tick is timed by the profiler, which does nothing unless profiling is enabled.
+        profiler.startFrame()
+        with profiler.section("events"):
+            checkQuitGame()
+
+            # The controls each player presses and holds are collected first, then acted on all at once, in the same way
+            # as during a LevelSimulation. This lets the inputs of every tick be recorded and replayed exactly.
+            playerInputs = [([], []) for _ in playerList]
+            for event in pg.event.get():
+                if event.type == pg.KEYDOWN:
+                    for num, player in enumerate(playerList):
+
+                        # Players who have run out of lives cannot pause the game.
+                        # After pausing, the queue is cleared to ensure that no keys pressed while the game prepares to
+                        # pause will take effect while paused.
+                        if event.key == controlsDicts[num]["pause"] and player.playerState != c.PlayerStates.DEAD:
+                            pg.mixer.music.pause()
+                            playSound("pause_unpause.wav")
+                            pausedPlayerNumber = num + 1
+                            ticksDue = 0
+                            playerInputs[num][0].append("pause")
+                            pg.time.delay(1000)
+                            pg.event.clear()
+
+                        # If the player presses a direction key while in the BALL state, the move in the direction
+                        # pressed. If they are in an 'active' state, the player's arm is extended.
+                        if event.key in [controlsDicts[num]["up"], controlsDicts[num]["down"],
+                                         controlsDicts[num]["left"], controlsDicts[num]["right"]]:
+                            directionChosen = [key for key, val in controlsDicts[num].items() if val == event.key][0]
+                            playerInputs[num][0].append(directionChosen)
+                        if event.key == controlsDicts[num]["shoot"]:
+                            playerInputs[num][0].append("shoot")
+
+            # Every frame, check if each player is pressing any direction keys.
+            # If the player is not and they are in a swinging state, they stop swinging.
+            heldKeys = pg.key.get_pressed()
+            for num in range(len(playerList)):
+                playerInputs[num][1].extend(direction for direction in DIRECTION_CONTROLS
+                                            if heldKeys[controlsDicts[num][direction]])
+            applyPlayerInputs(playerList, playerArmList, playerInputs)
+            if inputLog is not None:
+                inputLog.recordFrame(playerInputs)
+
+        goldCount = getRemainingGoldCount()
 
         if pausedPlayerNumber == 0:
 
@@ -146,41 +178,35 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
             # If the current level is a bonus level, standard gameplay instead updates either either all gold sprites
             # have been revealed or the timer reaches 0.
             if goldCount > 0 and ((isinstance(level, BonusLevel) and timeCount > 0) or\
-                                  (not isinstance(level, BonusLevel) and not all(value == c.TextStates.OFF_SCREEN for
-                                                                                 value in gameOverTextStates))):
-                blitLevelData(playerList, level, goldCount, timeCount)
+                                  (not isinstance(level, BonusLevel) and not isGameOver)):
+                if isDrawingTick:
+                    with profiler.section("blitLevelData"):
+                        renderer.startFrame(playerList, level, goldCount, timeCount)
                 if pausedPlayerNumber == 0:
                     GoldSprite.globalFrameCount += 1
-                    for group in c.allGroups:
-                        group.update()
-                        # Sprite coordinates are casted to integers before drawing them to the screen, as player
-                        # sprites' coordinates are measured in sub-pixels.
-                        for sprite in group:
-                            c.SCREEN.blit(sprite.image, (int(sprite.coordinates[0]), int(sprite.coordinates[1])))
+                    for num, group in enumerate(c.allGroups):
+                        with profiler.section(profiler.groupSections[num]):
+                            group.update()
+                        if isDrawingTick:
+                            with profiler.section("draw"):
+                                for sprite in group:
+                                    renderer.drawSprite(sprite)
+                    if isDrawingTick and profiler.image is not None:
+                        renderer.drawSprite(profiler)
 
                     # Every 5 frames, the timer decreases by 1 (To a minimum of 0).
                     # The timer will not decrease if an ItemClock's effect is active.
+                    # A TIME_LOW event is published each time the timer of a regular level drops below 200.
                     if frameCount % 5 == 0 and not UrchinSprite.isFrozen:
                         timeCount = max(0, timeCount - 1)
+                        if timeCount == 199 and not isinstance(level, BonusLevel):
+                            eventBus.publish(c.GameEvents.TIME_LOW, timeCount)
 
-                    # Scoring bonus points from targetTimeCount, playing the low time music, playing the regular music,
-                    # or losing a life from the time reaching 0 all only happen during regular levels.
+                    # Scoring bonus points from targetTimeCount or losing a life from the time reaching 0 only happen
+                    # during regular levels.
                     if not isinstance(level, BonusLevel):
                         if timeCount < targetTimeCount:
                             scoreBonus = False
-                        if timeCount > 200 and playingLowTimeMusic:
-                            playingLowTimeMusic = False
-                            pg.mixer.music.load(c.LEVEL_MUSIC)
-                            pg.mixer.music.stop()
-                            pg.mixer.music.play(-1)
-
-                        # Low time music does not play if any game over text sprites are currently onscreen.
-                        if timeCount < 200 and not any(value == c.TextStates.ONSCREEN for value in gameOverTextStates)\
-                                and not playingLowTimeMusic:
-                            playingLowTimeMusic = True
-                            pg.mixer.music.load(c.LOW_TIME_MUSIC)
-                            pg.mixer.music.stop()
-                            pg.mixer.music.play(-1)
 
                         if timeCount == 0:
                             if not timeReachedZero:
@@ -196,7 +222,8 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
                                         player.playerState = c.PlayerStates.EXPLODING
                                         player.frameCount = 0
 
-                            # After 170 frames, the timer is increased if any players are still alive.
+                            # After 170 frames, the timer is increased if any players are still alive, and the regular
+                            # music plays again.
                             if frameCount == 170 and any(player.playerState != c.PlayerStates.DEAD for player in
                                                          playerList):
                                 timeReachedZero = False
@@ -204,21 +231,23 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
                                 pg.mixer.music.load(c.LEVEL_MUSIC)
                                 pg.mixer.music.play(-1)
 
-                    for num, player in enumerate(playerList):
-                        if player.playerState == c.PlayerStates.DEAD:
-                            gameOverTextStates, frameCount = initializeGameOverSprite(gameOverTextStates, num,
-                                                                                      frameCount, timeCount)
+                    gameOverIndexes = addGameOverIndexes(playerList, gameOverIndexes)
+                    for num in gameOverIndexes:
+                        gameOverTextStates, frameCount = initializeGameOverSprite(gameOverTextStates, num, frameCount,
+                                                                                  timeCount)
+                    if gameOverIndexes:
+                        isGameOver = all(value == c.TextStates.OFF_SCREEN for value in gameOverTextStates)
 
                 # The only game logic that happens while the game is paused is drawing the sprites to the screen in the
                 # same location they were in prior to the game being paused.
-                else:
+                elif isDrawingTick:
                     for group in c.allGroups:
                         for sprite in group:
-                            c.SCREEN.blit(sprite.image, (int(sprite.coordinates[0]), int(sprite.coordinates[1])))
+                            renderer.drawSprite(sprite)
 
             # If all players have run out of lives and their game over text has moved off-screen, the level continues
             # to be animated for 330 frames to let the level end music finish playing, then scrolls off-screen.
-            elif all(value == c.TextStates.OFF_SCREEN for value in gameOverTextStates):
+            elif isGameOver:
                 if not gameOverStarted:
                     pg.mixer.music.load(c.LEVEL_END_MUSIC)
                     pg.mixer.music.stop()
@@ -227,7 +256,6 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
                     frameCount = 0
                 elif frameCount < 330:
                     blitLevelData(playerList, level, goldCount, timeCount, animate=True)
-                    pg.display.update()
                 else:
                     scrollLevelData(playerList, level, goldCount, timeCount, levelCount, highScore)
                     for player in playerList:
@@ -236,6 +264,8 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
                     blitLevelEndData(playerList, level, timeCount, levelCount, highScore, scoreBonus)
                     for player in playerList:
                         player.playerState = c.PlayerStates.DEAD
+                    profiler.finish(profileName)
+                    eventBus.unsubscribe(c.GameEvents.TIME_LOW, playLowTimeMusic)
                     return playerList, highScore
 
             # isFlashing is only set to True once all of the gold sprites are revealed and the level ends.
@@ -252,7 +282,6 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
             elif level.frameCount < 330:
                 level.flashBoard()
                 blitLevelData(playerList, level, 0, timeCount, animate=True)
-                pg.display.update()
             else:
                 scrollLevelData(playerList, level, 0, timeCount, levelCount, highScore)
                 for player in playerList:
@@ -274,9 +303,10 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
                 for player in playerList:
                     if player.lives == 0:
                         player.playerState = c.PlayerStates.DEAD
+                profiler.finish(profileName)
+                eventBus.unsubscribe(c.GameEvents.TIME_LOW, playLowTimeMusic)
                 return playerList, highScore
 
-        pg.display.update()
         frameCount += 1
 
         # All methods that rely on frameCount do so in factors of 56100. To keep frameCount from increasing without
@@ -285,7 +315,45 @@ def playLevel(playerList, playerArmList, level, levelCount, gameOverTextStates,
         # potential safeguard.
         if frameCount % 56100 == 0:
             frameCount = 0
-        c.CLOCK.tick(c.FPS)
+
+        # The end-of-level animations draw directly to the screen instead of through the renderer, so the renderer
+        # updates the whole display for them.
+        if ticksDue == 0:
+            with profiler.section("display"):
+                renderer.updateDisplay()
+        profiler.endFrame()
+        if ticksDue == 0:
+            ticksDue = scheduler.waitForTicks()
+
+
+def getRemainingGoldCount():
+    """Get how many gold sprites on the current level have not yet been revealed.
+
+    Returns:
+        An integer count of the gold sprites in the UPSIDE_DOWN, FLIPPING_DOWN, DELAYED_DOWN or OFF_SCREEN states.
+        This is kept up to date by goldCounters, so the gold sprites are not counted again.
+    """
+    return goldCounters.remainingCount
+
+
+def addGameOverIndexes(playerList, gameOverIndexes):
+    """Add the index of each player in newGameOverPlayers to gameOverIndexes, then empty newGameOverPlayers.
+
+    Players who are not in playerList are ignored, as they belong to a different game.
+
+    Args:
+        playerList: A list of all PlayerSprite objects in the game.
+        gameOverIndexes: A sorted list of the indexes in playerList of the players who have run out of lives.
+
+    Returns:
+        gameOverIndexes: A sorted list of the indexes in playerList of the players who have run out of lives,
+            including those in newGameOverPlayers.
+    """
+    if newGameOverPlayers:
+        gameOverIndexes = sorted(set(gameOverIndexes).union(num for num, player in enumerate(playerList)
+                                                            if player in newGameOverPlayers))
+        newGameOverPlayers.clear()
+    return gameOverIndexes
 
 
 def initializeGameOverSprite(gameOverTextStates, index, frameCount, timeCount):
@@ -346,3 +414,6 @@ def initializeGameOverSprite(gameOverTextStates, index, frameCount, timeCount):
                 pg.mixer.music.load(c.LOW_TIME_MUSIC)
         pg.mixer.music.play()
     return gameOverTextStates, frameCount
+
+
+eventBus.subscribe(c.GameEvents.GAME_OVER, newGameOverPlayers.append)
@@ -5,6 +5,10 @@ from game.sprites.sonic_wave import SonicWaveSprite
 import game.tools.constants as c
 from game.tools.asset_cache import playSound
 from game.tools.controls import controlsDicts
+from game.tools.sprite_pool import getPooledSprite
+
+
+DIRECTION_CONTROLS = ("up", "down", "left", "right")
 
 
 def pauseGame(pausingPlayerIndex):
@@ -62,6 +66,64 @@ def shootWave(player):
                 waveCoordinates = (int(player.coordinates[0] + (48 - player.coordinates[0] % 48)),
                                    int(player.coordinates[1]))
         playSound("shoot_wave.wav")
-        newWave = SonicWaveSprite(player.facingDirection, player.playerNumber)
+        newWave = getPooledSprite(SonicWaveSprite, player.facingDirection, player.playerNumber)
         newWave.setCoordinates(waveCoordinates[0], waveCoordinates[1])
-        c.attackGroup.add(newWave)
+
+
+def pressDirection(player, playerArm, direction):
+    """Act on a player pressing one of their direction buttons.
+
+    If the player is in the BALL state, they begin moving in the direction pressed. If they are in an 'active'
+    state, their arm is extended in that direction.
+
+    Args:
+        player: The PlayerSprite object for the player who pressed the direction button.
+        playerArm: The PlayerArmSprite object belonging to player.
+        direction: A string of the direction pressed. Should only be "up", "down", "left" or "right".
+    """
+    if player.playerState == c.PlayerStates.BALL:
+        player.startMoving(direction)
+    elif player.playerState in [c.PlayerStates.MOVING, c.PlayerStates.SWINGING, c.PlayerStates.FINISHED_SWINGING]:
+        playerArm.extendArm(direction)
+
+
+def releaseDirections(player, playerArm):
+    """Act on a player not holding any of their direction buttons. Retract their arm and stop them from swinging.
+
+    Args:
+        player: The PlayerSprite object for the player who is not holding any direction buttons.
+        playerArm: The PlayerArmSprite object belonging to player.
+    """
+    playerArm.armState = c.ArmStates.OFF_SCREEN
+
+    # The player's state is set to MOVING if they are still facing the same direction as when they began swinging.
+    # Otherwise, it is set to FINISHED_SWINGING, so they have a brief period to pass over a black hole sprite that may
+    # be beneath them.
+    if player.playerState in [c.PlayerStates.SWINGING, c.PlayerStates.HITTING_PLAYER_SWINGING]:
+        if player.facingDirection == player.initialSwingDirection:
+            player.playerState = c.PlayerStates.MOVING
+        else:
+            player.playerState = c.PlayerStates.FINISHED_SWINGING
+        player.frameCount = 0
+        player.adjustPosition()
+
+
+def applyPlayerInputs(playerList, playerArmList, playerInputs):
+    """Act on the control buttons each player pressed and held during one frame of gameplay.
+
+    Args:
+        playerList: A list of all PlayerSprite objects in the game.
+        playerArmList: A list of all PlayerArmSprite objects in the game.
+        playerInputs: A list with one tuple for each player, in the form (pressedControls, heldControls).
+            pressedControls is a list of the names of the controls (Such as "up" or "shoot") that the player
+            pressed this frame, in the order they were pressed. heldControls is a list of the names of the
+            direction controls that the player is holding down this frame.
+    """
+    for player, playerArm, (pressedControls, heldControls) in zip(playerList, playerArmList, playerInputs):
+        for control in pressedControls:
+            if control in DIRECTION_CONTROLS:
+                pressDirection(player, playerArm, control)
+            elif control == "shoot" and not player.isFrozen:
+                shootWave(player)
+        if not any(control in DIRECTION_CONTROLS for control in heldControls):
+            releaseDirections(player, playerArm)
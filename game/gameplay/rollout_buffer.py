@@ -0,0 +1,378 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+import importlib
+import multiprocessing
+from multiprocessing import shared_memory
+import queue
+
+from game.gameplay.environment import ACTIONS
+from game.gameplay.pixel_observation import PixelObserver
+from game.gameplay.vector_environment import getObservationLayout, VectorEnvironment
+
+
+# Each worker seeds its games with SEED_SPACING more than the worker before it, so no two workers play the same game
+# unless one of them plays more than SEED_SPACING games per world.
+SEED_SPACING = 1000000
+
+# Each array in a RolloutBuffer starts at a multiple of BUFFER_ALIGNMENT bytes, so no two arrays share a cache line.
+BUFFER_ALIGNMENT = 64
+
+
+def makeIdleActionPolicy(seed):
+    """Make an action policy where no player ever takes an action.
+
+    Args:
+        seed: An integer to seed the policy's random choices with. Unused by this policy.
+
+    Returns:
+        setIdleActions: A function that is passed a NumPy array of observations, with one row for each game, and a
+            NumPy array of actions to fill in, with one row for each game and one column for each player.
+    """
+
+    def setIdleActions(observations, actions):
+        """Set every player of every game to take the "none" action."""
+        actions[:] = 0
+
+    return setIdleActions
+
+
+def makeRandomActionPolicy(seed):
+    """Make an action policy where every player keeps taking a random action for a random number of frames.
+
+    Each frame, each player has a 5% chance of choosing a new action, so directions are usually held for long enough
+    to swing around a post. The policy uses its own random number generator, so it does not change the game's use of
+    gameRandom.
+
+    Args:
+        seed: An integer to seed the policy's random choices with.
+
+    Returns:
+        setRandomActions: A function that is passed a NumPy array of observations, with one row for each game, and a
+            NumPy array of actions to fill in, with one row for each game and one column for each player.
+    """
+    policyRandom = np.random.default_rng(seed)
+    heldActions = []
+
+    def setRandomActions(observations, actions):
+        """Set each player of each game to take the action they held last frame, or sometimes a new random one."""
+        if not heldActions:
+            heldActions.append(policyRandom.integers(len(ACTIONS), size=actions.shape))
+        isChanging = policyRandom.random(actions.shape) < 0.05
+        heldActions[0][isChanging] = policyRandom.integers(len(ACTIONS), size=int(isChanging.sum()))
+        actions[:] = heldActions[0]
+
+    return setRandomActions
+
+
+# ACTION_POLICIES associates the name of each built-in action policy with the function that makes it.
+# Any other policy can be used by naming it in the form "module.path:functionName", where the function is passed an
+# integer seed and returns an action function, in the same way as those above.
+ACTION_POLICIES = {"idle": makeIdleActionPolicy, "random": makeRandomActionPolicy}
+
+
+def getActionPolicy(policyName, seed):
+    """Make the action policy with the passed name.
+
+    Args:
+        policyName: The string name of a policy in ACTION_POLICIES, or a string in the form "module.path:functionName".
+        seed: An integer to seed the policy's random choices with.
+
+    Returns:
+        An action function, which is passed a NumPy array of observations and fills in a NumPy array of the index in
+        ACTIONS of each player's action in each game.
+    """
+    if policyName in ACTION_POLICIES:
+        return ACTION_POLICIES[policyName](seed)
+    moduleName, _, functionName = policyName.partition(":")
+    return getattr(importlib.import_module(moduleName), functionName)(seed)
+
+
+def getBufferFields(workerCount, capacity, worldsPerWorker, numberOfPlayers, frameShape=None):
+    """Get the name, shape and data type of each array in a RolloutBuffer.
+
+    Every array has a row for each worker, then a row for each slot of that worker's ring, then a row for each of
+    its games.
+
+    Args:
+        workerCount: An integer showing how many worker processes write to the buffer.
+        capacity: An integer showing how many slots each worker's ring holds.
+        worldsPerWorker: An integer showing how many games each worker plays at once.
+        numberOfPlayers: An integer showing how many players play each game.
+        frameShape: A tuple of the shape of each frame, as given by PixelObserver.observationShape. Defaults to
+            None, meaning that no frames are stored.
+
+    Returns:
+        fields: A list of (name, shape, dtype) tuples, one for each array. "states" holds each game's state, laid
+            out as described by getObservationLayout, "actions" the index in ACTIONS of each player's action,
+            "rewards" how many points each player scored, "dones" whether each game ended, and "frames" (If
+            frameShape is not None) each game's frame, as uint8 red, green and blue values or float32 grayscale
+            values.
+    """
+    rowShape = (workerCount, capacity, worldsPerWorker)
+    stateSize = getObservationLayout(numberOfPlayers)["goldVertical"].stop
+    fields = [("states", rowShape + (stateSize,), np.float32),
+              ("actions", rowShape + (numberOfPlayers,), np.int8),
+              ("rewards", rowShape + (numberOfPlayers,), np.float32),
+              ("dones", rowShape, np.bool_)]
+    if frameShape is not None:
+        fields.append(("frames", rowShape + tuple(frameShape), np.uint8 if len(frameShape) == 3 else np.float32))
+    return fields
+
+
+class RolloutBuffer:
+    """Hold the arrays that rollout workers write their games to, in a block of shared memory that every process
+    can read and write without copying.
+
+    The process that creates the buffer owns its memory, and must call unlink once every process has closed it.
+    Other processes attach to the buffer by creating a RolloutBuffer with the same fields and the owner's name.
+    NumPy must be installed to use this class.
+
+    Attributes:
+        fields: The list of (name, shape, dtype) tuples describing each array, as returned by getBufferFields.
+        sharedMemory: The SharedMemory object holding every array.
+        name: The string name of sharedMemory, which other processes use to attach to it.
+        isOwner: A boolean indicating if this process created sharedMemory.
+        arrays: A dict associating the name of each field with a NumPy array viewing its part of sharedMemory.
+    """
+
+    def __init__(self, fields, name=None):
+        """Init RolloutBuffer using the list fields and the string name.
+
+        If name is None, a new block of shared memory is created. Otherwise, the block with that name is attached
+        to.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("RolloutBuffer requires NumPy to be installed.")
+        self.fields = fields
+        offsets = []
+        size = 0
+        for _, shape, dtype in fields:
+            offsets.append(size)
+            size += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+        self.isOwner = name is None
+        self.sharedMemory = shared_memory.SharedMemory(name, self.isOwner, max(size, 1))
+        self.name = self.sharedMemory.name
+        self.arrays = {fieldName: np.ndarray(shape, dtype, self.sharedMemory.buf, offset)
+                       for (fieldName, shape, dtype), offset in zip(fields, offsets)}
+
+    def close(self):
+        """Stop using the shared memory in this process. Every view of the arrays must have been deleted first."""
+        self.arrays = {}
+        self.sharedMemory.close()
+
+    def unlink(self):
+        """Free the shared memory once every process has closed it. Only the owner should call this."""
+        self.sharedMemory.unlink()
+
+
+def acquireSlot(freeSlots, stopEvent):
+    """Wait until a worker's ring has a free slot, or the worker is told to stop.
+
+    Args:
+        freeSlots: The multiprocessing Semaphore counting the free slots of the worker's ring.
+        stopEvent: The multiprocessing Event that is set when the workers should stop.
+
+    Returns:
+        A boolean indicating if a slot was acquired, rather than the worker being told to stop.
+    """
+    while not freeSlots.acquire(timeout=0.1):
+        if stopEvent.is_set():
+            return False
+    return not stopEvent.is_set()
+
+
+def runRolloutWorker(workerIndex, fields, bufferName, settings, freeSlots, readyQueue, stopEvent):
+    """Attach to a RolloutBuffer in a worker process, then play games into the worker's ring of it with
+    fillRolloutRing until the worker is told to stop.
+
+    Args:
+        workerIndex: The integer index of this worker.
+        fields: The list of fields of the RolloutBuffer, as returned by getBufferFields.
+        bufferName: The string name of the RolloutBuffer's shared memory.
+        settings: A dict of the arguments RolloutCollector was made with.
+        freeSlots: The multiprocessing Semaphore counting the free slots of this worker's ring.
+        readyQueue: The multiprocessing Queue that complete slots are announced on.
+        stopEvent: The multiprocessing Event that is set when the workers should stop.
+    """
+    buffer = RolloutBuffer(fields, bufferName)
+    try:
+        fillRolloutRing(workerIndex, buffer, settings, freeSlots, readyQueue, stopEvent)
+    finally:
+        buffer.close()
+
+
+def fillRolloutRing(workerIndex, buffer, settings, freeSlots, readyQueue, stopEvent):
+    """Play games, writing every frame of them into one worker's ring of a RolloutBuffer.
+
+    Slot n of the ring holds the observation of each game before a frame, the actions taken, and the rewards and
+    dones that resulted. The observation after the frame is written to the next slot, which is acquired first.
+    Once slot n is complete, the small tuple (workerIndex, n) is put in readyQueue, and the slot is not written to
+    again until the learner releases it.
+
+    Args:
+        workerIndex: The integer index of the worker.
+        buffer: The RolloutBuffer to write to.
+        settings: A dict of the arguments RolloutCollector was made with.
+        freeSlots: The multiprocessing Semaphore counting the free slots of the worker's ring.
+        readyQueue: The multiprocessing Queue that complete slots are announced on.
+        stopEvent: The multiprocessing Event that is set when the workers should stop.
+    """
+    ring = {name: array[workerIndex] for name, array in buffer.arrays.items()}
+    frames = ring.get("frames")
+    states = ring["states"]
+    observations = frames if frames is not None else states
+    environment = VectorEnvironment(settings["worldsPerWorker"], settings["numberOfPlayers"], settings["maxFrames"],
+                                    frames is not None, settings["isGrayscale"], settings["downsample"])
+    seed = None if settings["seed"] is None else settings["seed"] + SEED_SPACING * workerIndex
+    setActions = getActionPolicy(settings["policy"], seed)
+    capacity = settings["capacity"]
+
+    if not acquireSlot(freeSlots, stopEvent):
+        return
+    slot = 0
+    environment.reset(seed, observations[slot], states[slot] if frames is not None else None)
+    while True:
+        setActions(observations[slot], ring["actions"][slot])
+        nextSlot = (slot + 1) % capacity
+        if not acquireSlot(freeSlots, stopEvent):
+            return
+        environment.step(ring["actions"][slot], observations[nextSlot], ring["rewards"][slot], ring["dones"][slot],
+                         states[nextSlot] if frames is not None else None)
+        readyQueue.put((workerIndex, slot))
+        slot = nextSlot
+
+
+class RolloutCollector:
+    """Play games in several worker processes at once, which write every frame into a shared RolloutBuffer that the
+    learner reads without copying.
+
+    Each worker plays worldsPerWorker games with a VectorEnvironment, choosing actions with an action policy, and
+    writes into its own ring of capacity slots in the buffer. Frames, states, actions, rewards and dones never pass
+    through a pipe. The only messages sent are the (workerIndex, slot) tuple announcing each complete slot, and the
+    learner releasing each slot once it is done with it. A worker whose ring is full waits for the learner, so the
+    learner is never handed a slot that is being overwritten.
+    When a game ends, the next slot holds the first observation of the game that replaced it, as in VectorEnvironment.
+    The game must be running in headless mode (See HEADLESS in constants.py) before this is created, so that the
+    workers inherit it. NumPy must be installed to use this class.
+
+    Attributes:
+        workerCount: An integer showing how many worker processes play games.
+        capacity: An integer showing how many slots each worker's ring holds. This must be at least 2, as a worker
+            writes each frame's observation to the slot after its actions.
+        settings: A dict of the arguments passed to each worker.
+        buffer: The RolloutBuffer that the workers write to.
+        freeSlots: A list of the multiprocessing Semaphore counting the free slots of each worker's ring.
+        readyQueue: The multiprocessing Queue that complete slots are announced on.
+        stopEvent: The multiprocessing Event that tells the workers to stop.
+        processes: A list of each worker's multiprocessing Process object.
+    """
+
+    def __init__(self, workerCount, worldsPerWorker=1, capacity=8, numberOfPlayers=1, maxFrames=None, isPixels=False,
+                 isGrayscale=False, downsample=1, policyName="random", seed=None):
+        """Init RolloutCollector using the integers workerCount, worldsPerWorker, capacity, numberOfPlayers,
+        maxFrames, downsample and seed, the booleans isPixels and isGrayscale, and the string policyName.
+
+        isPixels, isGrayscale and downsample are passed to each VectorEnvironment, and frames are only stored if
+        isPixels is True. policyName is passed to getActionPolicy. Each worker's games are seeded from seed as
+        VectorEnvironment.reset does, with SEED_SPACING between workers.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+            ValueError: If capacity is less than 2.
+        """
+        if np is None:
+            raise RuntimeError("RolloutCollector requires NumPy to be installed.")
+        if capacity < 2:
+            raise ValueError("RolloutCollector needs a capacity of at least 2 slots per worker, not {}.".format(
+                capacity))
+        self.workerCount = workerCount
+        self.capacity = capacity
+        self.settings = {"worldsPerWorker": worldsPerWorker, "numberOfPlayers": numberOfPlayers,
+                         "maxFrames": maxFrames, "isGrayscale": isGrayscale, "downsample": downsample,
+                         "policy": policyName, "seed": seed, "capacity": capacity}
+        frameShape = PixelObserver(isGrayscale, downsample).observationShape if isPixels else None
+        self.buffer = RolloutBuffer(getBufferFields(workerCount, capacity, worldsPerWorker, numberOfPlayers,
+                                                    frameShape))
+        self.freeSlots = [multiprocessing.Semaphore(capacity) for _ in range(workerCount)]
+        self.readyQueue = multiprocessing.Queue()
+        self.stopEvent = multiprocessing.Event()
+        self.processes = [multiprocessing.Process(target=runRolloutWorker, daemon=True,
+                                                  args=(num, self.buffer.fields, self.buffer.name, self.settings,
+                                                        self.freeSlots[num], self.readyQueue, self.stopEvent))
+                          for num in range(workerCount)]
+        for process in self.processes:
+            process.start()
+
+    def getSlot(self, workerIndex, slot):
+        """Get the arrays of one slot of a worker's ring.
+
+        Args:
+            workerIndex: The integer index of the worker.
+            slot: The integer index of the slot in the worker's ring.
+
+        Returns:
+            A dict associating the name of each field of the buffer with a NumPy array viewing that slot, with one
+            row for each of the worker's games. These views share memory with the buffer, so they must not be used
+            after the slot is released.
+        """
+        return {name: array[workerIndex, slot] for name, array in self.buffer.arrays.items()}
+
+    def collect(self, timeout=None):
+        """Wait for the next complete slot from any worker.
+
+        The slot must be passed to release once it has been read. Each worker's slots must be released in the order
+        they were collected, since the worker reuses them in that order.
+
+        Args:
+            timeout: A number of seconds to wait before giving up. Defaults to None, meaning to wait forever.
+
+        Returns:
+            workerIndex: The integer index of the worker that wrote the slot, or None if the timeout ran out.
+            slot: The integer index of the slot in the worker's ring, or None if the timeout ran out.
+            step: The dict of the slot's arrays, as returned by getSlot, or None if the timeout ran out. "frames"
+                and "states" hold the observations before the frame, while the observations after it are in the
+                worker's next slot.
+
+        Raises:
+            RuntimeError: If a worker stopped unexpectedly. close must still be called afterwards, to stop the other
+                workers and free the buffer.
+        """
+        waitTime = 0
+        while True:
+            try:
+                workerIndex, slot = self.readyQueue.get(timeout=0.5)
+                return workerIndex, slot, self.getSlot(workerIndex, slot)
+            except queue.Empty:
+                waitTime += 0.5
+                if not all(process.is_alive() for process in self.processes):
+                    raise RuntimeError("A rollout worker stopped unexpectedly.")
+                if timeout is not None and waitTime >= timeout:
+                    return None, None, None
+
+    def release(self, workerIndex, slot):
+        """Let a worker reuse a slot that has been read.
+
+        Args:
+            workerIndex: The integer index of the worker that wrote the slot.
+            slot: The integer index of the slot in the worker's ring. Unused, since slots are released in order.
+        """
+        self.freeSlots[workerIndex].release()
+
+    def close(self):
+        """Stop every worker, then free the buffer's shared memory. Every step returned by collect must have been
+        deleted first."""
+        self.stopEvent.set()
+        for process in self.processes:
+            process.join(5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self.readyQueue.close()
+        self.readyQueue.cancel_join_thread()
+        self.buffer.close()
+        self.buffer.unlink()
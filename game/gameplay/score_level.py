@@ -1,8 +1,11 @@
 import pygame as pg
 
+from game.gameplay.gold_counters import goldCounters
+from game.gameplay.level import BonusLevel
 from game.gameplay.state import checkQuitGame, checkPauseGameWithInput
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
+from game.tools.text_cache import renderText
 
 
 def scoreLevel(playerList, level, time, highScore, stepToScore=0):
@@ -66,7 +69,7 @@ def scoreLevel(playerList, level, time, highScore, stepToScore=0):
             pg.draw.rect(c.SCREEN, c.BLACK, pg.rect.Rect(coords[0], coords[1], 96, 16))
             c.SCREEN.blit(text, (coords[0], coords[1]))
         pg.draw.rect(c.SCREEN, level.backgroundColor, pg.rect.Rect(317, 224, 96, 16))
-        highScoreText = c.FONT.render("TOP,{:06d}".format(highScore), False, c.WHITE)
+        highScoreText = renderText("TOP,{:06d}".format(highScore))
         c.SCREEN.blit(highScoreText, (254, 224))
         pg.display.update()
         while frameCount < frameCountLimit:
@@ -94,7 +97,7 @@ def scoreTime(playerList, level, time, highScore):
         highScore: An integer showing the current high score.
     """
     scoreText = []
-    timeText = c.FONT.render("TIME,{:03d}".format(time), False, c.WHITE)
+    timeText = renderText("TIME,{:03d}".format(time))
     checkQuitGame()
     checkPauseGameWithInput(playerList)
 
@@ -102,7 +105,7 @@ def scoreTime(playerList, level, time, highScore):
     for player in playerList:
         if player.lives > 0:
             player.score += 10
-        scoreText.append(c.FONT.render("{:06d}PTS.".format(player.score % 1000000), False, c.WHITE))
+        scoreText.append(renderText("{:06d}PTS.".format(player.score % 1000000)))
     highScore = compareHighScore(playerList, highScore)
 
     # The time remaining decreases by 10 counts each time this function is called.
@@ -152,8 +155,8 @@ def scoreUrchins(playerList, iconCount, highScore):
         if player.killedUrchinCount > iconCount[num]:
             player.score += 500
             iconCount[num] += 1
-        scoreText.append(c.FONT.render("{:06d}PTS.".format(player.score % 1000000), False, c.WHITE))
-        iconCountText.append(c.FONT.render("+{:02d}".format(iconCount[num] % 100), False, c.WHITE))
+        scoreText.append(renderText("{:06d}PTS.".format(player.score % 1000000)))
+        iconCountText.append(renderText("+{:02d}".format(iconCount[num] % 100)))
     highScore = compareHighScore(playerList, highScore)
 
     # Once iconCount has reached the correct number of killed enemies for each player, looping is set to False so
@@ -194,8 +197,8 @@ def scoreGold(playerList, iconCount, highScore):
         if player.goldCollectedCount > iconCount[num]:
             player.score += 100
             iconCount[num] += 1
-        scoreText.append(c.FONT.render("{:06d}PTS.".format(player.score % 1000000), False, c.WHITE))
-        iconCountText.append(c.FONT.render("+{:02d}".format(iconCount[num] % 100), False, c.WHITE))
+        scoreText.append(renderText("{:06d}PTS.".format(player.score % 1000000)))
+        iconCountText.append(renderText("+{:02d}".format(iconCount[num] % 100)))
     highScore = compareHighScore(playerList, highScore)
 
     # Once iconCount has reached the correct number of collected gold for each player, looping is set to False so
@@ -231,6 +234,73 @@ def checkIfScoresBonusPoints(playerList, scoreBonus):
     return False, 0
 
 
+def checkLevelEndBonuses(playerList, level, scoreBonus):
+    """Checks which of the end-of-level bonuses should be awarded.
+
+    Args:
+        playerList: A list of all PlayerSprite objects in the game.
+        level: A Level object representing the current level being played.
+        scoreBonus: A boolean indicating if the level has been completed within 300 counts of the timer.
+
+    Returns:
+        doesScoreBonus: A boolean indicating if the bonus points should be awarded for this level.
+        bonusScoringIndex: An integer indicating which player should score the bonus points.
+        doesScoreBonusCompletion: A boolean indicating if the bonus level completion points should be awarded.
+    """
+
+    # Standard bonus points cannot be scored during a bonus level in a one-player game.
+    if isinstance(level, BonusLevel) and len(playerList) == 1:
+        doesScoreBonus, bonusScoringIndex = False, 0
+    else:
+        doesScoreBonus, bonusScoringIndex = checkIfScoresBonusPoints(playerList, scoreBonus)
+
+    # The bonus completion points are only earned if the players collect all 66 gold bars on the bonus stage.
+    if isinstance(level, BonusLevel) and goldCounters.collectedCount == 66:
+        doesScoreBonusCompletion = True
+    else:
+        doesScoreBonusCompletion = False
+    return doesScoreBonus, bonusScoringIndex, doesScoreBonusCompletion
+
+
+def scoreLevelInstantly(playerList, level, time, highScore, scoreBonus):
+    """Increase the players' scores at the end of the level by the same amounts as blitLevelEndData, without
+    drawing or animating anything.
+
+    Args:
+        playerList: A list of all PlayerSprite objects in the game.
+        level: A Level object representing the current level being played.
+        time: An integer representing the time the players have remaining after completing the current level.
+        highScore: An integer showing the current high score.
+        scoreBonus: A boolean indicating if the level has been completed within 300 counts of the timer.
+
+    Returns:
+        highScore: An integer showing the current high score.
+    """
+
+    # If none of the players have any lives remaining, nothing is scored.
+    if not any(player.lives > 0 for player in playerList):
+        return highScore
+    doesScoreBonus, bonusScoringIndex, doesScoreBonusCompletion = checkLevelEndBonuses(playerList, level, scoreBonus)
+
+    # scoreTime awards living players 10 points each time it is called, and it is called once for every 10 counts of
+    # time remaining (rounded down), or once if there are less than 10 counts remaining.
+    # Urchins are not scored during bonus levels, as there are no enemies to score.
+    timeScore = 10 * max(1, time // 10) if time > 0 else 0
+    for player in playerList:
+        if player.lives > 0:
+            player.score += timeScore
+        if not isinstance(level, BonusLevel):
+            player.score += 500 * player.killedUrchinCount
+        player.score += 100 * player.goldCollectedCount
+    if doesScoreBonus:
+        playerList[bonusScoringIndex].score += 2000
+    if doesScoreBonusCompletion:
+        for player in playerList:
+            if player.lives > 0:
+                player.score += 3000
+    return compareHighScore(playerList, highScore)
+
+
 def compareHighScore(playerList, highScore):
     """Compare the players' current scores with the stored high score.
 
@@ -1,51 +1,108 @@
+from game.gameplay.gold_counters import goldCounters
+from game.gameplay.gold_engine import startGoldEngine
 from game.gameplay.level import BonusLevel
+from game.gameplay.navigation_grid import navigationGrid
 from game.sprites.black_hole import BlackHoleSprite
 from game.sprites.gold import GoldSprite
 from game.sprites.item import initializeLevelItems
 from game.sprites.player import PlayerSprite
+from game.sprites.sonic_wave import SonicWaveSprite
 from game.sprites.trap import RubberTrapSprite
+from game.sprites.urchin import UrchinSprite
+from game.tools.asset_cache import getImage, loadSound
 import game.tools.constants as c
+from game.tools.prefetch import checkPrefetchErrors, prefetch
+from game.tools.sprite_pool import getPooledSprite, releaseGroup
+
+
+# levelSpriteSheets and levelSounds include every sprite sheet and sound that can be used during any level's gameplay
+# or end-of-level animations, aside from the players' sprite sheets and the gold sprite sheets.
+levelSpriteSheets = ("hole.png", "urchin.png", "trap.png", "item.png", "wave.png", "display.png")
+levelSounds = ("bounce_rubber_or_player.wav", "bounce_wall.wav", "count_points.wav", "crush_enemy.wav", "death.wav",
+               "earn_bonus.wav", "grab_post_move_end.wav", "item_appears_or_collected.wav", "move_out_of_ball.wav",
+               "pass_over_gold.wav", "pause_unpause.wav", "push_or_shoot_enemy.wav", "shoot_wave.wav")
+
+
+def setGameConstants():
+    """Reset the class variables that could otherwise carry over from a previous game.
+
+    This should be called at the start of every game, so that a game plays out the same way no matter which games
+    were played before it.
+    """
+    UrchinSprite.isFrozen = False
+    GoldSprite.globalFrameCount = 0
+
+
+def prefetchLevel(level):
+    """Load the images and sounds that the level uses on the prefetch thread, so that setLevelSprites and the
+    level's first frames do not have to wait for them to load.
+
+    The sprites themselves are still created by setLevelSprites, as creating a sprite adds it to a sprite group,
+    which is only safe to do on the main thread.
+    Assets that are already loaded are skipped almost instantly, so this can be called for every level.
+
+    Args:
+        level: A Level object representing a level that will be played soon.
+    """
+    prefetch(level.loadImages)
+    goldSpriteSheet = "gold_bonus.png" if isinstance(level, BonusLevel) else "gold.png"
+    for spriteSheet in (goldSpriteSheet,) + levelSpriteSheets:
+        prefetch(getImage, c.SPRITE_SHEET_FOLDER, spriteSheet)
+    if not c.HEADLESS:
+        for sound in levelSounds:
+            prefetch(loadSound, sound)
 
 
 def setLevelSprites(level):
     """Prepare the sprites for the level. Remove all leftover sprites from the previous level and set the
     coordinates of the item sprites, gold sprites, rubber trap sprites, and black hole sprites for the level
     being played.
+    If the prefetch thread failed to load any asset, the game is closed here instead, on the main thread.
 
     Args:
         level: A Level object representing the current level being played.
     """
+    checkPrefetchErrors()
     for group in c.oneLevelOnlyGroups:
-        group.empty()
+        releaseGroup(group)
+    for grid in c.oneLevelOnlyGrids:
+        grid.clear()
+    goldCounters.resetCollectedCounts()
 
     level.initialize()
     initializeLevelItems(level)
+    # Urchins and sonic waves are only created partway through a level, so their images and the rotations and flips
+    # of them are loaded here, before the level's first frame.
+    UrchinSprite.loadImages()
+    SonicWaveSprite.loadImages()
     goldList = []
     rubberList = []
     for (x, y) in level.goldTilesVertical:
-        goldList.append(GoldSprite())
+        goldList.append(getPooledSprite(GoldSprite))
         goldList[-1].setCoordinates(-25 + 48 * x, 49 + 48 * y)
     for (x, y) in level.goldTilesHorizontal:
-        goldList.append(GoldSprite())
+        goldList.append(getPooledSprite(GoldSprite))
         goldList[-1].isHorizontal = True
         goldList[-1].setCoordinates(-1 + 48 * x, 25 + 48 * y)
     for (x, y) in level.rubberTilesVertical:
-        rubberList.append(RubberTrapSprite())
+        rubberList.append(getPooledSprite(RubberTrapSprite))
         rubberList[-1].setCoordinates(-36 + 48 * x, 36 + 48 * y)
     for (x, y) in level.rubberTilesHorizontal:
-        rubberList.append(RubberTrapSprite())
+        rubberList.append(getPooledSprite(RubberTrapSprite))
         rubberList[-1].isHorizontal = True
         rubberList[-1].setCoordinates(-14 + 48 * x, 14 + 48 * y)
     for (x, y) in level.activeRubberTraps:
-        rubberList.append(RubberTrapSprite())
+        rubberList.append(getPooledSprite(RubberTrapSprite))
         rubberList[-1].isHorizontal = True
         rubberList[-1].trapState = c.OtherStates.REVEALED
         rubberList[-1].setCoordinates(-14 + 48 * x, 14 + 48 * y)
         rubberList[-1].update()
+    navigationGrid.reset(level)
     BlackHoleSprite.reset()
     c.blackHoleGroup.add(BlackHoleSprite() for _ in range(len(level.blackHolePositions)))
     for (x, y), hole in zip(level.blackHolePositions, c.blackHoleGroup):
         hole.initialize(-1 + 48 * x, 49 + 48 * y)
+    startGoldEngine()
 
 
 def setLevelTime(level, levelCount):
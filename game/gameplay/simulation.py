@@ -0,0 +1,318 @@
+from game.gameplay.level import BonusLevel, getLevelName, getLevelOrder
+from game.gameplay.play_level import addGameOverIndexes, getRemainingGoldCount, initializeGameOverSprite
+from game.gameplay.player_actions import applyPlayerInputs
+from game.gameplay.score_level import scoreLevelInstantly
+from game.gameplay.setup_level import setGameConstants, setLevelConstants, setLevelSprites, setLevelTime
+from game.sprites.gold import GoldSprite
+from game.sprites.player import PlayerSprite
+from game.sprites.player_arm import PlayerArmSprite
+from game.sprites.urchin import UrchinSprite
+import game.tools.constants as c
+from game.tools.event_bus import eventBus
+from game.tools.game_random import seedGame
+from game.tools.sprite_pool import releaseGroup
+
+
+class LevelSimulation:
+    """Run the gameplay logic of a single level one frame at a time, without drawing anything, playing any music
+    or waiting on the clock.
+
+    Each call to step runs the same logic as one frame of the playLevel loop. Because the players' inputs are
+    passed to step instead of being read from the event queue, a level can be simulated as fast as the CPU allows,
+    and with any inputs desired. This is best used with the game in headless mode (See HEADLESS in constants.py).
+    The start-of-level delay, pausing, and the end-of-level animations are all skipped. The end-of-level points
+    are still scored.
+
+    Attributes:
+        playerList: A list of all PlayerSprite objects in the game.
+        playerArmList: A list of all PlayerArmSprite objects in the game.
+        level: A Level object representing the current level being played.
+        levelCount: An integer storing the current number of levels played this game.
+        gameOverTextStates: A list of four TextStates Enum instances, representing whether the gameOverTextSprite
+            instances have been created for the player corresponding to that index.
+        highScore: An integer showing the current high score.
+        profiler: A FrameProfiler object that times the update of each group in the same sections as playLevel, or
+            None if nothing is timed. The profiler's startFrame and endFrame methods are left to the caller, so
+            that anything else done each frame (Such as drawing) can be timed along with the step.
+    """
+
+    def __init__(self, playerList, playerArmList, level, levelCount, gameOverTextStates, highScore=0, profiler=None):
+        """Init LevelSimulation using the lists playerList, playerArmList, and gameOverTextStates, the Level object
+        level, the integers levelCount and highScore, and the FrameProfiler object profiler.
+
+        This prepares the sprites of the level in the same way as the start of playLevel.
+
+        Instance variables:
+            frameCount: An integer that increases by 1 every frame of gameplay.
+                Used to control when the timer should decrease.
+            timeCount: An integer representing the time the players have remaining to complete the level.
+            targetTimeCount: An integer representing the time the level must be completed by to score bonus
+                points.
+            goldCount: An integer representing how many gold sprites are currently unrevealed.
+            scoreBonus: A boolean indicating if the level has been completed within 300 counts of the timer.
+            timeReachedZero: A boolean indicating if the timer has already reached 0, so it only kills all players
+                once at that point.
+            isFinished: A boolean indicating if the level has ended.
+            gameOverIndexes: A sorted list of the indexes in playerList of the players who have run out of lives.
+                Players who run out of lives during the level are added to it from their GAME_OVER events.
+            isGameOver: A boolean indicating if every player has run out of lives and their game over text has
+                moved off-screen.
+            isCleared: A boolean indicating if the level ended with every gold sprite revealed.
+            stepCount: An integer count of how many frames have been run.
+        """
+        self.playerList = playerList
+        self.playerArmList = playerArmList
+        self.level = level
+        self.levelCount = levelCount
+        self.gameOverTextStates = gameOverTextStates
+        self.highScore = highScore
+        self.profiler = profiler
+
+        PlayerSprite.currentLevel = level
+        setLevelSprites(level)
+        setLevelConstants(levelCount)
+        self.timeCount = setLevelTime(level, levelCount)
+        self.targetTimeCount = max(1, self.timeCount - 300)
+        self.frameCount = 0
+        self.goldCount = getRemainingGoldCount()
+        self.scoreBonus = True
+        self.timeReachedZero = self.isFinished = self.isCleared = False
+        self.stepCount = 0
+
+        for index, value in enumerate(gameOverTextStates):
+            if value == c.TextStates.ONSCREEN:
+                gameOverTextStates[index] = c.TextStates.OFF_SCREEN
+        self.gameOverIndexes = [num for num, player in enumerate(playerList)
+                                if player.playerState == c.PlayerStates.DEAD]
+        self.isGameOver = all(value == c.TextStates.OFF_SCREEN for value in gameOverTextStates)
+        for num, player in enumerate(playerList):
+            player.initialize(48 * level.playerStartPosition[num][0], 49 + 48 * level.playerStartPosition[num][1])
+
+    def step(self, playerInputs=None):
+        """Run one frame of the level's gameplay logic.
+
+        Args:
+            playerInputs: A list with one tuple for each player, in the form (pressedControls, heldControls), as
+                used by applyPlayerInputs.
+                If any player who has not run out of lives presses "pause", this frame is skipped, as playLevel
+                does when the game is paused.
+                Defaults to None, meaning that no player presses or holds anything.
+
+        Returns:
+            isFinished: A boolean indicating if the level has ended.
+        """
+        if self.isFinished:
+            return True
+        if playerInputs is None:
+            playerInputs = [((), ()) for _ in self.playerList]
+
+        isPaused = any("pause" in pressedControls and player.playerState != c.PlayerStates.DEAD
+                       for player, (pressedControls, _) in zip(self.playerList, playerInputs))
+        applyPlayerInputs(self.playerList, self.playerArmList, playerInputs)
+
+        self.goldCount = getRemainingGoldCount()
+        if not isPaused:
+            self.updateLevel()
+
+        self.frameCount += 1
+        self.stepCount += 1
+        if self.frameCount % 56100 == 0:
+            self.frameCount = 0
+        return self.isFinished
+
+    def updateLevel(self):
+        """Update every sprite and the timer, or end the level if all gold has been revealed or all players have
+        received a game over.
+        """
+        isBonusLevel = isinstance(self.level, BonusLevel)
+        if self.goldCount > 0 and ((isBonusLevel and self.timeCount > 0) or (not isBonusLevel and not self.isGameOver)):
+            GoldSprite.globalFrameCount += 1
+            for num, group in enumerate(c.allGroups):
+                if self.profiler is not None:
+                    self.profiler.begin(self.profiler.groupSections[num])
+                group.update()
+                if self.profiler is not None:
+                    self.profiler.end(self.profiler.groupSections[num])
+            self.updateTime()
+            self.gameOverIndexes = addGameOverIndexes(self.playerList, self.gameOverIndexes)
+            for num in self.gameOverIndexes:
+                self.gameOverTextStates, self.frameCount = initializeGameOverSprite(self.gameOverTextStates, num,
+                                                                                   self.frameCount, self.timeCount)
+            if self.gameOverIndexes:
+                self.isGameOver = all(value == c.TextStates.OFF_SCREEN for value in self.gameOverTextStates)
+        else:
+            self.finishLevel()
+
+    def updateTime(self):
+        """Count down the timer, publishing a TIME_LOW event if it drops below 200 and killing all players
+        onscreen if it reaches 0, in the same way as playLevel."""
+        isBonusLevel = isinstance(self.level, BonusLevel)
+        if self.frameCount % 5 == 0 and not UrchinSprite.isFrozen:
+            self.timeCount = max(0, self.timeCount - 1)
+            if self.timeCount == 199 and not isBonusLevel:
+                eventBus.publish(c.GameEvents.TIME_LOW, self.timeCount)
+        if isBonusLevel:
+            return
+        if self.timeCount < self.targetTimeCount:
+            self.scoreBonus = False
+        if self.timeCount == 0:
+            if not self.timeReachedZero:
+                self.frameCount = 0
+                self.timeReachedZero = True
+                for player in self.playerList:
+                    if player.playerState not in [c.PlayerStates.DEAD, c.PlayerStates.OFF_SCREEN,
+                                                  c.PlayerStates.FALLING, c.PlayerStates.EXPLODING]:
+                        player.playerState = c.PlayerStates.EXPLODING
+                        player.frameCount = 0
+
+            # After 170 frames, the timer is increased if any players are still alive.
+            if self.frameCount == 170 and any(player.playerState != c.PlayerStates.DEAD for player in
+                                              self.playerList):
+                self.timeReachedZero = False
+                self.timeCount = 400
+
+    def finishLevel(self):
+        """End the level, setting the players' states and lives and scoring their points as playLevel would after
+        the end-of-level animations."""
+        self.isFinished = True
+        if self.isGameOver:
+            for player in self.playerList:
+                player.frameCount = 0
+                player.playerState = c.PlayerStates.DEAD
+            return
+
+        # Players who were not in the DEAD state gain a life as the level ends.
+        self.isCleared = self.goldCount == 0
+        for player in self.playerList:
+            player.frameCount = 0
+            if player.playerState != c.PlayerStates.DEAD:
+                player.lives += 1
+            player.playerState = c.PlayerStates.LEVEL_END
+        self.highScore = scoreLevelInstantly(self.playerList, self.level, self.timeCount, self.highScore,
+                                             self.scoreBonus)
+        for player in self.playerList:
+            if player.lives == 0:
+                player.playerState = c.PlayerStates.DEAD
+
+    def run(self, inputFunction=None, maxFrames=None):
+        """Step the level until it ends, or until maxFrames frames have been run.
+
+        Args:
+            inputFunction: A function that is passed this LevelSimulation object every frame, and returns the
+                playerInputs to pass to step. Defaults to None, meaning that no player presses or holds anything.
+            maxFrames: An integer limit on how many frames to run. Defaults to None, meaning there is no limit.
+
+        Returns:
+            isFinished: A boolean indicating if the level has ended.
+        """
+        lastFrame = None if maxFrames is None else self.stepCount + maxFrames
+        while not self.isFinished and (lastFrame is None or self.stepCount < lastFrame):
+            self.step(inputFunction(self) if inputFunction is not None else None)
+        return self.isFinished
+
+
+def startSimulatedGame(numberOfPlayers=1, seed=None):
+    """Prepare a new game to be simulated, in the same way as startGame.
+
+    Args:
+        numberOfPlayers: An integer showing how many players will play the game.
+        seed: An integer to seed gameRandom with. Defaults to None, meaning that a new seed is chosen at random.
+
+    Returns:
+        playerList: A list of all PlayerSprite objects in the game.
+        playerArmList: A list of all PlayerArmSprite objects in the game.
+        gameOverTextStates: A list of TextStates Enum instances, one for each player.
+    """
+    for group in c.allGroups:
+        if group is not c.itemGroup:
+            releaseGroup(group)
+    c.playerGrid.clear()
+    seedGame(seed)
+    setGameConstants()
+    playerList = [PlayerSprite(num + 1) for num in range(numberOfPlayers)]
+    playerArmList = [PlayerArmSprite(player) for player in playerList]
+    gameOverTextStates = [c.TextStates.NOT_REVEALED for _ in range(numberOfPlayers)]
+    return playerList, playerArmList, gameOverTextStates
+
+
+def getLevelResult(simulation):
+    """Get a summary of how a simulated level went.
+
+    Args:
+        simulation: The LevelSimulation object of the level.
+
+    Returns:
+        A dict holding the level's name, as returned by getLevelName, its levelCount, whether it was cleared, how
+        many frames it ran for, and each player's score and lives at the end of it.
+    """
+    return {"level": getLevelName(simulation.level), "levelCount": simulation.levelCount,
+            "cleared": simulation.isCleared, "frames": simulation.stepCount,
+            "scores": [player.score for player in simulation.playerList],
+            "lives": [player.lives for player in simulation.playerList]}
+
+
+def simulateGame(numberOfPlayers=1, inputFunction=None, maxLevels=None, maxFramesPerLevel=None, highScore=0,
+                 seed=None):
+    """Simulate a full game in the same way as startGame, until all players have run out of lives.
+
+    Args:
+        numberOfPlayers: An integer showing how many players will play the game.
+        inputFunction: A function that is passed the current LevelSimulation object every frame, and returns the
+            playerInputs to pass to its step method. Defaults to None, meaning that no player presses anything.
+        maxLevels: An integer limit on how many levels to play. Defaults to None, meaning there is no limit.
+        maxFramesPerLevel: An integer limit on how many frames to run each level for. If a level is not finished
+            after this many frames, the game ends. Defaults to None, meaning there is no limit.
+        highScore: An integer showing the current high score.
+        seed: An integer to seed gameRandom with. Defaults to None, meaning that a new seed is chosen at random.
+
+    Returns:
+        results: A list with one dict for each level played, as returned by getLevelResult.
+    """
+    playerList, playerArmList, gameOverTextStates = startSimulatedGame(numberOfPlayers, seed)
+    levelOrder = getLevelOrder()
+    levelIndex = 0
+    levelCount = 1
+    results = []
+
+    while any(player.playerState != c.PlayerStates.DEAD for player in playerList):
+        if maxLevels is not None and levelCount > maxLevels:
+            break
+        simulation = LevelSimulation(playerList, playerArmList, levelOrder[levelIndex], levelCount,
+                                     gameOverTextStates, highScore)
+        simulation.run(inputFunction, maxFramesPerLevel)
+        highScore = simulation.highScore
+        results.append(getLevelResult(simulation))
+        if not simulation.isFinished:
+            break
+        levelCount += 1
+        levelIndex += 1
+        if levelIndex == len(levelOrder):
+            levelIndex = 1
+    return results
+
+
+def replayGame(inputLog):
+    """Simulate a game recorded in an input log, using the same seed and the same inputs every frame.
+
+    If the game was closed partway through its last level, that level continues with no inputs after the
+    recorded ones run out.
+
+    Args:
+        inputLog: An InputLog object holding the seed and inputs of the game to replay.
+
+    Returns:
+        results: A list with one dict for each level played, as returned by simulateGame.
+    """
+    levelInputs = {}
+
+    def getRecordedInputs(simulation):
+        """Get the recorded playerInputs for the current frame of the simulation."""
+        if simulation.levelCount not in levelInputs:
+            levelInputs[simulation.levelCount] = inputLog.getLevelInputs(simulation.levelCount - 1)
+        frameInputs = levelInputs[simulation.levelCount]
+        if simulation.stepCount < len(frameInputs):
+            return frameInputs[simulation.stepCount]
+        return None
+
+    return simulateGame(inputLog.numberOfPlayers, getRecordedInputs, maxLevels=len(inputLog.levels),
+                        seed=inputLog.seed)
@@ -0,0 +1,265 @@
+from operator import attrgetter
+import pygame as pg
+
+from game.gameplay.gold_counters import goldCounters
+from game.gameplay.navigation_grid import navigationGrid
+from game.gameplay.world import classVariableNames, getActiveWorld, levelStateNames, worldGridNames, worldGroupNames
+import game.tools.constants as c
+from game.tools.game_random import gameRandom
+from game.tools.sprite_pool import getSpritePools
+
+
+# snapshotGroupNames lists the names of the groups in constants.py whose sprites are stored in each snapshot.
+snapshotGroupNames = worldGroupNames + ("itemGroup",)
+
+# The engine's arrays are copied by name, as the engine replaces some of them every step instead of changing them.
+goldEngineArrayNames = ("states", "frameCounts", "animationCounts", "directionSteps", "alreadyRevealed",
+                        "imageIndices")
+
+# pygame stores the groups a sprite is in under this name in the sprite's __dict__. It is left out of each sprite's
+# state, as group membership is stored separately.
+SPRITE_GROUPS_NAME = "_Sprite__g"
+
+_stateLayouts = {}
+
+
+def makeGetter(names):
+    """Make a function that gets the values of the named attributes of an object, all in one call.
+
+    Args:
+        names: A tuple of the string names of the attributes.
+
+    Returns:
+        A function that is passed an object and returns a tuple of the values of its attributes in names.
+    """
+    if not names:
+        return lambda gameObject: ()
+    if len(names) == 1:
+        getValue = attrgetter(names[0])
+        return lambda gameObject: (getValue(gameObject),)
+    return attrgetter(*names)
+
+
+def getStateLayout(spriteClass):
+    """Get the names of the slots that hold the state of every sprite of a class.
+
+    The names are split into those of Rect objects, which are the only values a sprite changes in place and so must
+    be copied, and those of every other value. Every Rect a sprite holds is named rect or has a name ending in Rect.
+
+    Args:
+        spriteClass: The sprite class to get the slot names of.
+
+    Returns:
+        layout: A (plainNames, rectNames, getPlainValues, getRectValues) tuple of the names of every slot in the
+            __slots__ of spriteClass and its base classes that do not and do hold Rect objects, and the functions
+            made by makeGetter that get their values.
+    """
+    layout = _stateLayouts.get(spriteClass)
+    if layout is None:
+        names = tuple(name for baseClass in spriteClass.__mro__ for name in baseClass.__dict__.get("__slots__", ())
+                      if name not in ("__dict__", "__weakref__"))
+        plainNames = tuple(name for name in names if name != "rect" and not name.endswith("Rect"))
+        rectNames = tuple(name for name in names if name not in plainNames)
+        layout = _stateLayouts[spriteClass] = (plainNames, rectNames, makeGetter(plainNames), makeGetter(rectNames))
+    return layout
+
+
+def getSpriteState(sprite):
+    """Get the state of a sprite as a value that does not change when the sprite does.
+
+    Args:
+        sprite: The sprite to get the state of.
+
+    Returns:
+        A (sprite, plainValues, rectValues, dictItems) tuple, holding the values of the slots named in the sprite's
+        layout from getStateLayout, with each Rect copied, and the (name, value) pairs of its __dict__ aside from its
+        groups. Slots that were never set are stored as None.
+    """
+    plainNames, rectNames, getPlainValues, getRectValues = getStateLayout(type(sprite))
+    try:
+        plainValues = getPlainValues(sprite)
+        rectValues = tuple(rect.copy() for rect in getRectValues(sprite))
+    except AttributeError:
+        plainValues = tuple(getattr(sprite, name, None) for name in plainNames)
+        rectValues = tuple(copyValue(getattr(sprite, name, None)) for name in rectNames)
+    spriteDict = vars(sprite)
+    # The __dict__ of a sprite whose class defines __slots__ holds nothing but its groups.
+    dictItems = () if len(spriteDict) == 1 else\
+        tuple((name, copyValue(value)) for name, value in spriteDict.items() if name != SPRITE_GROUPS_NAME)
+    return sprite, plainValues, rectValues, dictItems
+
+
+def setSpriteState(sprite, plainValues, rectValues, dictItems):
+    """Put a sprite back into a state returned by getSpriteState, copying each Rect so the state is never changed.
+
+    Args:
+        sprite: The sprite whose state was stored.
+        plainValues: The tuple of the values of the slots that do not hold Rect objects.
+        rectValues: The tuple of the Rect objects held by the sprite's other slots.
+        dictItems: The tuple of the (name, value) pairs of the sprite's __dict__.
+    """
+    plainNames, rectNames, _, _ = getStateLayout(type(sprite))
+    for name, value in zip(plainNames, plainValues):
+        setattr(sprite, name, value)
+    for name, value in zip(rectNames, rectValues):
+        setattr(sprite, name, copyValue(value))
+    for name, value in dictItems:
+        setattr(sprite, name, copyValue(value))
+
+
+def storeValue(value):
+    """Turn a value into one that can be stored in a snapshot without being changed afterwards.
+
+    Args:
+        value: Any value held by a class variable or a LevelSimulation object.
+
+    Returns:
+        A (value, isList) tuple, where lists are turned into tuples and isList records that they were.
+    """
+    if type(value) is list:
+        return tuple(value), True
+    return value, False
+
+
+def copyValue(value):
+    """Copy a value if it is a Rect object, the only mutable type a sprite changes in place.
+
+    Args:
+        value: Any value held by a sprite.
+
+    Returns:
+        A copy of value if it is a Rect object, or else value itself.
+    """
+    return value.copy() if type(value) is pg.Rect else value
+
+
+class GameSnapshot:
+    """Store the complete state of the active world's current level, so that it can be restored any number of times
+    to continue exactly as it would have from that frame.
+
+    A snapshot holds the value of every attribute of every sprite in snapshotGroupNames, along with which groups each
+    sprite is in, which sprites are free in each sprite pool, a copy of each spatial grid and of the gold engine's
+    arrays, the class variables in classVariableNames, the state of gameRandom, goldCounters and navigationGrid, and
+    the attributes of the LevelSimulation object and the attributes in levelStateNames of its level. Images and
+    other Surface objects are never copied, as the sprites only ever replace them rather than drawing to them, so the
+    snapshot keeps a reference to each one. Rects are the only values the sprites change in place, so they are the
+    only values copied.
+    Sprites are restored into the same objects they were taken from, so anything that holds a reference to a sprite
+    still holds the same sprite afterwards. A snapshot can only be restored while the world it was taken in is
+    active.
+
+    Attributes:
+        world: The GameWorld object that was active when the snapshot was taken.
+        simulation: The LevelSimulation object the snapshot was taken of.
+        simulationState: A tuple of (name, value, isList) tuples of the simulation's attributes, as made by
+            storeValue.
+        spriteStates: A tuple of the state of each sprite, as returned by getSpriteState.
+        groupMembers: A tuple of the sprites in each group in snapshotGroupNames, in the order they were added.
+        poolMembers: A dict associating each pooled sprite class with a tuple of the free sprites in its pool.
+        gridStates: A tuple of (tiles, objectTiles, objectOrder, insertCount) tuples, one for each spatial grid in
+            worldGridNames.
+        engineState: A tuple of the GoldEngine object updating goldGroup and a copy of each array named in
+            goldEngineArrayNames, or None if goldGroup had no engine.
+        classVariables: A tuple of (spriteClass, name, value, isList) tuples of each class variable in
+            classVariableNames, as made by storeValue.
+        randomState: The state of gameRandom, as returned by its getstate method.
+        navigationState: A tuple of the level, borderEdges and tileEdges of navigationGrid.
+        counterState: A tuple of the hiddenCount, faceUpCount, upsideDownCount and collectedCounts of goldCounters.
+        levelState: A tuple of the values of the simulation's level's attributes in levelStateNames.
+        extraState: Any other value stored along with the snapshot by its caller, such as the state of a
+            GameEnvironment, or None.
+    """
+
+    __slots__ = ("world", "simulation", "simulationState", "spriteStates", "groupMembers", "poolMembers", "gridStates",
+                 "engineState", "classVariables", "randomState", "navigationState", "counterState", "levelState",
+                 "extraState")
+
+    def __init__(self, simulation, extraState=None):
+        """Init GameSnapshot using the LevelSimulation object simulation, whose level must be in the active world,
+        and any value extraState."""
+        self.world = getActiveWorld()
+        self.simulation = simulation
+        self.simulationState = tuple((name,) + storeValue(value) for name, value in vars(simulation).items())
+
+        groups = [getattr(c, name) for name in snapshotGroupNames]
+        self.groupMembers = tuple(tuple(group.spritedict) for group in groups)
+        sprites = dict.fromkeys(simulation.playerList + simulation.playerArmList)
+        for members in self.groupMembers:
+            sprites.update(dict.fromkeys(members))
+        self.spriteStates = tuple(getSpriteState(sprite) for sprite in sprites)
+        self.poolMembers = {spriteClass: tuple(spritePool.freeSprites.values())
+                            for spriteClass, spritePool in getSpritePools().items()}
+
+        self.gridStates = tuple(({tile: dict(tileObjects) for tile, tileObjects in grid.tiles.items()},
+                                 dict(grid.objectTiles), dict(grid.objectOrder), grid.insertCount)
+                                for grid in (getattr(c, name) for name in worldGridNames))
+        engine = c.goldGroup.engine
+        self.engineState = None if engine is None else\
+            (engine,) + tuple(getattr(engine, name).copy() for name in goldEngineArrayNames)
+
+        self.classVariables = tuple((spriteClass, name) + storeValue(getattr(spriteClass, name))
+                                    for spriteClass, names in classVariableNames.items() for name in names)
+        self.randomState = gameRandom.getstate()
+        # The dicts of navigationGrid are only ever replaced with updated copies, never changed, so the snapshot can
+        # keep the dicts themselves instead of copies.
+        self.navigationState = (navigationGrid.level, navigationGrid.borderEdges, navigationGrid.tileEdges)
+        self.counterState = (goldCounters.hiddenCount, goldCounters.faceUpCount, goldCounters.upsideDownCount,
+                             dict(goldCounters.collectedCounts))
+        # The level's borderGrid is only ever replaced, never changed, after the level is initialized.
+        self.levelState = tuple(getattr(simulation.level, name) for name in levelStateNames)
+        self.extraState = extraState
+
+    def restore(self):
+        """Put the active world back into the state it was in when the snapshot was taken.
+
+        Returns:
+            simulation: The LevelSimulation object the snapshot was taken of, which continues from the snapshot's
+                frame.
+
+        Raises:
+            RuntimeError: If the world the snapshot was taken in is not the active world.
+        """
+        if getActiveWorld() is not self.world:
+            raise RuntimeError("A GameSnapshot can only be restored while the world it was taken in is active.")
+        simulation = self.simulation
+        for name, value, isList in self.simulationState:
+            setattr(simulation, name, list(value) if isList else value)
+
+        # Each group's sprites are put back directly, rather than with the group's empty and add methods, which check
+        # every sprite they are passed.
+        for name, members in zip(snapshotGroupNames, self.groupMembers):
+            group = getattr(c, name)
+            for sprite in group.spritedict:
+                sprite.remove_internal(group)
+            group.spritedict = dict.fromkeys(members)
+            group.lostsprites = []
+            for sprite in members:
+                sprite.add_internal(group)
+        for spriteState in self.spriteStates:
+            setSpriteState(*spriteState)
+        for spriteClass, spritePool in getSpritePools().items():
+            spritePool.freeSprites = {id(sprite): sprite for sprite in self.poolMembers.get(spriteClass, ())}
+
+        for name, (tiles, objectTiles, objectOrder, insertCount) in zip(worldGridNames, self.gridStates):
+            grid = getattr(c, name)
+            grid.tiles = {tile: dict(tileObjects) for tile, tileObjects in tiles.items()}
+            grid.objectTiles = dict(objectTiles)
+            grid.objectOrder = dict(objectOrder)
+            grid.insertCount = insertCount
+        if self.engineState is None:
+            c.goldGroup.engine = None
+        else:
+            engine = c.goldGroup.engine = self.engineState[0]
+            for name, array in zip(goldEngineArrayNames, self.engineState[1:]):
+                setattr(engine, name, array.copy())
+
+        for spriteClass, name, value, isList in self.classVariables:
+            setattr(spriteClass, name, list(value) if isList else value)
+        gameRandom.setstate(self.randomState)
+        navigationGrid.level, navigationGrid.borderEdges, navigationGrid.tileEdges = self.navigationState
+        goldCounters.hiddenCount, goldCounters.faceUpCount, goldCounters.upsideDownCount, collectedCounts =\
+            self.counterState
+        goldCounters.collectedCounts = dict(collectedCounts)
+        for name, value in zip(levelStateNames, self.levelState):
+            setattr(simulation.level, name, value)
+        return simulation
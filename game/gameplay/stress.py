@@ -0,0 +1,151 @@
+import os
+import random
+import sys
+import time
+
+import pygame as pg
+
+from game.gameplay.batch_simulation import getPolicy
+from game.gameplay.draw_level import DirtyRectRenderer
+from game.gameplay.level import BonusLevel, levelsByName, TiledLevel
+from game.gameplay.simulation import LevelSimulation, startSimulatedGame
+from game.sprites.black_hole import BlackHoleSprite
+import game.tools.constants as c
+from game.tools.profiler import FrameProfiler
+
+
+FRAME_BUDGET_MS = 1000 / c.FPS
+
+# Players are given this many lives during a stress test, so that the level does not end as soon as the crowd of
+# enemies kills them.
+STRESS_LIVES = 99
+
+
+def makeStressLevel(baseLevel, columns=1, rows=1, blackHoleCount=None, seed=0):
+    """Make a TiledLevel of baseLevel with the passed number of black holes.
+
+    If blackHoleCount is fewer than the tiled level's black holes, only the first blackHoleCount of them are kept.
+    If it is more, the extra black holes are placed on random item tiles, chosen with their own random number
+    generator so that gameRandom is not used.
+
+    Args:
+        baseLevel: The Level object to tile. This must not be a BonusLevel, which has no black holes.
+        columns: An integer showing how many copies of baseLevel are placed side by side.
+        rows: An integer showing how many copies of baseLevel are placed above one another.
+        blackHoleCount: An integer number of black holes to place. Defaults to None, meaning that every black hole
+            of every copy is kept.
+        seed: An integer to seed the choice of extra black hole tiles with.
+
+    Returns:
+        level: The TiledLevel object.
+    """
+    level = TiledLevel(baseLevel, columns, rows)
+    if blackHoleCount is not None:
+        extraTiles = [tile for tile in level.itemTiles if tile not in level.blackHolePositions]
+        extraCount = min(max(0, blackHoleCount - len(level.blackHolePositions)), len(extraTiles))
+        level.blackHolePositions = level.blackHolePositions[:blackHoleCount] +\
+            random.Random(seed).sample(extraTiles, extraCount)
+        level.itemTiles = [tile for tile in level.itemTiles if tile not in level.blackHolePositions]
+    return level
+
+
+def drawStressFrame(renderer, simulation):
+    """Draw the current frame of a stress test's level with a DirtyRectRenderer, as playLevel would.
+
+    Args:
+        renderer: The DirtyRectRenderer object to draw with.
+        simulation: The LevelSimulation object of the stress test.
+    """
+    profiler = simulation.profiler
+    with profiler.section("blitLevelData"):
+        renderer.startFrame(simulation.playerList, simulation.level, simulation.goldCount, simulation.timeCount)
+    with profiler.section("draw"):
+        for group in c.allGroups:
+            for sprite in group:
+                renderer.drawSprite(sprite)
+    with profiler.section("display"):
+        renderer.updateDisplay()
+
+
+def runStressTest(levelName="HEART", urchinCount=20, blackHoleCount=None, columns=1, rows=1, numberOfPlayers=1,
+                  frameCount=1800, seed=0, policyName="random", isDrawing=False, profilePath=None):
+    """Play a level crowded with enemies for a number of frames, timing each frame and each part of it.
+
+    The level is tiled into a larger board with makeStressLevel, and urchinCount urchins are spawned at once,
+    cycling through the black holes. BlackHoleSprite.maxEnemies is raised to urchinCount for the test, so that
+    killed urchins are replaced and the number of enemies stays the same throughout. The players are given
+    STRESS_LIVES lives, and are controlled by an input policy from batch_simulation.
+    Each group's update is timed with a FrameProfiler. If profilePath is not None and the test finishes, the time
+    of every part of every frame is saved there, as a CSV file and a JSON file. If isDrawing
+    is True, each frame is also drawn with a DirtyRectRenderer. If the board is larger than the screen, it is drawn
+    to a Surface object the size of the board instead.
+
+    Args:
+        levelName: The string name of the level to tile, as in levelsByName.
+        urchinCount: An integer number of urchins to keep on the board.
+        blackHoleCount: An integer number of black holes to place, as passed to makeStressLevel.
+        columns: An integer showing how many copies of the level are placed side by side.
+        rows: An integer showing how many copies of the level are placed above one another.
+        numberOfPlayers: An integer showing how many players play the level.
+        frameCount: An integer number of frames to run, unless the level ends first.
+        seed: An integer to seed gameRandom, the input policy and the extra black hole tiles with.
+        policyName: The string name of the input policy to use, as passed to getPolicy.
+        isDrawing: A boolean indicating if each frame should be drawn.
+        profilePath: The string path of the profile files to write, not including the extension, as passed to
+            FrameProfiler.save. Defaults to None, meaning that no files are written.
+
+    Returns:
+        result: A dict holding the test's settings, how many frames were run, the frame rate sustained, statistics
+            on how many milliseconds each frame took, the percent of the frame budget at 60 FPS used, and the
+            mean, 95th percentile and maximum milliseconds of each profiled section.
+    """
+    baseLevel = levelsByName[levelName]
+    if isinstance(baseLevel, BonusLevel):
+        print("ERROR: {} is a bonus level, which has no black holes to spawn enemies from.".format(levelName))
+        pg.quit()
+        sys.exit()
+    level = makeStressLevel(baseLevel, columns, rows, blackHoleCount, seed)
+    playerList, playerArmList, gameOverTextStates = startSimulatedGame(numberOfPlayers, seed)
+    for player in playerList:
+        player.lives = STRESS_LIVES
+    profiler = FrameProfiler(frameCount)
+    simulation = LevelSimulation(playerList, playerArmList, level, 1, gameOverTextStates, profiler=profiler)
+    inputFunction = getPolicy(policyName, seed)
+
+    oldMaxEnemies = BlackHoleSprite.maxEnemies
+    oldScreen = c.SCREEN
+    BlackHoleSprite.maxEnemies = urchinCount
+    if isDrawing and level.boardSize != c.SCREEN_SIZE:
+        c.SCREEN = pg.Surface(level.boardSize).convert(oldScreen)
+    renderer = DirtyRectRenderer()
+    try:
+        if BlackHoleSprite.blackHoleToSpawn is not None:
+            while len(c.enemyGroup) < urchinCount:
+                BlackHoleSprite.blackHoleToSpawn.spawnEnemy()
+        startTime = time.perf_counter()
+        while not simulation.isFinished and simulation.stepCount < frameCount:
+            profiler.startFrame()
+            playerInputs = inputFunction(simulation) if inputFunction is not None else None
+            simulation.step(playerInputs)
+            if isDrawing:
+                drawStressFrame(renderer, simulation)
+            profiler.endFrame()
+        elapsedTime = time.perf_counter() - startTime
+    finally:
+        BlackHoleSprite.maxEnemies = oldMaxEnemies
+        c.SCREEN = oldScreen
+        profiler.finish()
+    if profilePath is not None:
+        profileFolder, profileName = os.path.split(os.path.abspath(profilePath))
+        profiler.save(profileName, profileFolder)
+
+    summary = profiler.getSummary()
+    frameSummary = summary.get("total", {"mean": 0, "p95": 0, "max": 0})
+    return {"levelName": levelName, "columns": columns, "rows": rows, "boardSize": list(level.boardSize),
+            "urchins": urchinCount, "blackHoles": len(level.blackHolePositions), "gold": len(c.goldGroup),
+            "players": numberOfPlayers, "policy": policyName, "seed": seed, "drawing": isDrawing,
+            "frames": simulation.stepCount, "finished": simulation.isFinished, "seconds": elapsedTime,
+            "framesPerSecond": simulation.stepCount / max(elapsedTime, 1e-9), "frameMean": frameSummary["mean"],
+            "frameP95": frameSummary["p95"], "frameMax": frameSummary["max"],
+            "budgetPercent": 100 * frameSummary["mean"] / FRAME_BUDGET_MS,
+            "sections": {section: times for section, times in summary.items() if section != "total"}}
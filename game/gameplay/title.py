@@ -1,17 +1,22 @@
 import pygame as pg
 import sys
+import time
 
 from game.demo.demo import animateDemo
 from game.gameplay.menu import chooseNumberOfPlayers, displayChangeControlMenu
 from game.gameplay.play_level import playLevel
-from game.gameplay.level import BonusLevel, getLevelOrder
+from game.gameplay.level import BonusLevel, boardOneLevels, getLevelOrder
+from game.gameplay.setup_level import prefetchLevel, setGameConstants
 from game.gameplay.state import checkQuitGame
 from game.sprites.title import TitleBoxSprite, TitleTextSprite
 from game.sprites.player import PlayerSprite
 from game.sprites.player_arm import PlayerArmSprite
 import game.tools.constants as c
 from game.tools.controls import controlsDicts
+from game.tools.game_random import seedGame
+from game.tools.replay import InputLog
 from game.tools.scores import getHighScore, setHighScore
+from game.tools.text_cache import renderText
 
 
 def displayTitleScreen(playerScores=None):
@@ -28,27 +33,32 @@ def displayTitleScreen(playerScores=None):
         playerScores = [0, 0, 0, 0]
 
     highScore = getHighScore()
+
+    # The first level of every game is one of the boardOneLevels, so its assets are loaded while the title screen is
+    # shown.
+    for level in boardOneLevels:
+        prefetchLevel(level)
     titleImageOne = TitleTextSprite()
     titleImageTwo = TitleTextSprite(False)
     subtitleImage = TitleBoxSprite()
 
-    subtitleText = c.FONT.render("SECRETS OF OLD CLU CLU LAND", False, c.WHITE)
-    playText = c.FONT.render("PLAY GAME", False, c.CYAN)
-    changeText = c.FONT.render("CHANGE CONTROLS", False, c.CYAN)
-    cursorText = c.FONT.render(">", False, c.ORANGE)
+    subtitleText = renderText("SECRETS OF OLD CLU CLU LAND")
+    playText = renderText("PLAY GAME", c.CYAN)
+    changeText = renderText("CHANGE CONTROLS", c.CYAN)
+    cursorText = renderText(">", c.ORANGE)
 
     # If the player does not select an option within 740 frames, the demo is animated. After the demo, or after the
     # player has made a selection, looping is set to False so this loop resets the music, frameCount, cursor location,
     # and title images
     while True:
-        highScoreText = c.FONT.render("TOP,{:06d}".format(highScore), False, c.PINK)
+        highScoreText = renderText("TOP,{:06d}".format(highScore), c.PINK)
 
         # Note that this font is designed so the symbols "~", "{", and "}" form the roman numerals for 2, 3, and 4
         # respectively.
-        playerScoreTexts = [c.FONT.render("I,{:06d}".format(playerScores[0]), False, c.WHITE),
-                            c.FONT.render("~,{:06d}".format(playerScores[1]), False, c.WHITE),
-                            c.FONT.render("{{,{:06d}".format(playerScores[2]), False, c.WHITE),
-                            c.FONT.render("}},{:06d}".format(playerScores[3]), False, c.WHITE)]
+        playerScoreTexts = [renderText("I,{:06d}".format(playerScores[0])),
+                            renderText("~,{:06d}".format(playerScores[1])),
+                            renderText("{{,{:06d}".format(playerScores[2])),
+                            renderText("}},{:06d}".format(playerScores[3]))]
         scoreTextCoordinates = [(62, 400), (307, 400), (62, 425), (307, 425)]
 
         pg.mixer.music.load(c.TITLE_MUSIC)
@@ -115,6 +125,14 @@ def startGame(numberOfPlayers, highScore):
             didn't play this game.
     """
     pg.mixer.music.stop()
+
+    # If RECORD_REPLAYS is True, the game's seed and every player input are recorded, so the game can be replayed
+    # exactly with replayGame. The input log is saved after every level, so it is kept even if the game is closed
+    # partway through.
+    seed = seedGame()
+    setGameConstants()
+    inputLog = InputLog(seed, numberOfPlayers) if c.RECORD_REPLAYS else None
+    replayFileName = "replay_{}.json".format(time.strftime("%Y%m%d_%H%M%S"))
     playerList = [PlayerSprite(num + 1) for num in range(numberOfPlayers)]
     playerArmList = [PlayerArmSprite(player) for player in playerList]
     gameOverTextStates = [c.TextStates.NOT_REVEALED for _ in range(numberOfPlayers)]
@@ -126,9 +144,13 @@ def startGame(numberOfPlayers, highScore):
     # If levelIndex is greater than the levelOrder list, it resets to index 1
     # Note that this means the level at index 0 is never replayed, while every other level is played in a repeating
     # pattern.
+    # While each level is played, the assets of the level after it are loaded on the prefetch thread.
     while any(player.playerState != c.PlayerStates.DEAD for player in playerList):
+        prefetchLevel(levelOrder[levelIndex + 1 if levelIndex + 1 < len(levelOrder) else 1])
         playerList, highScore = playLevel(playerList, playerArmList, levelOrder[levelIndex], levelCount,
-                                          gameOverTextStates, highScore)
+                                          gameOverTextStates, highScore, inputLog)
+        if inputLog is not None:
+            inputLog.save(replayFileName)
         levelCount += 1
         levelIndex += 1
         if levelIndex == len(levelOrder):
@@ -0,0 +1,241 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from game.gameplay.environment import GameEnvironment
+from game.gameplay.pixel_observation import PixelObserver
+from game.gameplay.world import GameWorld, getActiveWorld
+import game.tools.constants as c
+
+
+# Each observation is a flat array of float32 values, laid out as:
+#     levelCount, timeCount, goldCount,
+#     for each player: x, y, playerState, facingDirection, lives, score,
+#     for the first OBSERVED_ENEMIES enemies: isPresent, x, y, enemyState,
+#     for each of the GOLD_COLUMNS * GOLD_ROWS tiles: the goldState of the horizontal gold sprite on that tile,
+#     for each of the GOLD_COLUMNS * GOLD_ROWS tiles: the goldState of the vertical gold sprite on that tile.
+# States and directions are stored as 1 more than their index in their Enum, and tiles without a gold sprite (Or empty
+# enemy slots) are stored as 0.
+OBSERVED_ENEMIES = 8
+GOLD_COLUMNS = 11
+GOLD_ROWS = 8
+PLAYER_FEATURES = 6
+ENEMY_FEATURES = 4
+
+playerStateCodes = {state: code for code, state in enumerate(c.PlayerStates, 1)}
+enemyStateCodes = {state: code for code, state in enumerate(c.EnemyStates, 1)}
+goldStateCodes = {state: code for code, state in enumerate(c.OtherStates, 1)}
+directionCodes = {direction: code for code, direction in enumerate(c.Directions, 1)}
+
+
+def getObservationLayout(numberOfPlayers):
+    """Get where each part of an observation is stored in its array.
+
+    Args:
+        numberOfPlayers: An integer showing how many players play each game.
+
+    Returns:
+        layout: A dict associating the name of each part of the observation ("level", "players", "enemies",
+            "goldHorizontal" and "goldVertical") with the slice object of its values.
+    """
+    sizes = (("level", 3), ("players", PLAYER_FEATURES * numberOfPlayers),
+             ("enemies", ENEMY_FEATURES * OBSERVED_ENEMIES), ("goldHorizontal", GOLD_COLUMNS * GOLD_ROWS),
+             ("goldVertical", GOLD_COLUMNS * GOLD_ROWS))
+    layout = {}
+    start = 0
+    for name, size in sizes:
+        layout[name] = slice(start, start + size)
+        start += size
+    return layout
+
+
+def writeObservation(simulation, observation, layout):
+    """Write the current state of a simulated level into an observation array.
+
+    Args:
+        simulation: The LevelSimulation object of the level, which must be in the active world.
+        observation: A one-dimensional NumPy array of float32 values to write to.
+        layout: The dict of slices returned by getObservationLayout.
+    """
+    observation[:] = 0
+    observation[layout["level"]] = (simulation.levelCount, simulation.timeCount, simulation.goldCount)
+    observation[layout["players"]] = [value for player in simulation.playerList for value in
+                                      (player.coordinates[0], player.coordinates[1],
+                                       playerStateCodes[player.playerState], directionCodes[player.facingDirection],
+                                       player.lives, player.score)]
+    enemyValues = [value for enemy, _ in zip(c.enemyGroup, range(OBSERVED_ENEMIES)) for value in
+                   (1, enemy.coordinates[0], enemy.coordinates[1], enemyStateCodes[enemy.enemyState])]
+    enemyStart = layout["enemies"].start
+    observation[enemyStart:enemyStart + len(enemyValues)] = enemyValues
+
+    # Horizontal gold sprites are placed at (-1 + 48x, 25 + 48y) and vertical ones at (-25 + 48x, 49 + 48y), so
+    # the tile of each can be found from its coordinates.
+    horizontalStart = layout["goldHorizontal"].start
+    verticalStart = layout["goldVertical"].start
+    for gold in c.goldGroup:
+        if gold.isHorizontal:
+            column, row = (gold.coordinates[0] + 1) // 48, (gold.coordinates[1] - 25) // 48
+            start = horizontalStart
+        else:
+            column, row = (gold.coordinates[0] + 25) // 48, (gold.coordinates[1] - 49) // 48
+            start = verticalStart
+        if 0 <= column < GOLD_COLUMNS and 0 <= row < GOLD_ROWS:
+            observation[start + GOLD_COLUMNS * row + column] = goldStateCodes[gold.goldState]
+
+
+class VectorEnvironment:
+    """Play several independent games in the same process, stepping every one of them with a single call.
+
+    Each game is played by its own GameEnvironment, in its own GameWorld, so the games cannot affect each other. Each
+    call to reset or step activates each world in turn, then activates whichever world was active beforehand.
+    Observations are returned as one NumPy array, with a row for each game laid out as described by
+    getObservationLayout, and rewards are returned as an array with a row for each game and a column for each player.
+    If isPixels is True, each game's observation is instead the frame drawn by its own PixelObserver, written
+    straight into its row of the observations array.
+    When a game ends, a new game is started in its place during the same step, and the last observation of the game
+    that ended is passed in its info dict.
+    NumPy must be installed to use this class.
+
+    Attributes:
+        worldCount: An integer showing how many games are played at once.
+        numberOfPlayers: An integer showing how many players play each game.
+        worlds: A list of the GameWorld object of each game.
+        environments: A list of the GameEnvironment object of each game.
+        layout: The dict of slices describing each observation, as returned by getObservationLayout.
+        isPixels: A boolean indicating if the observations are pixels drawn by a PixelObserver.
+        observationShape: A tuple of the shape of each game's observation.
+        observationType: The NumPy data type of the observations.
+    """
+
+    def __init__(self, worldCount, numberOfPlayers=1, maxFrames=None, isPixels=False, isGrayscale=False,
+                 downsample=1):
+        """Init VectorEnvironment using the integers worldCount, numberOfPlayers, maxFrames and downsample, and
+        the booleans isPixels and isGrayscale.
+
+        isGrayscale and downsample are passed to each PixelObserver, and are unused if isPixels is False.
+
+        Instance variables:
+            nextSeeds: A list of the integer seed each game's next reset will use, or None for each game if the
+                seeds are chosen at random.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("VectorEnvironment requires NumPy to be installed.")
+        self.worldCount = worldCount
+        self.numberOfPlayers = numberOfPlayers
+        self.worlds = [GameWorld() for _ in range(worldCount)]
+        self.environments = [GameEnvironment(numberOfPlayers, maxFrames,
+                                             PixelObserver(isGrayscale, downsample) if isPixels else None)
+                             for _ in range(worldCount)]
+        self.layout = getObservationLayout(numberOfPlayers)
+        self.isPixels = isPixels
+        if isPixels:
+            self.observationShape = self.environments[0].pixelObserver.observationShape
+            self.observationType = np.float32 if isGrayscale else np.uint8
+        else:
+            self.observationShape = (self.layout["goldVertical"].stop,)
+            self.observationType = np.float32
+        self.nextSeeds = [None] * worldCount
+
+    def reset(self, seed=None, observations=None, states=None):
+        """Start a new game in every world.
+
+        Args:
+            seed: An integer to seed the first world's game with. Each other world's game is seeded with the next
+                integer, and each world's later games with worldCount more than its previous game. Defaults to None,
+                meaning that every game's seed is chosen at random.
+            observations: A NumPy array of observationType values to write the observations to, with one row for
+                each game. Defaults to None, meaning that a new array is made.
+            states: A NumPy array of float32 values to also write each game's state to, laid out as described by
+                getObservationLayout, with one row for each game. This is only needed when isPixels is True.
+                Defaults to None, meaning that the states are not written.
+
+        Returns:
+            observations: A NumPy array of observationType values, with one row for the first observation of each game.
+        """
+        self.nextSeeds = [None if seed is None else seed + num for num in range(self.worldCount)]
+        if observations is None:
+            observations = np.empty((self.worldCount,) + self.observationShape, dtype=self.observationType)
+        previousWorld = getActiveWorld()
+        for num, (world, environment) in enumerate(zip(self.worlds, self.environments)):
+            world.activate()
+            self.resetWorld(num)
+            self.writeObservation(num, observations[num])
+            if states is not None:
+                writeObservation(environment.simulation, states[num], self.layout)
+        previousWorld.activate()
+        return observations
+
+    def resetWorld(self, num):
+        """Start a new game in one world, which must be active.
+
+        Args:
+            num: The integer index of the world.
+        """
+        self.environments[num].reset(self.nextSeeds[num])
+        if self.nextSeeds[num] is not None:
+            self.nextSeeds[num] += self.worldCount
+
+    def writeObservation(self, num, observation):
+        """Write the current observation of one world's game, which must be active, into an observation array.
+
+        Args:
+            num: The integer index of the world.
+            observation: The NumPy array to write the observation to.
+        """
+        if self.isPixels:
+            self.environments[num].render(observation)
+        else:
+            writeObservation(self.environments[num].simulation, observation, self.layout)
+
+    def step(self, actions, observations=None, rewards=None, dones=None, states=None):
+        """Run one frame of the game in every world.
+
+        observations, rewards, dones and states let the results be written straight into existing arrays, such as
+        those of a RolloutBuffer, instead of new ones.
+
+        Args:
+            actions: An array or list with a row for each world, holding the integer index in ACTIONS of each
+                player's action.
+            observations: A NumPy array of observationType values to write the observations to. Defaults to None,
+                meaning that a new array is made.
+            rewards: A NumPy array of float32 values to write the rewards to. Defaults to None, meaning that a new
+                array is made.
+            dones: A NumPy array of booleans to write whether each game ended to. Defaults to None, meaning that a new
+                array is made.
+            states: A NumPy array of float32 values to also write each game's state to, as passed to reset.
+                Defaults to None, meaning that the states are not written.
+
+        Returns:
+            observations: A NumPy array of observationType values, with one row for each game's observation after the
+                frame.
+            rewards: A NumPy array of float32 values, with one row for each game and one column for each player,
+                holding how many points that player scored during the frame.
+            dones: A NumPy array of booleans, indicating if each game ended during the frame.
+            infos: A list of the info dict returned by each game's GameEnvironment. If a game ended, its dict also
+                holds its last observation as "finalObservation".
+        """
+        if observations is None:
+            observations = np.empty((self.worldCount,) + self.observationShape, dtype=self.observationType)
+        if rewards is None:
+            rewards = np.empty((self.worldCount, self.numberOfPlayers), dtype=np.float32)
+        if dones is None:
+            dones = np.empty(self.worldCount, dtype=bool)
+        infos = []
+        previousWorld = getActiveWorld()
+        for num, (world, environment) in enumerate(zip(self.worlds, self.environments)):
+            world.activate()
+            rewards[num], dones[num], info = environment.runFrame([int(action) for action in actions[num]])
+            self.writeObservation(num, observations[num])
+            if dones[num]:
+                info["finalObservation"] = observations[num].copy()
+                self.resetWorld(num)
+                self.writeObservation(num, observations[num])
+            if states is not None:
+                writeObservation(environment.simulation, states[num], self.layout)
+            infos.append(info)
+        previousWorld.activate()
+        return observations, rewards, dones, infos
@@ -0,0 +1,184 @@
+import pygame as pg
+
+from game.gameplay.gold_counters import goldCounters
+from game.gameplay.navigation_grid import navigationGrid
+from game.sprites.black_hole import BlackHoleSprite
+from game.sprites.gold import GoldSprite
+from game.sprites.player import PlayerSprite
+from game.sprites.urchin import UrchinSprite
+import game.tools.constants as c
+from game.tools.engine_group import EngineGroup
+from game.tools.game_random import gameRandom
+from game.tools.spatial_grid import SpatialGrid
+from game.tools.sprite_pool import getSpritePools, setSpritePools
+
+
+# worldGroupNames lists the names of the groups in constants.py that each world has its own copy of. itemGroup is not
+# included, as the item sprites are created once when the game starts and shared by every world. Instead, the state of
+# each item sprite is stored by the world.
+# worldGridNames lists the names of the spatial grids in constants.py that each world has its own copy of.
+worldGroupNames = ("displayGroup", "blackHoleGroup", "enemyGroup", "goldGroup", "rubberGroup", "armGroup",
+                   "playerGroup", "attackGroup", "textGroup")
+worldGridNames = ("goldGrid", "rubberGrid", "enemyGrid", "playerGrid")
+
+# levelStateNames lists the names of the attributes of a Level object that change while it is played. Each world stores
+# these for the level it is playing, as Level objects are shared by every world.
+levelStateNames = ("image", "isFlashing", "frameCount", "borderGrid")
+
+# classVariableNames associates each sprite class with the names of its class variables that change during gameplay.
+# Class variables that only hold images or tables shared by every game are not included.
+classVariableNames = {
+    PlayerSprite: ("currentLevel", "movementSpeed", "rotationSpeed"),
+    UrchinSprite: ("isFrozen",),
+    BlackHoleSprite: ("maxEnemies", "blackHolesList", "blackHoleToSpawn", "preparingEnemySpawn", "enemySpawnCountdown",
+                      "baseSpawnCountdown"),
+    GoldSprite: ("levelCount", "globalFrameCount"),
+}
+
+# initialClassVariables associates each sprite class in classVariableNames with a dict of the values its class variables
+# have before any game is played, so that each new world can start with them. blackHolesList is copied, as it is
+# changed in place during gameplay.
+initialClassVariables = {spriteClass: {name: getattr(spriteClass, name) for name in names}
+                         for spriteClass, names in classVariableNames.items()}
+initialClassVariables[BlackHoleSprite]["blackHolesList"] = list(BlackHoleSprite.blackHolesList)
+
+_activeWorld = None
+
+
+class GameWorld:
+    """Hold one independent copy of every part of the gameplay state that is stored in modules and classes, so that
+    several games can be played in the same process.
+
+    The sprite groups and spatial grids in constants.py, the sprite pools, the class variables in
+    classVariableNames, the state of gameRandom, navigationGrid and goldCounters, the state of each item sprite, and
+    the attributes in levelStateNames of the level being played all belong to whichever world is active. Calling
+    activate stores the active world's state in that world, and puts this world's state in its place. Groups, grids
+    and pools are swapped rather than copied, so activating a world only takes a few microseconds. Every function of
+    the game then works on the active world, without needing to know that there are others.
+    Level objects are shared by every world, as there is only one of each level. Their layout and images stay the
+    same, but the level being played also has an image that changes when it flashes or an ItemClock is collected, so
+    each world stores those attributes of its level. Any other world playing the same level calls its initialize
+    method first, which puts in new values rather than changing the old ones.
+
+    The first time a world is activated, the state the game was in beforehand is stored in a world of its own, so it
+    can be returned to by activating defaultWorld.
+
+    Attributes:
+        groups: A dict associating the name of each group in worldGroupNames with this world's copy of it.
+        grids: A dict associating the name of each grid in worldGridNames with this world's copy of it.
+        spritePools: A dict associating each pooled sprite class with this world's SpritePool object for it, so a
+            sprite released by one world is never reused by another.
+        classVariables: A dict associating each sprite class in classVariableNames with a dict of the values of its
+            class variables in this world.
+        randomState: The state of gameRandom in this world, as returned by its getstate method.
+        navigationState: A dict of the values of navigationGrid's attributes in this world.
+        counterState: A dict of the values of goldCounters' attributes in this world.
+        itemStates: A list with a tuple of the state of each item sprite in itemGroup in this world, or None if the
+            item sprites have not been used by this world yet.
+        levelState: A tuple of the Level object this world is playing and the values of its attributes in
+            levelStateNames, or None if this world is not playing a level.
+    """
+
+    def __init__(self, isEmpty=True):
+        """Init GameWorld using the boolean isEmpty.
+
+        If isEmpty is True, the world starts with empty groups and grids and the initial class variables, as though
+        no game has been played yet. Otherwise, the world's state is left to be stored by the first call to store.
+        """
+        self.groups = {}
+        self.grids = {}
+        self.spritePools = {}
+        self.classVariables = {}
+        self.randomState = None
+        self.navigationState = {}
+        self.counterState = {}
+        self.itemStates = None
+        self.levelState = None
+        if isEmpty:
+            for name in worldGroupNames:
+                self.groups[name] = EngineGroup() if name == "goldGroup" else pg.sprite.Group()
+            for name in worldGridNames:
+                self.grids[name] = SpatialGrid()
+            self.classVariables = {spriteClass: dict(variables)
+                                   for spriteClass, variables in initialClassVariables.items()}
+            self.classVariables[BlackHoleSprite]["blackHolesList"] = list(
+                initialClassVariables[BlackHoleSprite]["blackHolesList"])
+            self.randomState = gameRandom.getstate()
+            self.navigationState = {"level": None, "borderEdges": {}, "tileEdges": {}}
+            self.counterState = {"hiddenCount": 0, "faceUpCount": 0, "upsideDownCount": 0, "collectedCounts": {}}
+
+    def activate(self):
+        """Make this the active world, storing the state of the previously active world in that world."""
+        global _activeWorld
+        if _activeWorld is self:
+            return
+        if _activeWorld is None:
+            _activeWorld = defaultWorld
+        _activeWorld.store()
+        self.load()
+        _activeWorld = self
+
+    def store(self):
+        """Store the current state of the game's modules and classes in this world."""
+        for name in worldGroupNames:
+            self.groups[name] = getattr(c, name)
+        for name in worldGridNames:
+            self.grids[name] = getattr(c, name)
+        self.spritePools = getSpritePools()
+        for spriteClass, names in classVariableNames.items():
+            self.classVariables[spriteClass] = {name: getattr(spriteClass, name) for name in names}
+        self.randomState = gameRandom.getstate()
+        self.navigationState = dict(vars(navigationGrid))
+        self.counterState = dict(vars(goldCounters))
+        self.itemStates = [(item.coordinates, item.itemState, item.collectingPlayer, item.frameCount, item.image,
+                            item.baseImage, tuple(item.rect), tuple(item.collisionRect), tuple(item.triggerRect))
+                           for item in c.itemGroup]
+        level = PlayerSprite.currentLevel
+        self.levelState = None if level is None else\
+            (level,) + tuple(getattr(level, name) for name in levelStateNames)
+
+    def load(self):
+        """Put this world's state into the game's modules and classes."""
+        for name, group in self.groups.items():
+            setattr(c, name, group)
+        for name, grid in self.grids.items():
+            setattr(c, name, grid)
+        c.oneLevelOnlyGroups = (c.displayGroup, c.blackHoleGroup, c.enemyGroup, c.goldGroup, c.rubberGroup,
+                                c.attackGroup, c.textGroup)
+        c.allGroups = (c.displayGroup, c.itemGroup, c.blackHoleGroup, c.enemyGroup, c.goldGroup, c.rubberGroup,
+                       c.armGroup, c.playerGroup, c.attackGroup, c.textGroup)
+        c.oneLevelOnlyGrids = (c.goldGrid, c.rubberGrid, c.enemyGrid)
+        setSpritePools(self.spritePools)
+        for spriteClass, values in self.classVariables.items():
+            for name, value in values.items():
+                setattr(spriteClass, name, value)
+        gameRandom.setstate(self.randomState)
+        vars(navigationGrid).update(self.navigationState)
+        vars(goldCounters).update(self.counterState)
+        if self.itemStates is None:
+            for item in c.itemGroup:
+                item.reset()
+        else:
+            for item, itemState in zip(c.itemGroup, self.itemStates):
+                item.coordinates, item.itemState, item.collectingPlayer, item.frameCount, item.image,\
+                    item.baseImage, rect, collisionRect, triggerRect = itemState
+                item.rect.update(rect)
+                item.collisionRect.update(collisionRect)
+                item.triggerRect.update(triggerRect)
+        if self.levelState is not None:
+            level = self.levelState[0]
+            for name, value in zip(levelStateNames, self.levelState[1:]):
+                setattr(level, name, value)
+
+
+def getActiveWorld():
+    """Get the world whose state the game's modules and classes currently hold.
+
+    Returns:
+        The active GameWorld object, or defaultWorld if no world has been activated yet.
+    """
+    return _activeWorld if _activeWorld is not None else defaultWorld
+
+
+# defaultWorld holds the state the game was in before any other world was activated.
+defaultWorld = GameWorld(False)
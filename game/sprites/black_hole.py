@@ -3,6 +3,8 @@ import pygame as pg
 from game.sprites.sprite_sheet import SpriteSheet
 from game.sprites.urchin import UrchinSprite
 import game.tools.constants as c
+from game.tools.event_bus import eventBus
+from game.tools.sprite_pool import getPooledSprite
 
 
 class BlackHoleSprite(pg.sprite.Sprite):
@@ -37,7 +39,7 @@ class BlackHoleSprite(pg.sprite.Sprite):
 
         Instance variables:
             spriteSheet: The SpriteSheet object for the hole sprite sheet image.
-            animationFrames: A list of 4 Surface objects from the SpriteSheet object.
+            animationFrames: A tuple of 4 shared Surface objects from the SpriteSheet object.
             coordinates: A tuple location to blit the sprite on the screen.
             frameCount: An integer that increases whenever the update method is called.
             animationCount: An integer tracking from where in animationFrames the sprite should take its next
@@ -48,11 +50,10 @@ class BlackHoleSprite(pg.sprite.Sprite):
         """
         super().__init__(c.blackHoleGroup)
         spriteSheet = SpriteSheet("hole.png")
-        self.animationFrames = []
         self.coordinates = (0, 0)
         self.frameCount = self.animationCount = 0
 
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 0, 34, 34))
+        self.animationFrames = spriteSheet.getSharedStripImages(0, 0, 34, 34)
         self.image = self.animationFrames[0]
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
@@ -91,11 +92,9 @@ class BlackHoleSprite(pg.sprite.Sprite):
         self.rect.topleft = x, y
 
     def update(self):
-        """Increase frameCount. Depending on frameCount, the length of the enemyGroup, and the class variables,
-        determine which methods to call.
+        """Animate the sprite. Depending on the length of the enemyGroup and the class variables, determine which
+        methods to call.
 
-        The sprite's image changes every 6 frames, cycling through the animationFrames list.
-        To keep frameCount from increasing without bounds, it resets to 0 every 6 frames.
         If there are fewer enemies alive than maxEnemies, preparingEnemySpawn is set to True and
         enemySpawnCountdown is set to baseSpawnCountdown.
         Once preparingEnemySpawn is True, enemySpawnCounter counts down every frame.
@@ -103,13 +102,7 @@ class BlackHoleSprite(pg.sprite.Sprite):
         then enemySpawnCounter is set to 160 to spawn another enemy shortly.
         Otherwise, preparingEnemySpawn is set to False again until an enemy is killed.
         """
-        self.frameCount += 1
-        if self.frameCount % 6 == 0:
-            self.animationCount += 1
-            if self.animationCount >= len(self.animationFrames):
-                self.animationCount = 0
-            self.image = self.animationFrames[self.animationCount]
-            self.frameCount = 0
+        self.animate()
         if len(c.enemyGroup) < BlackHoleSprite.maxEnemies and BlackHoleSprite.blackHoleToSpawn == self:
             if not BlackHoleSprite.preparingEnemySpawn:
                 BlackHoleSprite.preparingEnemySpawn = True
@@ -122,15 +115,33 @@ class BlackHoleSprite(pg.sprite.Sprite):
                     BlackHoleSprite.enemySpawnCountdown = 160
                 else:
                     BlackHoleSprite.preparingEnemySpawn = False
+
+    def animate(self):
+        """Increase frameCount, changing the sprite's image every 6 frames to cycle through the animationFrames
+        list.
+
+        To keep frameCount from increasing without bounds, it resets to 0 every 6 frames.
+        This is called on its own during the end-of-level animations, so that no enemies are spawned (And no
+        random numbers are used) after the level's gameplay has ended. This keeps a game replayed by
+        LevelSimulation, which skips those animations, the same as the game that was recorded.
+        """
+        self.frameCount += 1
+        if self.frameCount % 6 == 0:
+            self.animationCount += 1
+            if self.animationCount >= len(self.animationFrames):
+                self.animationCount = 0
+            self.image = self.animationFrames[self.animationCount]
+            self.frameCount = 0
         self.image.set_colorkey(c.BLACK)
 
     def spawnEnemy(self):
         """Create a new enemy sprite on the same coordinates as this sprite, then choose the next black hole
         sprite that will spawn an enemy.
         """
-        newUrchin = UrchinSprite()
+        newUrchin = getPooledSprite(UrchinSprite)
         newUrchin.setCoordinates(self.coordinates[0], self.coordinates[1])
         newUrchin.setRandomDirection()
+        eventBus.publish(c.GameEvents.ENEMY_SPAWNED, newUrchin, self)
         BlackHoleSprite.chooseNextBlackHoleToSpawn()
 
     @classmethod
@@ -6,27 +6,42 @@ from game.sprites.player import PlayerSprite
 from game.sprites.text import PointsSprite
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
+from game.tools.event_bus import eventBus
+from game.tools.sprite_pool import getPooledSprite, getSpritePool
+from game.tools.transform_cache import cacheImageVariants, getFlippedImage, getRotatedImage
 
 
 class GoldSprite(pg.sprite.Sprite):
     """Create a sprite of the gold item.
 
+    The sprite's state is stored in __slots__ instead of a per-instance dict. Its image attributes only refer to
+    the images shared in frameTables.
+    While goldGroup has a GoldEngine (See gold_engine.py), the engine updates every gold sprite at once and is the
+    source of each sprite's frameCount and animationCount. Any change to goldState is passed on to the engine.
+    Whenever a gold sprite in goldGroup is created, killed, or changes its goldState, it publishes a
+    GOLD_STATE_CHANGED event to the eventBus, and whenever a player collects it, a GOLD_COLLECTED event.
+
     Class variables:
         levelCount: An integer storing how many levels the player has currently played.
             Once levelCount reaches 22, the below methods change slightly.
         globalFrameCount: An integer storing a frame count common to all gold sprites.
+        frameTables: A dict associating the file name of each gold sprite sheet with a tuple of its animation
+            frames, flash image, points image and empty image, so each sheet's images are only looked up once.
     """
 
+    __slots__ = ("coordinates", "_goldState", "passingDirection", "isHorizontal", "alreadyRevealed", "frameCount",
+                 "animationCount", "animationFrames", "flashImage", "pointsImage", "emptyImage", "image", "rect",
+                 "collisionRect")
     levelCount = 0
     globalFrameCount = 0
+    frameTables = {}
 
     def __init__(self):
         """Init GoldSprite.
 
         Instance variables:
-            spriteSheet: The SpriteSheet object for the gold sprite sheet image.
+            animationFrames: A tuple of 8 shared Surface objects from the gold sprite sheet.
                 If the current level is an instance of the BonusLevel class, uses the bonus sprite sheet image.
-            animationFrames: A list of 8 Surface objects from the SpriteSheet object.
             coordinates: A tuple location to blit the sprite on the screen.
             goldState: An OtherStates Enum instance of the current state of the sprite.
                 Used to determine which methods get called and when.
@@ -52,34 +67,93 @@ class GoldSprite(pg.sprite.Sprite):
             collisionRect: A smaller rect object used for checking collision between this sprite and others.
                 This creates a better visual for collision than using the main rect object.
         """
-        super().__init__(c.goldGroup)
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        """Put the sprite back into its initial state and add it to goldGroup, so it can be reused from its pool.
+
+        The sprite sheet is chosen again each time, as the current level may have changed to or from a bonus level.
+        """
+        self.add(c.goldGroup)
         if isinstance(PlayerSprite.currentLevel, BonusLevel):
-            spriteSheet = SpriteSheet("gold_bonus.png")
+            sheetFile = "gold_bonus.png"
         else:
-            spriteSheet = SpriteSheet("gold.png")
-        self.animationFrames = []
-
+            sheetFile = "gold.png"
         self.coordinates = (0, 0)
-        self.goldState = c.OtherStates.OFF_SCREEN
+        self._goldState = c.OtherStates.OFF_SCREEN
+        self.publishStateChange(None, self._goldState)
         self.passingDirection = c.Directions.RIGHT
         self.isHorizontal = self.alreadyRevealed = False
         self.frameCount = self.animationCount = 0
 
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 0, 34, 34))
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 34, 34, 34))
-        self.flashImage = spriteSheet.getSheetImage(0, 68, 34, 34)
-        self.pointsImage = spriteSheet.getSheetImage(34, 68, 34, 34)
-        self.emptyImage = spriteSheet.getSheetImage(34, 102, 34, 34)
+        self.animationFrames, self.flashImage, self.pointsImage, self.emptyImage = GoldSprite.getFrameTable(sheetFile)
 
         self.image = self.emptyImage
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
         self.collisionRect = pg.rect.Rect((0, 0), (16, 32))
 
+    @classmethod
+    def getFrameTable(cls, sheetFile):
+        """Get the images shared by every gold sprite using a sprite sheet, loading them if they are not loaded yet.
+
+        Args:
+            sheetFile: The string file name of the gold sprite sheet.
+
+        Returns:
+            frameTable: A tuple of the sheet's animation frames, flash image, points image and empty image.
+        """
+        frameTable = cls.frameTables.get(sheetFile)
+        if frameTable is None:
+            spriteSheet = SpriteSheet(sheetFile)
+            frameTable = cls.frameTables[sheetFile] = (
+                spriteSheet.getSharedStripImages(0, 0, 34, 34) + spriteSheet.getSharedStripImages(0, 34, 34, 34),
+                spriteSheet.getSharedSheetImage(0, 68, 34, 34), spriteSheet.getSharedSheetImage(34, 68, 34, 34),
+                spriteSheet.getSharedSheetImage(34, 102, 34, 34))
+            cacheImageVariants(frameTable[0] + frameTable[1:], (270,), ((True, False),))
+        return frameTable
+
+    def kill(self):
+        """Remove the sprite from all groups and store it in its pool to be reused.
+
+        Any GoldEngine is stopped first, as it can no longer update every sprite in goldGroup.
+        """
+        if c.goldGroup.engine is not None:
+            c.goldGroup.engine.stop()
+        if self.alive():
+            self.publishStateChange(self._goldState, None)
+        super().kill()
+        getSpritePool(GoldSprite).release(self)
+
+    @property
+    def goldState(self):
+        """The OtherStates Enum instance of the current state of the sprite."""
+        return self._goldState
+
+    @goldState.setter
+    def goldState(self, goldState):
+        """Set the sprite's state, publishing the change and updating any GoldEngine to match."""
+        oldState = self._goldState
+        self._goldState = goldState
+        if self.alive():
+            self.publishStateChange(oldState, goldState)
+        if c.goldGroup.engine is not None:
+            c.goldGroup.engine.setState(self)
+
+    def publishStateChange(self, oldState, newState):
+        """Publish the sprite's change of state to the eventBus.
+
+        Args:
+            oldState: The OtherStates Enum instance of the sprite's old state, or None.
+            newState: The OtherStates Enum instance of the sprite's new state, or None.
+        """
+        eventBus.publish(c.GameEvents.GOLD_STATE_CHANGED, self, oldState, newState)
+
     def setCoordinates(self, x, y):
         """Set the sprite's coordinates to the passed arguments.
 
-        This also adjusts the location of rect and collisionRect.
+        This also adjusts the location of rect and collisionRect, and moves the sprite in goldGrid.
         Because collisionRect is a rectangle, its exact coordinates, width, and height depend on whether or not
         this sprite is facing horizontally.
 
@@ -93,15 +167,22 @@ class GoldSprite(pg.sprite.Sprite):
             self.collisionRect = pg.rect.Rect((x + 1, y + 9), (32, 16))
         else:
             self.collisionRect = pg.rect.Rect((x + 9, y + 1), (16, 32))
+        c.goldGrid.insert(self, self.rect.union(self.collisionRect))
 
     def rotateImage(self):
         """Rotate the sprite's image 270 degrees to the left and flip it if it is horizontal."""
         if self.isHorizontal:
-            self.image = pg.transform.rotate(self.image, 270)
-            self.image = pg.transform.flip(self.image, True, False)
+            self.image = getRotatedImage(self.image, 270)
+            self.image = getFlippedImage(self.image, True, False)
 
     def update(self):
-        """Increase frameCount. Depending on frameCount and playerState, determines which methods to call."""
+        """Increase frameCount. Depending on frameCount and playerState, determines which methods to call.
+
+        Updating a single gold sprite stops any GoldEngine, so that every gold sprite is updated one at a time from
+        then on.
+        """
+        if c.goldGroup.engine is not None:
+            c.goldGroup.engine.stop()
         self.frameCount += 1
 
         # If the sprite's state is REVEALED, it flashes every 6 frames.
@@ -152,13 +233,22 @@ class GoldSprite(pg.sprite.Sprite):
         self.rotateImage()
         self.image.set_colorkey(c.BLACK)
 
-    def startFlipAnimation(self):
+    def startFlipAnimation(self, passingPlayer=None):
         """Set the sprite's state as it is passed over.
 
         If the sprite has already been revealed, frameCount is set to 12 instead of 0 to account for the fact
         that its image is already in the middle of its flipping animation.
+        Otherwise, the passing player collects it, adding one to their goldCollectedCount.
         Gold sprites cannot enter the FLIPPING_DOWN state while in a bonus level, or before level 22.
+
+        Args:
+            passingPlayer: The PlayerSprite object passing over the sprite. Defaults to None.
         """
+        if passingPlayer is not None:
+            self.passingDirection = passingPlayer.facingDirection
+            if not self.alreadyRevealed:
+                passingPlayer.goldCollectedCount += 1
+                eventBus.publish(c.GameEvents.GOLD_COLLECTED, self, passingPlayer)
         self.frameCount = 0
         playSound("pass_over_gold.wav")
         if self.goldState == c.OtherStates.REVEALED and GoldSprite.levelCount > 21 and not\
@@ -168,6 +258,8 @@ class GoldSprite(pg.sprite.Sprite):
             if self.alreadyRevealed:
                 self.frameCount = 12
             self.goldState = c.OtherStates.FLIPPING_UP
+        if c.goldGroup.engine is not None:
+            c.goldGroup.engine.loadSprite(self)
 
     def flipUp(self):
         """Change the sprite's image based on its animationCount, until it is facing up. Create a new instance of
@@ -191,18 +283,24 @@ class GoldSprite(pg.sprite.Sprite):
         if self.frameCount % 36 == 0:
             self.goldState = c.OtherStates.DELAYED_UP
             if not self.alreadyRevealed:
-                points100 = PointsSprite(self.pointsImage, self.passingDirection)
-                positionOffset = 10
-                if self.passingDirection in [c.Directions.UP, c.Directions.LEFT]:
-                    positionOffset = -10
-                if self.isHorizontal:
-                    points100.coordinates = (self.coordinates[0], self.coordinates[1] + positionOffset)
-                    points100.isHorizontal = True
-                else:
-                    points100.coordinates = (self.coordinates[0] + positionOffset, self.coordinates[1])
-                self.alreadyRevealed = True
+                self.reveal()
             self.frameCount = 0
 
+    def reveal(self):
+        """Mark the sprite as already revealed, and create a PointsSprite showing the 100 points it was worth,
+        just past the sprite in its passingDirection.
+        """
+        points100 = getPooledSprite(PointsSprite, self.pointsImage, self.passingDirection)
+        positionOffset = 10
+        if self.passingDirection in [c.Directions.UP, c.Directions.LEFT]:
+            positionOffset = -10
+        if self.isHorizontal:
+            points100.coordinates = (self.coordinates[0], self.coordinates[1] + positionOffset)
+            points100.isHorizontal = True
+        else:
+            points100.coordinates = (self.coordinates[0] + positionOffset, self.coordinates[1])
+        self.alreadyRevealed = True
+
     def flipDown(self):
         """Change the sprite's image based on its animationCount, until it is facing down.
 
@@ -1,33 +1,46 @@
 import pygame as pg
-import random
 
+from game.gameplay.gold_counters import goldCounters
 from game.gameplay.level import BonusLevel
 from game.sprites.player import PlayerSprite
 from game.sprites.sprite_sheet import SpriteSheet
-from game.sprites.urchin import UrchinSprite
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
+from game.tools.event_bus import eventBus
+from game.tools.game_random import gameRandom
 
 
 class Item(pg.sprite.Sprite):
     """Create a sprite of an item.
 
     This class should not be called directly. Only call its subclasses.
+    The sprite's state is stored in __slots__ instead of a per-instance dict, and its images are stored once in
+    class variables, as every item shares the same sprite sheet.
+
+    Class variables:
+        animationFrames: A tuple of 16 shared Surface objects from the item sprite sheet.
+            Is None until the first item sprite is created.
+        imageDictKeys: A tuple of the keys in imageDict, in the same order as animationFrames.
+        imageDict: A dict associating each key in imageDictKeys with a Surface object from animationFrames.
     """
 
+    __slots__ = ("coordinates", "itemState", "collectingPlayer", "frameCount", "image", "baseImage", "rect",
+                 "collisionRect", "triggerRect")
+    animationFrames = None
+    imageDictKeys = ("apple", "banana", "cherry", "eggplant", "melon", "pineapple", "strawberry", "800", "bag",
+                     "clock", "flag", "glasses", "explosion 1", "explosion 2", "empty", "1500")
+    imageDict = None
+
     def __init__(self):
         """Init ItemSprite.
 
         Instance variables:
-            spriteSheet: The SpriteSheet object for the item sprite sheet image.
-            animationFrames: A list of 16 Surface objects from the SpriteSheet object
             coordinates: A tuple location to blit the sprite on the screen.
             itemState: An OtherStates Enum instance of the current state of the sprite.
                 Used to determine which methods get called and when.
             collectingPlayer: An instance of the PlayerSprite class that collects this item.
                 Is a None type variable until the item is collected.
             frameCount: An integer that increases whenever the collectItem method is called.
-            imageDict: A dict associating keys with Surface objects from the SpriteSheet object.
             image: The current image to be drawn for the sprite.
                 Defaults to the emptyImage.
             baseImage: The image that the sprite will change to once it's been revealed.
@@ -38,24 +51,26 @@ class Item(pg.sprite.Sprite):
             triggerRect: A smaller rect object at different coordinates than the collisionRect.
         """
         super().__init__(c.itemGroup)
-        spriteSheet = SpriteSheet("item.png")
-        self.animationFrames = []
+        Item.loadImages()
         self.coordinates = (0, 0)
         self.itemState = c.OtherStates.OFF_SCREEN
         self.collectingPlayer = None
         self.frameCount = 0
 
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 0, 34, 34))
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 34, 34, 34))
-        self.imageDictKeys = ["apple", "banana", "cherry", "eggplant", "melon", "pineapple", "strawberry", "800",
-                              "bag", "clock", "flag", "glasses", "explosion 1", "explosion 2", "empty", "1500"]
-        self.imageDict = dict(zip(self.imageDictKeys, self.animationFrames))
-
         self.image = self.baseImage = self.imageDict["empty"]
         self.rect = self.image.get_rect()
         self.collisionRect = pg.rect.Rect((0, 0), (18, 28))
         self.triggerRect = pg.rect.Rect((0, 0), (18, 28))
 
+    @classmethod
+    def loadImages(cls):
+        """Load the images shared by every item sprite from the item sprite sheet, if they are not loaded yet."""
+        if cls.animationFrames is None:
+            spriteSheet = SpriteSheet("item.png")
+            cls.animationFrames = spriteSheet.getSharedStripImages(0, 0, 34, 34) +\
+                spriteSheet.getSharedStripImages(0, 34, 34, 34)
+            cls.imageDict = dict(zip(cls.imageDictKeys, cls.animationFrames))
+
     def setCoordinates(self, x, y):
         """Set the sprite's coordinates to the passed arguments.
 
@@ -109,10 +124,11 @@ class Item(pg.sprite.Sprite):
         If the item sprite is in the OFF_SCREEN state and its triggerRect collides with a player sprite, its
         state becomes the REVEALED state.
         """
-        for player in c.playerGroup:
+        for player in c.playerGrid.query(self.rect.union(self.triggerRect)):
             if self.rect.colliderect(player.collisionRect) and self.itemState == c.OtherStates.REVEALED:
                 self.collectingPlayer = player
                 self.itemState = c.OtherStates.COLLECTED
+                eventBus.publish(c.GameEvents.ITEM_COLLECTED, self, player)
             elif self.triggerRect.colliderect(player.collisionRect) and self.itemState == c.OtherStates.OFF_SCREEN:
                 playSound("item_appears_or_collected.wav")
                 self.itemState = c.OtherStates.REVEALED
@@ -130,6 +146,8 @@ class MinorItem(Item):
             If imageKey is not in the Item class' imageDict, will raise a KeyError.
     """
 
+    __slots__ = ()
+
     def __init__(self, imageKey):
         """Init MinorItemSprite.
 
@@ -165,6 +183,8 @@ class MinorItem(Item):
 class ItemBag(Item):
     """Create a sprite of a bag item."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Init ItemBagSprite.
 
@@ -200,6 +220,8 @@ class ItemBag(Item):
 class ItemClock(Item):
     """Create a sprite of a clock item."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Init ItemClockSprite.
 
@@ -212,19 +234,17 @@ class ItemClock(Item):
     def collectItem(self):
         """Increase frameCount. Depending on frameCount, collectItem has different effects.
 
-        On the first frame, it sets the UrchinSprite class variable isFrozen to True, sets the instance variable
-        isFrozen for every other player sprite to True, and sets the level's image to its lighter variant.
+        On the first frame, it publishes a FREEZE_STARTED event, freezing every urchin sprite and every other
+        player sprite, and sets the level's image to its lighter variant.
         The sprite then spends 12 frames with each of the explosion images.
         After 24 frames total, the item's image changes to a fully transparent, blank image.
-        After 513 frames total, the item undoes the aforementioned changes and its state changes to DEAD.
+        After 513 frames total, the item publishes a FREEZE_ENDED event, undoes the aforementioned changes and its
+        state changes to DEAD.
         """
         self.frameCount += 1
         if self.frameCount == 1:
             PlayerSprite.currentLevel.image = PlayerSprite.currentLevel.lightImage
-            UrchinSprite.isFrozen = True
-            for sprite in c.playerGroup:
-                if sprite is not self.collectingPlayer:
-                    sprite.isFrozen = True
+            eventBus.publish(c.GameEvents.FREEZE_STARTED, self, self.collectingPlayer)
         if self.frameCount < 12:
             self.image = self.imageDict["explosion 1"]
         elif 12 < self.frameCount < 24:
@@ -234,18 +254,15 @@ class ItemClock(Item):
             self.image = self.imageDict["empty"]
         if self.frameCount == 513:
             PlayerSprite.currentLevel.image = PlayerSprite.currentLevel.standardImage
-            UrchinSprite.isFrozen = False
-            for sprite in c.playerGroup:
-                if sprite is not self.collectingPlayer:
-                    sprite.isFrozen = False
-                    if sprite.playerState == c.PlayerStates.FINISHED_SWINGING:
-                        sprite.frameCount = 0
+            eventBus.publish(c.GameEvents.FREEZE_ENDED, self, self.collectingPlayer)
             self.itemState = c.OtherStates.DEAD
 
 
 class ItemFlag(Item):
     """Create a sprite of a flag item."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Init ItemFlagSprite.
 
@@ -278,6 +295,8 @@ class ItemFlag(Item):
 class ItemGlasses(Item):
     """Create a sprite of a glasses item."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Init ItemGlassesSprite.
 
@@ -300,9 +319,10 @@ class ItemGlasses(Item):
                 if sprite.itemState == c.OtherStates.OFF_SCREEN:
                     sprite.itemState = c.OtherStates.REVEALED
 
-            for sprite in c.goldGroup:
-                if sprite.goldState == c.OtherStates.OFF_SCREEN:
-                    sprite.goldState = c.OtherStates.UPSIDE_DOWN
+            if goldCounters.hiddenCount > 0:
+                for sprite in c.goldGroup:
+                    if sprite.goldState == c.OtherStates.OFF_SCREEN:
+                        sprite.goldState = c.OtherStates.UPSIDE_DOWN
         if self.frameCount % 24 < 12:
             self.image = self.imageDict["explosion 1"]
         else:
@@ -342,13 +362,13 @@ def initializeLevelItems(level):
         item.reset()
     if isinstance(level, BonusLevel):
         return
-    numberOfMinorItems = random.randint(2, 4)
-    numberOfMajorItems = random.randint(0, min(3, 5 - numberOfMinorItems))
-    currentMinorItems = random.sample(minorItems, numberOfMinorItems)
-    currentMajorItems = random.sample(majorItems, numberOfMajorItems)
+    numberOfMinorItems = gameRandom.randint(2, 4)
+    numberOfMajorItems = gameRandom.randint(0, min(3, 5 - numberOfMinorItems))
+    currentMinorItems = gameRandom.sample(minorItems, numberOfMinorItems)
+    currentMajorItems = gameRandom.sample(majorItems, numberOfMajorItems)
     currentItems = currentMinorItems + currentMajorItems
-    triggerLocations = random.choices(level.itemTiles, k=(numberOfMajorItems + numberOfMinorItems))
-    itemLocations = random.sample(level.itemTiles, k=(numberOfMajorItems + numberOfMinorItems))
+    triggerLocations = gameRandom.choices(level.itemTiles, k=(numberOfMajorItems + numberOfMinorItems))
+    itemLocations = gameRandom.sample(level.itemTiles, k=(numberOfMajorItems + numberOfMinorItems))
     for num, item in enumerate(currentItems):
         item.initialize(itemLocations[num][0], itemLocations[num][1],
                         triggerLocations[num][0], triggerLocations[num][1])
@@ -5,11 +5,16 @@ import sys
 from game.sprites.sprite_sheet import SpriteSheet
 import game.tools.constants as c
 from game.tools.asset_cache import playSound
+from game.tools.event_bus import eventBus
+from game.tools.transform_cache import cacheImageVariants, getFlippedImage
 
 
 class PlayerSprite(pg.sprite.Sprite):
     """Create a sprite of the player character.
 
+    The sprite's state is stored in __slots__ instead of a per-instance dict. Its imageDict and emptyImage only
+    refer to the images shared in frameTables.
+
     Attributes:
         playerNumber: An integer representing whether the object represent player 1, 2, 3, or 4.
             If playerNumber is greater than 4, getImage will end the program as the SpriteSheet class will be
@@ -21,17 +26,23 @@ class PlayerSprite(pg.sprite.Sprite):
             GoldSprite and ItemClock classes as a shortcut for accessing attributes of the current level.
         movementSpeed: A float representation of how many pixels per frame the players travel while moving.
         rotationSpeed: A float representation of how many degrees per frame the players rotate while swinging.
+        frameTables: A dict associating each playerNumber with a tuple of the imageDict and emptyImage from that
+            player's sprite sheet, so each sheet's images are only looked up once.
     """
 
+    __slots__ = ("playerNumber", "lives", "baseCoordinates", "coordinates", "swingingArmCoordinates", "playerState",
+                 "facingDirection", "initialSwingDirection", "swingingDirection", "bouncingOffWall",
+                 "bouncingOffPlayer", "isFrozen", "killedUrchinCount", "goldCollectedCount", "score", "frameCount",
+                 "currentAngle", "imageDict", "emptyImage", "image", "rect", "collisionRect")
     currentLevel = None
     movementSpeed = 2.12
     rotationSpeed = 4.24
+    frameTables = {}
 
     def __init__(self, playerNumber=1):
         """Init PlayerSprite using the integer playerNumber.
 
         Instance variables:
-            spriteSheet: The SpriteSheet object for the player sprite sheet image.
             lives: An integer representing the player's current remaining number of lives.
             baseCoordinates: A tuple location to blit the sprite upon starting a level or after losing a life.
                 This should be updated whenever the player begins a new level, and at no other point.
@@ -71,9 +82,10 @@ class PlayerSprite(pg.sprite.Sprite):
             currentAngle: A float that tracks the current angle between the player sprite's center point and
                 swingingArmCoordinates.
                 Should only be updated or referenced while the player is swinging.
-            imageDict: A dict associating keys with lists of Surface objects from the SpriteSheet object.
+            imageDict: A dict associating keys with lists of Surface objects from the player's sprite sheet.
                 As the player's image appears different when moving or squishing based on if they are moving
                 horizontally or vertically, those keys take dicts of Surface objects instead of lists.
+                Shared by every sprite with the same playerNumber.
             emptyImage: A Surface object, showing a fully-transparent blank image.
                 Used when the sprite should not be visibly drawn onscreen.
             image: The current image to be drawn for the sprite.
@@ -83,7 +95,6 @@ class PlayerSprite(pg.sprite.Sprite):
                 This creates a better visual for collision than using the main rect object.
         """
         super().__init__(c.playerGroup)
-        spriteSheet = SpriteSheet("player{}.png".format(playerNumber))
         self.playerNumber = playerNumber
         self.lives = 5
         self.baseCoordinates = (0, 0)
@@ -96,28 +107,57 @@ class PlayerSprite(pg.sprite.Sprite):
         self.bouncingOffWall = self.bouncingOffPlayer = self.isFrozen = False
         self.killedUrchinCount = self.goldCollectedCount = self.score = self.frameCount = 0
         self.currentAngle = 0.0
-
-        self.imageDict = {"arm": [], "ball": [], "end": [], "death": [], "turn": [], "fall": [],  # #######
-                          "move": {}, "squish": {}}
-        armImageList = spriteSheet.getStripImages(152, 0, 16, 16, 2)
-        armImageList.append(spriteSheet.getSheetImage(184, 0, 14, 14))
-        self.imageDict["arm"] = armImageList
-        self.imageDict["ball"] = spriteSheet.getStripImages(0, 0, 34, 34, 2)
-        self.imageDict["end"] = spriteSheet.getStripImages(68, 0, 42, 32, 2)
-        self.imageDict["death"] = spriteSheet.getStripImages(0, 34, 34, 34, 4)
-        self.imageDict["turn"] = spriteSheet.getStripImages(136, 34, 34, 34)
-        self.imageDict["fall"] = spriteSheet.getStripImages(0, 68, 34, 34, 4)
-        self.imageDict["move"]["vertical"] = spriteSheet.getStripImages(0, 102, 32, 38, 4)
-        self.imageDict["squish"]["vertical"] = spriteSheet.getStripImages(128, 102, 48, 38)
-        self.imageDict["move"]["horizontal"] = spriteSheet.getStripImages(0, 140, 34, 34, 4)
-        self.imageDict["squish"]["horizontal"] = spriteSheet.getStripImages(136, 140, 30, 52, 3)
-        self.emptyImage = spriteSheet.getSheetImage(136, 68, 34, 34)
+        self.imageDict, self.emptyImage = PlayerSprite.getFrameTable(playerNumber)
 
         self.image = self.emptyImage
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
         self.collisionRect = pg.rect.Rect((0, 0), (16, 16))
 
+    @classmethod
+    def getFrameTable(cls, playerNumber):
+        """Get the images shared by every player sprite with the passed playerNumber, loading them from the
+        player's sprite sheet if they are not loaded yet.
+
+        Args:
+            playerNumber: An integer representing which player's sprite sheet to use.
+
+        Returns:
+            frameTable: A tuple of the player's imageDict and emptyImage.
+        """
+        frameTable = cls.frameTables.get(playerNumber)
+        if frameTable is None:
+            spriteSheet = SpriteSheet("player{}.png".format(playerNumber))
+            imageDict = {"arm": [], "ball": [], "end": [], "death": [], "turn": [], "fall": [],  # #######
+                         "move": {}, "squish": {}}
+            armImageList = spriteSheet.getSharedStripImages(152, 0, 16, 16, 2) +\
+                (spriteSheet.getSharedSheetImage(184, 0, 14, 14),)
+            imageDict["arm"] = armImageList
+            imageDict["ball"] = spriteSheet.getSharedStripImages(0, 0, 34, 34, 2)
+            imageDict["end"] = spriteSheet.getSharedStripImages(68, 0, 42, 32, 2)
+            imageDict["death"] = spriteSheet.getSharedStripImages(0, 34, 34, 34, 4)
+            imageDict["turn"] = spriteSheet.getSharedStripImages(136, 34, 34, 34)
+            imageDict["fall"] = spriteSheet.getSharedStripImages(0, 68, 34, 34, 4)
+            imageDict["move"]["vertical"] = spriteSheet.getSharedStripImages(0, 102, 32, 38, 4)
+            imageDict["squish"]["vertical"] = spriteSheet.getSharedStripImages(128, 102, 48, 38)
+            imageDict["move"]["horizontal"] = spriteSheet.getSharedStripImages(0, 140, 34, 34, 4)
+            imageDict["squish"]["horizontal"] = spriteSheet.getSharedStripImages(136, 140, 30, 52, 3)
+            emptyImage = spriteSheet.getSharedSheetImage(136, 68, 34, 34)
+            frameTable = cls.frameTables[playerNumber] = (imageDict, emptyImage)
+            for key in ("ball", "end", "death", "turn", "fall"):
+                cacheImageVariants(imageDict[key])
+            for key in ("move", "squish"):
+                for images in imageDict[key].values():
+                    cacheImageVariants(images)
+            # The player's arm rotates and then flips its images to face any direction, and flips and then rotates its
+            # diagonal images while swinging.
+            cacheImageVariants(armImageList + (emptyImage,), (0, 90, 180, 270))
+            for image in armImageList:
+                cacheImageVariants((getFlippedImage(image, flipHorizontally, flipVertically)
+                                    for flipHorizontally in (False, True) for flipVertically in (False, True)),
+                                   (90, 270), ((False, False),))
+        return frameTable
+
     def initialize(self, x, y):
         """Reset some of the sprite's attributes to its proper initial values.
 
@@ -135,10 +175,39 @@ class PlayerSprite(pg.sprite.Sprite):
         else:
             self.image = self.emptyImage
 
+    @staticmethod
+    def freezeOtherPlayers(item, player):
+        """Stop every player sprite except the one collecting a clock item from moving.
+
+        Args:
+            item: The ItemClock object that was collected.
+            player: The PlayerSprite object that collected it.
+        """
+        for sprite in c.playerGroup:
+            if sprite is not player:
+                sprite.isFrozen = True
+
+    @staticmethod
+    def unfreezeOtherPlayers(item, player):
+        """Let every player sprite frozen by a clock item move again, as its effect ends.
+
+        Players who finished swinging while frozen have their frameCount reset, so they wait the full time before
+        they can move again.
+
+        Args:
+            item: The ItemClock object whose effect ended.
+            player: The PlayerSprite object that collected it.
+        """
+        for sprite in c.playerGroup:
+            if sprite is not player:
+                sprite.isFrozen = False
+                if sprite.playerState == c.PlayerStates.FINISHED_SWINGING:
+                    sprite.frameCount = 0
+
     def setCoordinates(self, x, y):
         """Set the sprite's coordinates to the passed arguments.
 
-        This also adjusts the location of rect and collisionRect.
+        This also adjusts the location of rect and collisionRect, and moves the sprite in playerGrid.
 
         Args:
             x: An integer x coordinate to draw the sprite.
@@ -147,6 +216,7 @@ class PlayerSprite(pg.sprite.Sprite):
         self.coordinates = x, y
         self.rect.topleft = x, y
         self.collisionRect = pg.rect.Rect((x + 8, y + 8), (16, 16))
+        c.playerGrid.insert(self, self.collisionRect)
 
     def isFacingHorizontally(self):
         """Check if the player is currently facing one of the horizontal directions.
@@ -177,9 +247,9 @@ class PlayerSprite(pg.sprite.Sprite):
         if self.playerState not in [c.PlayerStates.SWINGING, c.PlayerStates.HITTING_PLAYER_SWINGING] or\
                 self.isTurningOrthogonally():
             if self.facingDirection == c.Directions.LEFT:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
             elif self.facingDirection == c.Directions.UP:
-                self.image = pg.transform.flip(self.image, False, True)
+                self.image = getFlippedImage(self.image, False, True)
 
     def flipDiagonalImage(self):
         """Flip the sprite's image as needed, based on where in its circular swinging movement the sprite is
@@ -191,14 +261,14 @@ class PlayerSprite(pg.sprite.Sprite):
         currentAngleSixteenth = (self.currentAngle % 360) // 22.5
         if self.swingingDirection == c.Directions.CLOCKWISE:
             if currentAngleSixteenth in [1, 2, 13, 14]:
-                self.image = pg.transform.flip(self.image, False, True)
+                self.image = getFlippedImage(self.image, False, True)
             if currentAngleSixteenth in [1, 2, 5, 6]:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
         else:
             if currentAngleSixteenth in [5, 6, 9, 10]:
-                self.image = pg.transform.flip(self.image, False, True)
+                self.image = getFlippedImage(self.image, False, True)
             if currentAngleSixteenth in [9, 10, 13, 14]:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
 
     def changeImage(self, imageKey, imageIndex):
         """Change the current image of the sprite.
@@ -284,8 +354,7 @@ class PlayerSprite(pg.sprite.Sprite):
             elif self.frameCount > 9:
                 self.moveSprite()
                 self.animateMovement()
-                if not self.isFrozen and not any(self.rect.colliderect(levelRect) for levelRect in
-                                                 PlayerSprite.currentLevel.levelBorderRects):
+                if not self.isFrozen and not PlayerSprite.currentLevel.isCollidingWithBorder(self.rect):
                     self.frameCount = 0
                     self.playerState = c.PlayerStates.MOVING
                     self.bouncingOffWall = False
@@ -305,6 +374,7 @@ class PlayerSprite(pg.sprite.Sprite):
                 self.frameCount = 0
                 self.playerState = c.PlayerStates.OFF_SCREEN
                 self.image = self.emptyImage
+                eventBus.publish(c.GameEvents.PLAYER_DIED, self)
 
         # After 160 frames of being off-screen, the player is respawned at its baseCoordinates location, at the cost of
         # one life.
@@ -317,6 +387,7 @@ class PlayerSprite(pg.sprite.Sprite):
                 self.frameCount = 0
             elif self.lives == 0:
                 self.playerState = c.PlayerStates.DEAD
+                eventBus.publish(c.GameEvents.GAME_OVER, self)
         elif self.playerState == c.PlayerStates.LEVEL_END:
             self.animateLevelEnd()
 
@@ -335,7 +406,7 @@ class PlayerSprite(pg.sprite.Sprite):
             if not any(player.collisionRect.colliderect(self.collisionRect) for player in otherPlayers):
                 self.bouncingOffPlayer = False
         if self.bouncingOffWall:
-            if not any(self.rect.colliderect(levelRect) for levelRect in PlayerSprite.currentLevel.levelBorderRects):
+            if not PlayerSprite.currentLevel.isCollidingWithBorder(self.rect):
                 self.bouncingOffWall = False
 
         # All methods that rely on frameCount do so in factors of 240. To keep frameCount from increasing without
@@ -388,9 +459,9 @@ class PlayerSprite(pg.sprite.Sprite):
         """Move the sprite's coordinates according to movementSpeed, in the direction they are facing.
 
         If the sprite passes over a gold sprite, it causes that sprite to run its startFlipAnimation method.
-        If that gold sprite has not yet been revealed, it adds one to the player's goldCollectedCount.
+        If that gold sprite has not yet been revealed, this player collects it.
 
-        If the sprite crosses over the left or right edge of the screen, they reappear at the opposite edge.
+        If the sprite crosses over the left or right edge of the level, they reappear at the opposite edge.
         Crossing over the upper or lower edge of the screen should not be possible. If it were to happen, the
         player's coordinates would be reset once the timer reaches 0 and they lose a life, preventing the game
         from locking up.
@@ -403,20 +474,17 @@ class PlayerSprite(pg.sprite.Sprite):
             elif self.facingDirection == c.Directions.LEFT:
                 self.setCoordinates(self.coordinates[0] - PlayerSprite.movementSpeed, self.coordinates[1])
                 if self.rect.right < 0:
-                    self.setCoordinates(512, self.coordinates[1])
+                    self.setCoordinates(PlayerSprite.currentLevel.boardSize[0], self.coordinates[1])
             elif self.facingDirection == c.Directions.RIGHT:
                 self.setCoordinates(self.coordinates[0] + PlayerSprite.movementSpeed, self.coordinates[1])
-                if self.rect.left > 512:
+                if self.rect.left > PlayerSprite.currentLevel.boardSize[0]:
                     self.setCoordinates(-48, self.coordinates[1])
-            for gold in c.goldGroup:
+            for gold in c.goldGrid.queryPoint(self.rect.center):
 
                 # This does not call the startFlipAnimation method if the gold sprite is currently flipping up or down.
                 if gold.collisionRect.collidepoint(self.rect.center) and gold.goldState in\
                         [c.OtherStates.OFF_SCREEN, c.OtherStates.REVEALED, c.OtherStates.UPSIDE_DOWN]:
-                    gold.passingDirection = self.facingDirection
-                    if not gold.alreadyRevealed:
-                        self.goldCollectedCount += 1
-                    gold.startFlipAnimation()
+                    gold.startFlipAnimation(self)
 
     def animateMovement(self):
         """Change the sprite's image every 4 frames to create the illusion of animation."""
@@ -459,7 +527,7 @@ class PlayerSprite(pg.sprite.Sprite):
         imageKey = "move"
         if self.playerState == c.PlayerStates.HITTING_PLAYER_SWINGING and not self.isTurningOrthogonally():
             imageKey = "turn"
-        if any(self.rect.colliderect(levelRect) for levelRect in PlayerSprite.currentLevel.levelBorderRects):
+        if PlayerSprite.currentLevel.isCollidingWithBorder(self.rect):
             self.frameCount = 0
             self.playerState = c.PlayerStates.HITTING_WALL
             self.bouncingOffWall = True
@@ -562,14 +630,11 @@ class PlayerSprite(pg.sprite.Sprite):
             self.currentAngle %= 360
             self.rotateImageAroundPoint()
             self.changeSwingingDirection()
-            for gold in c.goldGroup:
+            for gold in c.goldGrid.queryPoint(self.rect.center):
                 if gold.collisionRect.collidepoint(self.rect.center) and gold.goldState in [c.OtherStates.OFF_SCREEN,
                                                                                             c.OtherStates.REVEALED,
                                                                                             c.OtherStates.UPSIDE_DOWN]:
-                    gold.passingDirection = self.facingDirection
-                    if not gold.alreadyRevealed:
-                        self.goldCollectedCount += 1
-                    gold.startFlipAnimation()
+                    gold.startFlipAnimation(self)
         if self.isTurningOrthogonally():
             self.animateMovement()
         elif self.frameCount % 8 < 4:
@@ -591,15 +656,15 @@ class PlayerSprite(pg.sprite.Sprite):
                                 c.PlayerStates.HITTING_WALL, c.PlayerStates.HITTING_PLAYER_MOVING,
                                 c.PlayerStates.HITTING_PLAYER_SWINGING]:
             if any(enemy.collisionRect.colliderect(self.collisionRect) and enemy.enemyState == c.EnemyStates.MOVING
-                   and enemy.color == c.BLUE for enemy in c.enemyGroup):
+                   and enemy.color == c.BLUE for enemy in c.enemyGrid.query(self.collisionRect)):
                 playSound("death.wav")
                 self.frameCount = 0
                 self.facingDirection = c.Directions.RIGHT
                 self.playerState = c.PlayerStates.EXPLODING
                 self.image = self.imageDict["death"][0]
             else:
-                pushedEnemies = [enemy for enemy in c.enemyGroup if enemy.collisionRect.colliderect(self.rect)
-                                 and enemy.color == c.YELLOW]
+                pushedEnemies = [enemy for enemy in c.enemyGrid.query(self.rect)
+                                 if enemy.collisionRect.colliderect(self.rect) and enemy.color == c.YELLOW]
                 for enemy in pushedEnemies:
                     enemy.push(self)
 
@@ -632,7 +697,7 @@ class PlayerSprite(pg.sprite.Sprite):
         if self.playerState in [c.PlayerStates.MOVING, c.PlayerStates.FINISHED_SWINGING,
                                 c.PlayerStates.HITTING_PLAYER_MOVING, c.PlayerStates.HITTING_PLAYER_SWINGING] and not\
                 self.bouncingOffWall:
-            if any(self.rect.colliderect(levelRect) for levelRect in PlayerSprite.currentLevel.levelBorderRects):
+            if PlayerSprite.currentLevel.isCollidingWithBorder(self.rect):
                 self.hitWall()
                 self.bouncingOffWall = True
 
@@ -697,3 +762,7 @@ class PlayerSprite(pg.sprite.Sprite):
     def setLevelEndCountImage(self):
         """Set the sprite's image to look towards the score box as the score counts up."""
         self.image = self.imageDict["end"][1]
+
+
+eventBus.subscribe(c.GameEvents.FREEZE_STARTED, PlayerSprite.freezeOtherPlayers)
+eventBus.subscribe(c.GameEvents.FREEZE_ENDED, PlayerSprite.unfreezeOtherPlayers)
@@ -3,6 +3,7 @@ import pygame as pg
 from game.sprites.player import PlayerSprite
 import game.tools.constants as c
 from game.tools.asset_cache import playSound
+from game.tools.transform_cache import getFlippedImage, getRotatedImage
 
 
 class PlayerArmSprite(pg.sprite.Sprite):
@@ -12,6 +13,9 @@ class PlayerArmSprite(pg.sprite.Sprite):
         playerBody: An instance of the PlayerSprite class that this arm belongs to.
     """
 
+    __slots__ = ("playerBody", "coordinates", "swingingCoordinates", "armState", "extendedDirection",
+                 "currentAngleOctant", "emptyImage", "image", "rect", "collisionRect", "wallCollisionRect")
+
     def __init__(self, playerBody):
         """Init PlayerArmSprite using the PlayerSprite instance playerBody.
 
@@ -108,7 +112,7 @@ class PlayerArmSprite(pg.sprite.Sprite):
     def rotateImage(self):
         """Rotate the sprite's image either 0, 90, 180, or 270 degrees to the left, then flip it."""
         rotationDegrees = 90 * c.directionList.index(self.extendedDirection)
-        self.image = pg.transform.rotate(self.image, rotationDegrees)
+        self.image = getRotatedImage(self.image, rotationDegrees)
         self.flipImage()
 
     def flipImage(self):
@@ -119,26 +123,26 @@ class PlayerArmSprite(pg.sprite.Sprite):
         around this sprite's center point the playerBody object is currently located.
         """
         if self.extendedDirection == c.Directions.UP:
-            self.image = pg.transform.flip(self.image, True, False)
+            self.image = getFlippedImage(self.image, True, False)
         if self.extendedDirection == c.Directions.RIGHT:
-            self.image = pg.transform.flip(self.image, False, True)
+            self.image = getFlippedImage(self.image, False, True)
         if self.armState == c.ArmStates.EXTENDED:
             if self.playerBody.facingDirection == c.Directions.LEFT:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
             if self.playerBody.facingDirection == c.Directions.UP:
-                self.image = c.pg.transform.flip(self.image, False, True)
+                self.image = getFlippedImage(self.image, False, True)
         else:
             playerAngleSixteenth = (self.playerBody.currentAngle % 360) // 22.5
             if self.playerBody.swingingDirection == c.Directions.CLOCKWISE:
                 if playerAngleSixteenth in [5, 6, 7, 8]:
-                    self.image = c.pg.transform.flip(self.image, False, True)
+                    self.image = getFlippedImage(self.image, False, True)
                 if playerAngleSixteenth in [1, 2, 3, 4]:
-                    self.image = pg.transform.flip(self.image, True, False)
+                    self.image = getFlippedImage(self.image, True, False)
             else:
                 if playerAngleSixteenth in [0, 1, 2, 15]:
-                    self.image = pg.transform.flip(self.image, False, True)
+                    self.image = getFlippedImage(self.image, False, True)
                 if playerAngleSixteenth in [11, 12, 13, 14]:
-                    self.image = pg.transform.flip(self.image, True, False)
+                    self.image = getFlippedImage(self.image, True, False)
 
     def flipDiagonalImage(self):
         """Flip and rotate the sprite's image based on its swingingDirection and which sixteenth of the circle
@@ -149,22 +153,22 @@ class PlayerArmSprite(pg.sprite.Sprite):
         playerAngleSixteenth = (self.playerBody.currentAngle % 360) // 22.5
         if self.playerBody.swingingDirection == c.Directions.CLOCKWISE:
             if playerAngleSixteenth in [1, 2, 5, 6, 9, 10]:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
             if playerAngleSixteenth in [1, 2, 9, 10, 13, 14]:
-                self.image = pg.transform.flip(self.image, False, True)
+                self.image = getFlippedImage(self.image, False, True)
             if playerAngleSixteenth in [9, 10]:
-                self.image = pg.transform.rotate(self.image, 90)
+                self.image = getRotatedImage(self.image, 90)
             if playerAngleSixteenth in [1, 2]:
-                self.image = pg.transform.rotate(self.image, 270)
+                self.image = getRotatedImage(self.image, 270)
         else:
             if playerAngleSixteenth in [5, 6, 9, 10, 13, 14]:
-                self.image = pg.transform.flip(self.image, True, False)
+                self.image = getFlippedImage(self.image, True, False)
             if playerAngleSixteenth in [9, 10]:
-                self.image = pg.transform.flip(self.image, False, True)
+                self.image = getFlippedImage(self.image, False, True)
             if playerAngleSixteenth in [13, 14]:
-                self.image = pg.transform.rotate(self.image, 90)
+                self.image = getRotatedImage(self.image, 90)
             if playerAngleSixteenth in [5, 6]:
-                self.image = pg.transform.rotate(self.image, 270)
+                self.image = getRotatedImage(self.image, 270)
 
     def update(self):
         """Depending on the sprite's state and playerBody's state, determine which methods to call."""
@@ -218,14 +222,19 @@ class PlayerArmSprite(pg.sprite.Sprite):
         SWINGING, and the currentAngleOctant and the player's currentAngle are set based on the sprite's current
         extendedDirection.
         """
-        if not any(self.wallCollisionRect.colliderect(levelRect) for levelRect in
-                   PlayerSprite.currentLevel.levelBorderRects) and not \
-                any(self.wallCollisionRect.colliderect(trap.collisionRect) for trap in c.rubberGroup if
+        if not PlayerSprite.currentLevel.isCollidingWithBorder(self.wallCollisionRect) and not \
+                any(self.wallCollisionRect.colliderect(trap.collisionRect) for trap in
+                    c.rubberGrid.query(self.wallCollisionRect) if
                     trap.trapState in [c.OtherStates.REVEALED, c.OtherStates.TRIGGERED]) and not \
-                any(self.playerBody.rect.colliderect(trap.collisionRect) for trap in c.rubberGroup) and not \
+                any(self.playerBody.rect.colliderect(trap.collisionRect) for trap in
+                    c.rubberGrid.query(self.playerBody.rect)) and not \
                 self.playerBody.isFrozen:
+            # On the base 512x448 board, the upper bounds of the sprite's coordinates are both 500. Tiled boards
+            # extend them by however much larger than the base board they are.
+            boardWidth, boardHeight = PlayerSprite.currentLevel.boardSize
             if self.collisionRect[0] % 48 in range(34, 39) and self.collisionRect[1] % 48 in range(34, 39) and \
-                                    30 < self.collisionRect[0] < 500 and 20 < self.collisionRect[1] < 500:
+                                    30 < self.collisionRect[0] < boardWidth - 12 and \
+                                    20 < self.collisionRect[1] < boardHeight + 52:
                 playSound("grab_post_move_end.wav")
                 self.armState = c.ArmStates.SWINGING
                 self.playerBody.playerState = c.PlayerStates.SWINGING
@@ -1,7 +1,10 @@
 import pygame as pg
 
+from game.sprites.player import PlayerSprite
 from game.sprites.sprite_sheet import SpriteSheet
 import game.tools.constants as c
+from game.tools.sprite_pool import getSpritePool
+from game.tools.transform_cache import cacheImageVariants, getRotatedImage
 
 
 class SonicWaveSprite(pg.sprite.Sprite):
@@ -14,14 +17,22 @@ class SonicWaveSprite(pg.sprite.Sprite):
             as though it were "right".
         firingPlayerNumber: A integer representing the number of the player that shot the sonic wave.
             Though none of this class' methods rely on this attribute, other functions do.
+
+    The sprite's state is stored in __slots__ instead of a per-instance dict, and its images are stored once in a
+    class variable, as every sonic wave shares the same sprite sheet.
+
+    Class variables:
+        animationFrames: A tuple of 2 shared Surface objects from the wave sprite sheet.
+            Is None until the first sonic wave sprite is created.
     """
 
+    __slots__ = ("coordinates", "direction", "firingPlayerNumber", "frameCount", "image", "rect", "collisionRect")
+    animationFrames = None
+
     def __init__(self, direction, firingPlayerNumber=1):
         """Init SonicWaveSprite using the string direction and the integer firingPlayerNumber.
 
         Instance variables:
-            spriteSheet: The SpriteSheet object for the wave sprite sheet image.
-            animationFrames: A list of 2 Surface objects from the SpriteSheet object
             coordinates: A tuple location to blit the sprite on the screen.
             frameCount: An integer that increases whenever the update method is called.
                 Used to control when other methods should be called.
@@ -31,20 +42,37 @@ class SonicWaveSprite(pg.sprite.Sprite):
             collisionRect: A smaller rect object used for checking collision between this sprite and others.
                 This creates a better visual for collision than using the main rect object.
         """
-        super().__init__(c.attackGroup)
-        spriteSheet = SpriteSheet("wave.png")
-        self.animationFrames = []
+        super().__init__()
+        SonicWaveSprite.loadImages()
+        self.reset(direction, firingPlayerNumber)
+
+    @classmethod
+    def loadImages(cls):
+        """Load the images shared by every sonic wave sprite from the wave sprite sheet, if they are not loaded
+        yet."""
+        if cls.animationFrames is None:
+            cls.animationFrames = SpriteSheet("wave.png").getSharedStripImages(0, 0, 34, 34)
+            cacheImageVariants(cls.animationFrames, (90, 180, 270), ((False, False),))
+
+    def reset(self, direction, firingPlayerNumber=1):
+        """Put the sprite back into its initial state using the string direction and the integer
+        firingPlayerNumber, and add it to attackGroup, so it can be reused from its pool."""
+        self.add(c.attackGroup)
         self.coordinates = (0, 0)
         self.direction = direction
         self.firingPlayerNumber = firingPlayerNumber
         self.frameCount = 0
 
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 0, 34, 34))
         self.image = self.animationFrames[0]
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
         self.collisionRect = pg.rect.Rect((0, 0), (16, 32))
 
+    def kill(self):
+        """Remove the sprite from all groups and store it in its pool to be reused."""
+        super().kill()
+        getSpritePool(SonicWaveSprite).release(self)
+
     def setInitialCoordinates(self, x, y):
         """Set the sprite's initial coordinates based on the passed arguments.
 
@@ -93,7 +121,7 @@ class SonicWaveSprite(pg.sprite.Sprite):
     def rotateImage(self):
         """Rotate the sprite's image either 0, 90, 180, or 270 degrees to the left."""
         rotationDegrees = 90 * c.directionList.index(self.direction)
-        self.image = pg.transform.rotate(self.image, rotationDegrees)
+        self.image = getRotatedImage(self.image, rotationDegrees)
 
     def update(self):
         """Increase frameCount. Moves the sprite six pixels forward, changes its image every frame, and
@@ -101,7 +129,7 @@ class SonicWaveSprite(pg.sprite.Sprite):
 
         This prevents a glitch where the wave could not shoot an urchin that was too close to the player.
 
-        If the sprite crosses over the left or right edge of the screen, they reappear at the opposite edge.
+        If the sprite crosses over the left or right edge of the level, they reappear at the opposite edge.
         This does not happen if the sprite crosses over the upper or lower edge of the screen.
         """
         self.frameCount += 1
@@ -114,8 +142,8 @@ class SonicWaveSprite(pg.sprite.Sprite):
         else:
             self.setCoordinates(self.coordinates[0] + 6, self.coordinates[1])
         if self.rect.right < 0:
-            self.setCoordinates(512, self.coordinates[1])
-        elif self.rect.left > 512:
+            self.setCoordinates(PlayerSprite.currentLevel.boardSize[0], self.coordinates[1])
+        elif self.rect.left > PlayerSprite.currentLevel.boardSize[0]:
             self.setCoordinates(-34, self.coordinates[1])
 
         if self.frameCount % 2 == 1:
@@ -4,6 +4,9 @@ from game.tools.asset_cache import getImage
 import game.tools.constants as c
 
 
+_frameLibrary = {}
+
+
 class SpriteSheet:
     """Create a sprite sheet object using an image file in the sprite sheet folder.
 
@@ -13,12 +16,18 @@ class SpriteSheet:
     These separated images should be stored in a list or dict in each sprite class, so those images can be
     accessed as needed.
 
+    Sprites that are created many times (Such as the gold, urchin, and item sprites) should use the shared
+    methods, which slice each segment of a sprite sheet only once and return the same Surface objects every time
+    afterwards. Surfaces returned by the shared methods are shared between every sprite that requests them, so
+    they should never be drawn on or have their color key changed.
+
     Attributes:
         imageName: The string of the file for the sprite sheet image file, not including the file path.
     """
 
     def __init__(self, imageName):
         """Init SpriteSheet with the imageName string."""
+        self.imageName = imageName
         self.sheet = getImage(c.SPRITE_SHEET_FOLDER, imageName)
 
     def getSheetImage(self, x, y, width, height, key=c.BLACK):
@@ -76,3 +85,53 @@ class SpriteSheet:
             imageList.append(image)
             x += width
         return imageList
+
+    def getSharedSheetImage(self, x, y, width, height, key=c.BLACK):
+        """Get a rectangular segment of self.sheet as a Surface object shared by every caller.
+
+        If the segment has not already been sliced with this color key, it slices it with getSheetImage and
+        stores it. If it has already been sliced before, it simply returns the stored image.
+
+        Args:
+            x: An integer x coordinate of the left edge of the desired segment.
+            y: An integer y coordinate of the top edge of the desired segment.
+            width: An integer width of the desired Surface object.
+            height: An integer height of the desired Surface object.
+            key: A tuple representing the color key used for transparency in the returned image.
+
+        Returns:
+            image: The desired segment as a shared Surface object with the above color key.
+        """
+        global _frameLibrary
+        frameKey = (self.imageName, x, y, width, height, None, tuple(key))
+        image = _frameLibrary.get(frameKey)
+        if image is None:
+            image = self.getSheetImage(x, y, width, height, key)
+            _frameLibrary[frameKey] = image
+        return image
+
+    def getSharedStripImages(self, x, y, width, height, numberOfImages=0, key=c.BLACK):
+        """Get a row of segments of self.sheet as a tuple of Surface objects shared by every caller.
+
+        If the row has not already been sliced with this color key, it slices it with getStripImages and stores
+        it. If it has already been sliced before, it simply returns the stored tuple.
+
+        Args:
+            x: An integer x coordinate of the left edge of the desired segment.
+            y: An integer y coordinate of the top edge of the desired segment.
+            width: An integer width of the desired Surface object.
+            height: An integer height of the desired Surface object.
+            numberOfImages: An integer count of how many Surface objects from the row are desired.
+                See getStripImages for how this value is handled.
+            key: A tuple representing the color key used for transparency in the returned image.
+
+        Returns:
+            imageTuple: A tuple of the desired segments as shared Surface objects with the above color key.
+        """
+        global _frameLibrary
+        frameKey = (self.imageName, x, y, width, height, numberOfImages, tuple(key))
+        imageTuple = _frameLibrary.get(frameKey)
+        if imageTuple is None:
+            imageTuple = tuple(self.getStripImages(x, y, width, height, numberOfImages, key))
+            _frameLibrary[frameKey] = imageTuple
+        return imageTuple
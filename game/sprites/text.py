@@ -2,6 +2,7 @@ import pygame as pg
 
 from game.sprites.sprite_sheet import SpriteSheet
 import game.tools.constants as c
+from game.tools.sprite_pool import getSpritePool
 
 
 class PointsSprite(pg.sprite.Sprite):
@@ -15,6 +16,8 @@ class PointsSprite(pg.sprite.Sprite):
             unexpected and undesired results.
     """
 
+    __slots__ = ("image", "coordinates", "passingDirection", "isHorizontal", "frameCount")
+
     def __init__(self, pointsImage, passingDirection=c.Directions.RIGHT):
         """Init PointsSprite using the Surface pointsImage and the Directions Enum passingDirection.
 
@@ -24,7 +27,13 @@ class PointsSprite(pg.sprite.Sprite):
             frameCount: An integer that increases whenever the update method is called.
                 Used to control when other methods should be called.
         """
-        super().__init__(c.textGroup)
+        super().__init__()
+        self.reset(pointsImage, passingDirection)
+
+    def reset(self, pointsImage, passingDirection=c.Directions.RIGHT):
+        """Put the sprite back into its initial state using the Surface pointsImage and the Directions Enum
+        passingDirection, and add it to textGroup, so it can be reused from its pool."""
+        self.add(c.textGroup)
         self.image = pointsImage
         self.image.set_colorkey(c.BLACK)
         self.coordinates = (0, 0)
@@ -32,6 +41,11 @@ class PointsSprite(pg.sprite.Sprite):
         self.isHorizontal = False
         self.frameCount = 0
 
+    def kill(self):
+        """Remove the sprite from all groups and store it in its pool to be reused."""
+        super().kill()
+        getSpritePool(PointsSprite).release(self)
+
     def update(self):
         """Increase frameCount. Moves the sprite two pixels forward for the first six frames, and disappears
         once frameCount is 40.
@@ -3,17 +3,36 @@ import pygame as pg
 from game.sprites.sprite_sheet import SpriteSheet
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
+from game.tools.event_bus import eventBus
+from game.tools.sprite_pool import getSpritePool
+from game.tools.transform_cache import getFlippedImage, getRotatedImage
 
 
 class RubberTrapSprite(pg.sprite.Sprite):
-    """Create a sprite of the player character."""
+    """Create a sprite of the player character.
+
+    The sprite's state is stored in __slots__ instead of a per-instance dict, and its images are stored once in
+    class variables, as every rubber trap shares the same sprite sheet.
+
+    Class variables:
+        animationFrames: A tuple of 4 shared Surface objects from the trap sprite sheet.
+            Is None until the first rubber trap sprite is created.
+        emptyImage: A Surface object, showing a fully-transparent blank image.
+            Used when the sprite should not be visibly drawn onscreen.
+        revealImage: A Surface object, showing an opaque blank image.
+            Used for the single frame in which the sprite is first triggered.
+    """
+
+    __slots__ = ("coordinates", "trapState", "collidingPlayer", "isHorizontal", "flipTrigger", "frameCount",
+                 "image", "rect", "collisionRect")
+    animationFrames = None
+    emptyImage = None
+    revealImage = None
 
     def __init__(self):
         """Init RubberTrapSprite.
 
         Instance variables:
-            spriteSheet: The SpriteSheet object for the trap sprite sheet image.
-            animationFrames: A list of 4 Surface objects from the SpriteSheet object
             coordinates: A tuple location to blit the sprite on the screen.
             trapState: An OtherStates Enum instance of the current state of the sprite.
                 Used to determine which methods get called and when.
@@ -23,36 +42,53 @@ class RubberTrapSprite(pg.sprite.Sprite):
             flipTrigger: A boolean indicating if the trap is in a step in its animation where it is triggered and
                 its image should be flipped.
             frameCount: An integer that increases whenever the animateTrap method is called.
-            emptyImage: A Surface object, showing a fully-transparent blank image.
-                Used when the sprite should not be visibly drawn onscreen.
             image: The current image to be drawn for the sprite.
                 Defaults to the emptyImage.
             rect: A rect object for the sprite.
             collisionRect: A smaller rect object used for checking collision between this sprite and others.
                 This creates a better visual for collision than using the main rect object.
         """
-        super().__init__(c.rubberGroup)
+        super().__init__()
+        RubberTrapSprite.loadImages()
+        self.reset()
+
+    @classmethod
+    def loadImages(cls):
+        """Load the images shared by every rubber trap sprite from the trap sprite sheet, if they are not loaded
+        yet."""
+        if cls.animationFrames is not None:
+            return
         spriteSheet = SpriteSheet("trap.png")
-        self.animationFrames = []
-
+        cls.emptyImage = spriteSheet.getSharedSheetImage(0, 240, 60, 56)
+        cls.revealImage = spriteSheet.getSharedSheetImage(0, 240, 60, 56, key=c.RED)
+        cls.animationFrames = spriteSheet.getSharedStripImages(0, 0, 60, 56, 4, key=c.RED)
+        for image in (cls.emptyImage, cls.revealImage) + cls.animationFrames:
+            getRotatedImage(image, 90)
+            getRotatedImage(getFlippedImage(image, False, True), 90)
+
+    def reset(self):
+        """Put the sprite back into its initial state and add it to rubberGroup, so it can be reused from its
+        pool."""
+        self.add(c.rubberGroup)
         self.coordinates = (0, 0)
         self.trapState = c.OtherStates.OFF_SCREEN
         self.collidingPlayer = None
         self.isHorizontal = self.flipTrigger = False
         self.frameCount = 0
 
-        self.animationFrames.extend(spriteSheet.getStripImages(0, 0, 60, 56, 4, key=c.RED))
-        self.emptyImage = spriteSheet.getSheetImage(0, 240, 60, 56, key=c.RED)
-
         self.image = self.emptyImage
-        self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
         self.collisionRect = pg.rect.Rect((0, 0), (16, 32))
 
+    def kill(self):
+        """Remove the sprite from all groups and store it in its pool to be reused."""
+        super().kill()
+        getSpritePool(RubberTrapSprite).release(self)
+
     def setCoordinates(self, x, y):
         """Set the sprite's coordinates to the passed arguments.
 
-        This also adjusts the location of rect and collisionRect.
+        This also adjusts the location of rect and collisionRect, and moves the sprite in rubberGrid.
         Because collisionRect is a rectangle, its exact coordinates, width, and height depend on whether or not
         this sprite is facing horizontally.
 
@@ -70,15 +106,16 @@ class RubberTrapSprite(pg.sprite.Sprite):
         else:
             self.collisionRect = pg.rect.Rect((x + verticalOffsets[0], y + horizontalOffsets[0]),
                                               (verticalOffsets[1], horizontalOffsets[1]))
+        c.rubberGrid.insert(self, self.rect.union(self.collisionRect))
 
     def rotateImage(self):
         """Rotate the sprite's image 90 degrees to the left if it is vertical."""
         if not self.isHorizontal:
-            self.image = pg.transform.rotate(self.image, 90)
+            self.image = getRotatedImage(self.image, 90)
 
     def flipImage(self):
         """Flip the image vertically."""
-        self.image = pg.transform.flip(self.image, False, True)
+        self.image = getFlippedImage(self.image, False, True)
 
     def update(self):
         """Depending on trapState, determine which method to call, then check if the trap if colliding with any
@@ -97,21 +134,24 @@ class RubberTrapSprite(pg.sprite.Sprite):
         """Check if the sprite's rects are colliding with any of the player sprites.
 
         If the item sprite is not in the TRIGGERED state and collides with a player sprite, its state becomes the
-        TRIGGERED state.
+        TRIGGERED state. If it had not been revealed before, a TRAP_REVEALED event is published.
         The flipTrigger boolean is set to True if the colliding player is moving left or upwards, so the trap
         appears to be contorting around the player (As opposed to doing so in the direction opposite the player).
         """
         if self.trapState != c.OtherStates.TRIGGERED:
-            for player in c.playerGroup:
+            for player in c.playerGrid.query(self.collisionRect):
                 if self.collisionRect.colliderect(player.collisionRect) and\
                                 player.playerState == c.PlayerStates.MOVING:
-                    if self.trapState == c.OtherStates.OFF_SCREEN:
-                        self.image.set_colorkey(c.RED)
+                    isRevealing = self.trapState == c.OtherStates.OFF_SCREEN
+                    if isRevealing:
+                        self.image = self.revealImage
                         playSound("bounce_rubber_or_player.wav")
                     else:
                         playSound("bounce_wall.wav")
                     self.collidingPlayer = player
                     self.trapState = c.OtherStates.TRIGGERED
+                    if isRevealing:
+                        eventBus.publish(c.GameEvents.TRAP_REVEALED, self, player)
                     if self.collidingPlayer.facingDirection == c.Directions.LEFT or \
                             self.collidingPlayer.facingDirection == c.Directions.UP:
                         self.flipTrigger = True
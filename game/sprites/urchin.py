@@ -1,28 +1,45 @@
 import pygame as pg
-import random
 import sys
 
+from game.gameplay.navigation_grid import navigationGrid
 from game.sprites.player import PlayerSprite
 from game.sprites.sprite_sheet import SpriteSheet
 from game.tools.asset_cache import playSound
 import game.tools.constants as c
+from game.tools.event_bus import eventBus
+from game.tools.game_random import gameRandom
+from game.tools.sprite_pool import getSpritePool
+from game.tools.transform_cache import cacheImageVariants, getFlippedImage
 
 
 class UrchinSprite(pg.sprite.Sprite):
     """Create a sprite of the urchin enemy.
 
+    The sprite's state is stored in __slots__ instead of a per-instance dict, and its images are stored once in
+    class variables, as every urchin shares the same sprite sheet.
+
     Class variables:
         isFrozen: A boolean indicating if the sprite is currently unable to move due to the methods of an
-            ItemClock sprite.
+            ItemClock sprite. Set by the FREEZE_STARTED and FREEZE_ENDED events of the eventBus.
+        imageDictKeys: A tuple of the keys in imageDict that take animation images from the sprite sheet.
+        imageDict: A dict associating the keys BLUE and YELLOW with sub-dictionaries. These sub-dictionaries
+            associate keywords with lists of Surface objects from the urchin sprite sheet.
+            Is None until the first urchin sprite is created.
+        emptyImage: A Surface object, showing a fully-transparent blank image.
+            Used when the sprite should not be visibly drawn onscreen.
     """
 
+    __slots__ = ("coordinates", "enemyState", "color", "facingDirection", "bouncingOff", "running", "frameCount",
+                 "animationCount", "delayCount", "audioCount", "image", "rect", "collisionRect")
     isFrozen = False
+    imageDictKeys = ("horizontal", "vertical", "ball")
+    imageDict = None
+    emptyImage = None
 
     def __init__(self):
         """Init UrchinSprite.
 
         Instance variables:
-            spriteSheet: The SpriteSheet object for the urchin sprite sheet image.
             coordinates: A tuple location to blit the sprite on the screen.
             enemyState: An EnemyStates Enum instance of the current state of the sprite.
                 Used to determine which methods get called and when.
@@ -41,18 +58,47 @@ class UrchinSprite(pg.sprite.Sprite):
                 This is tracked for the purposes of controlling when to change the enemyState.
             delayCount: An integer representing how long the sprite must wait at an intersection before it can
                 move.
-            imageDict: A dict associating the keys BLUE and YELLOW with sub-dictionaries. These sub-dictionaries
-                associate keywords with lists of Surface objects from the SpriteSheet object.
-            emptyImage: A Surface object, showing a fully-transparent blank image.
-                Used when the sprite should not be visibly drawn onscreen.
+            audioCount: An integer that increases whenever the sprite is pushed or shot, used to space out how
+                often their sounds are played.
             image: The current image to be drawn for the sprite.
                 Defaults to the emptyImage.
             rect: A rect object for the sprite.
             collisionRect: A smaller rect object used for checking collision between this sprite and others.
                 This creates a better visual for collision than using the main rect object.
         """
-        super().__init__(c.enemyGroup)
+        super().__init__()
+        UrchinSprite.loadImages()
+        self.reset()
+
+    @classmethod
+    def loadImages(cls):
+        """Load the images shared by every urchin sprite from the urchin sprite sheet, if they are not loaded yet."""
+        if cls.imageDict is not None:
+            return
         spriteSheet = SpriteSheet("urchin.png")
+        imageDict = {c.BLUE: {}, c.YELLOW: {}}
+
+        # xValue is used to prevent repetition, as we need to call getStripImages three times in total with very
+        # similar arguments, differing only by xValue each time, and only by 34 each time.
+        # In this case, we want (0, 0, 34, 34); (0, 34, 34, 34); (0, 68, 34, 34)
+        xValue = 0
+        for key in cls.imageDictKeys:
+            stripImages = spriteSheet.getSharedStripImages(0, xValue, 34, 34)
+            imageDict[c.BLUE][key] = [stripImages[0], stripImages[1]]
+            imageDict[c.YELLOW][key] = [stripImages[2], stripImages[3]]
+            xValue += 34
+        imageDict[c.BLUE]["death"] = imageDict[c.YELLOW]["death"] = spriteSheet.getSharedStripImages(0, 102, 34, 34)
+        cls.emptyImage = spriteSheet.getSharedSheetImage(0, 136, 34, 34)
+        cls.imageDict = imageDict
+        for colorImages in imageDict.values():
+            for images in colorImages.values():
+                cacheImageVariants(images, flips=((True, False), (False, True)))
+        cacheImageVariants((cls.emptyImage,), flips=((True, False), (False, True)))
+
+    def reset(self):
+        """Put the sprite back into its initial state and add it to enemyGroup, so it can be reused from its
+        pool."""
+        self.add(c.enemyGroup)
         self.coordinates = (0, 0)
         self.enemyState = c.EnemyStates.SMALL_BALL
         self.color = c.BLUE
@@ -61,31 +107,40 @@ class UrchinSprite(pg.sprite.Sprite):
         self.frameCount = self.animationCount = self.delayCount = 0
         self.audioCount = 1
 
-        self.imageDict = {c.BLUE: {}, c.YELLOW: {}}
-        self.imageDictKeys = ["horizontal", "vertical", "ball"]
-
-        # xValue is used to prevent repetition, as we need to call getStripImages three times in total with very
-        # similar arguments, differing only by xValue each time, and only by 34 each time.
-        # In this case, we want (0, 0, 34, 34); (0, 34, 34, 34); (0, 68, 34, 34)
-        xValue = 0
-        for key in self.imageDictKeys:
-            stripImages = spriteSheet.getStripImages(0, xValue, 34, 34)
-            self.imageDict[c.BLUE][key] = [stripImages[0], stripImages[1]]
-            self.imageDict[c.YELLOW][key] = [stripImages[2], stripImages[3]]
-            xValue += 34
-        self.imageDict[c.BLUE]["death"] = self.imageDict[c.YELLOW]["death"]\
-            = spriteSheet.getStripImages(0, 102, 34, 34)
-        self.emptyImage = spriteSheet.getSheetImage(0, 136, 34, 34)
-
         self.image = self.emptyImage
         self.image.set_colorkey(c.BLACK)
         self.rect = self.image.get_rect()
         self.collisionRect = pg.rect.Rect((0, 0), (18, 18))
 
+    def kill(self):
+        """Remove the sprite from all groups and store it in its pool to be reused."""
+        super().kill()
+        getSpritePool(UrchinSprite).release(self)
+
+    @classmethod
+    def freeze(cls, item, player):
+        """Stop every urchin sprite from moving, as a player collects a clock item.
+
+        Args:
+            item: The ItemClock object that was collected.
+            player: The PlayerSprite object that collected it.
+        """
+        cls.isFrozen = True
+
+    @classmethod
+    def unfreeze(cls, item, player):
+        """Let every urchin sprite move again, as the effect of a clock item ends.
+
+        Args:
+            item: The ItemClock object whose effect ended.
+            player: The PlayerSprite object that collected it.
+        """
+        cls.isFrozen = False
+
     def setCoordinates(self, x, y):
         """Set the sprite's coordinates to the passed arguments.
 
-        This also adjusts the location of rect and collisionRect.
+        This also adjusts the location of rect and collisionRect, and moves the sprite in enemyGrid.
 
         Args:
             x: An integer x coordinate to draw the sprite.
@@ -94,6 +149,7 @@ class UrchinSprite(pg.sprite.Sprite):
         self.coordinates = x, y
         self.rect.topleft = x, y
         self.collisionRect = pg.rect.Rect((x + 8, y + 8), (18, 18))
+        c.enemyGrid.insert(self, self.rect.union(self.collisionRect))
 
     def isFacingHorizontally(self):
         """Check if the sprite is currently facing one of the horizontal directions.
@@ -108,9 +164,9 @@ class UrchinSprite(pg.sprite.Sprite):
         facing up.
         """
         if self.facingDirection == c.Directions.LEFT:
-            self.image = pg.transform.flip(self.image, True, False)
+            self.image = getFlippedImage(self.image, True, False)
         elif self.facingDirection == c.Directions.UP:
-            self.image = pg.transform.flip(self.image, False, True)
+            self.image = getFlippedImage(self.image, False, True)
 
     def changeImage(self, imageKey, imageIndex):
         """Change the current image of the sprite.
@@ -250,6 +306,7 @@ class UrchinSprite(pg.sprite.Sprite):
                 self.changeImage(key, index)
         elif self.enemyState == c.EnemyStates.OFF_SCREEN:
             if self.frameCount % 32 == 0:
+                c.enemyGrid.remove(self)
                 self.kill()
 
         # All methods that rely on frameCount do so in factors of 480. To keep frameCount from increasing
@@ -266,10 +323,10 @@ class UrchinSprite(pg.sprite.Sprite):
         will wait for 40, 60, or 80 frames each.
         The sprite will not change its direction while it is frozen.
         """
-        randomValue = random.randint(0, 40)
+        randomValue = gameRandom.randint(0, 40)
         if randomValue < 2:
             self.frameCount = 0
-            self.delayCount = random.randint(0, 5)
+            self.delayCount = gameRandom.randint(0, 5)
             self.enemyState = c.EnemyStates.WAITING
         elif randomValue < 10 and not UrchinSprite.isFrozen:
             self.setRandomDirection()
@@ -281,7 +338,7 @@ class UrchinSprite(pg.sprite.Sprite):
 
         If the sprite is running, its speed is doubled.
 
-        If the sprite crosses over the left or right edge of the screen, they reappear at the opposite edge.
+        If the sprite crosses over the left or right edge of the level, they reappear at the opposite edge.
         Crossing over the upper or lower edge of the screen should not be possible. If it were to happen, another
         enemy would not spawn in the urchin's place, but the game would be able to continue.
         If the enemy is in the waiting state, it won't move and will instead wait for 20, 40, 60, or 80 frames
@@ -290,6 +347,8 @@ class UrchinSprite(pg.sprite.Sprite):
         pushed by a player).
         If the sprite's color is BLUE, it will check if it is colliding with a level boundary's rect, a revealed
         gold sprite, a revealed rubber trap sprite, or another urchin. If so, it reverses its direction.
+        The check for collision with the level boundaries, gold and rubber traps is looked up in the navigationGrid
+        (See navigation_grid.py).
 
         Args:
             moveVal: An integer showing how many pixels the sprite should move every other frame.
@@ -311,31 +370,29 @@ class UrchinSprite(pg.sprite.Sprite):
             elif self.facingDirection == c.Directions.LEFT:
                 self.setCoordinates(self.coordinates[0] - moveVal, self.coordinates[1])
                 if self.rect.right < 0:
-                    self.setCoordinates(512, self.coordinates[1])
+                    self.setCoordinates(PlayerSprite.currentLevel.boardSize[0], self.coordinates[1])
             elif self.facingDirection == c.Directions.RIGHT:
                 self.setCoordinates(self.coordinates[0] + moveVal, self.coordinates[1])
-                if self.rect.left > 512:
+                if self.rect.left > PlayerSprite.currentLevel.boardSize[0]:
                     self.setCoordinates(-48, self.coordinates[1])
             if self.color == c.BLUE:
-                if any(self.rect.colliderect(levelRect) for levelRect in PlayerSprite.currentLevel.levelBorderRects) \
-                        or any(self.collisionRect.colliderect(gold.collisionRect) for gold in c.goldGroup if
-                               gold.goldState != c.OtherStates.OFF_SCREEN) \
-                        or any(self.collisionRect.colliderect(rubberTrap.collisionRect) for rubberTrap in c.rubberGroup
-                               if rubberTrap.trapState != c.OtherStates.OFF_SCREEN):
+                if navigationGrid.isBlocked(self.rect, self.collisionRect):
                     self.bouncingOff = True
                     self.reverseDirection()
         if self.bouncingOff:
-            otherUrchins = [enemy for enemy in c.enemyGroup if
-                            (enemy != self and enemy.enemyState not in [c.EnemyStates.OFF_SCREEN])]
-            if not any(self.rect.colliderect(enemy) for enemy in otherUrchins) and\
-                    not any(self.rect.colliderect(levelRect) for levelRect in
-                            PlayerSprite.currentLevel.levelBorderRects) and\
-                    not any(self.collisionRect.colliderect(gold.collisionRect) for gold in c.goldGroup if
-                            gold.goldState != c.OtherStates.OFF_SCREEN) and\
-                    not any(self.collisionRect.colliderect(rubberTrap.collisionRect) for rubberTrap in c.rubberGroup
-                            if rubberTrap.trapState != c.OtherStates.OFF_SCREEN):
+            if not self.isCollidingWithOtherUrchin() and not navigationGrid.isBlocked(self.rect, self.collisionRect):
                 self.bouncingOff = False
 
+    def isCollidingWithOtherUrchin(self):
+        """Check if the sprite's rect is colliding with any other urchin sprites that are not in the OFF_SCREEN
+        state.
+
+        Returns:
+            A boolean representing whether the sprite is colliding with another urchin sprite.
+        """
+        return any(self.rect.colliderect(enemy) for enemy in c.enemyGrid.query(self.rect) if
+                   (enemy != self and enemy.enemyState not in [c.EnemyStates.OFF_SCREEN]))
+
     def animateMovement(self):
         """Change the sprite's image every 8 frames to create the illusion of animation."""
         if self.frameCount % 16 < 8:
@@ -392,9 +449,7 @@ class UrchinSprite(pg.sprite.Sprite):
         This method is ignored unless the urchin is currently in a moving state, and its color is BLUE.
         """
         if self.enemyState == c.EnemyStates.MOVING and self.color == c.BLUE:
-            otherUrchins = [enemy for enemy in c.enemyGroup if (enemy != self and
-                            enemy.enemyState not in [c.EnemyStates.OFF_SCREEN])]
-            if any(self.rect.colliderect(enemy) for enemy in otherUrchins):
+            if self.isCollidingWithOtherUrchin():
                 self.frameCount = 0
                 if not self.bouncingOff:
                     self.reverseDirection()
@@ -416,13 +471,14 @@ class UrchinSprite(pg.sprite.Sprite):
         self.audioCount += 1
         if self.audioCount % 10 == 0:
             playSound("push_or_shoot_enemy.wav")
-        if any(levelRect.colliderect(self.collisionRect) for levelRect in PlayerSprite.currentLevel.levelBorderRects)\
-                and self.enemyState != c.EnemyStates.EXPLODING:
+        if PlayerSprite.currentLevel.isCollidingWithBorder(self.collisionRect) and\
+                self.enemyState != c.EnemyStates.EXPLODING:
             playSound("crush_enemy.wav")
             self.enemyState = c.EnemyStates.EXPLODING
             self.frameCount = 0
             self.changeImage("death", 0)
             pushingPlayer.killedUrchinCount += 1
+            eventBus.publish(c.GameEvents.ENEMY_KILLED, self, pushingPlayer)
         else:
             if self.isFacingHorizontally() == pushingPlayer.isFacingHorizontally():
                 self.facingDirection = pushingPlayer.facingDirection
@@ -461,4 +517,8 @@ class UrchinSprite(pg.sprite.Sprite):
 
     def setRandomDirection(self):
         """Randomly choose one of the four cardinal directions to be the sprite's new facingDirection."""
-        self.facingDirection = random.choice(c.directionList)
+        self.facingDirection = gameRandom.choice(c.directionList)
+
+
+eventBus.subscribe(c.GameEvents.FREEZE_STARTED, UrchinSprite.freeze)
+eventBus.subscribe(c.GameEvents.FREEZE_ENDED, UrchinSprite.unfreeze)
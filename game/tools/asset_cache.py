@@ -1,6 +1,7 @@
 import os
 import pygame
 import sys
+import threading
 
 import game.tools.constants as c
 
@@ -9,6 +10,22 @@ _imageLibrary = {}
 _soundLibrary = {}
 
 
+def reportMissingAsset(message):
+    """Print an error message for an asset that could not be loaded, and close the game.
+
+    Only the main thread can close the game. On any other thread (Such as the prefetch thread), a pygame.error
+    holding the message is raised instead, so that the thread can pass it on to the main thread.
+
+    Args:
+        message: The string describing which asset could not be loaded.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        raise pygame.error(message)
+    print("ERROR: {}".format(message))
+    pygame.quit()
+    sys.exit()
+
+
 def getImage(folder, imageFile):
     """Get an image from the passed folder and file location.
 
@@ -30,15 +47,13 @@ def getImage(folder, imageFile):
         try:
             image = pygame.image.load(fullPath).convert()
             _imageLibrary[imageFile] = image
-        except pygame.error:
-            print("ERROR: Cannot find image '{}' in folder '{}'".format(imageFile, folder))
-            pygame.quit()
-            sys.exit()
+        except (pygame.error, FileNotFoundError):
+            reportMissingAsset("Cannot find image '{}' in folder '{}'".format(imageFile, folder))
     return image
 
 
-def playSound(soundFile):
-    """Play a sound from the passed file location, in the music folder path.
+def loadSound(soundFile):
+    """Get a sound from the passed file location, in the music folder path.
 
     If the sound has not already been loaded, it loads the sound as a pygame mixer sound object.
     If the sound has already been loaded before, it simply returns the sound.
@@ -46,6 +61,9 @@ def playSound(soundFile):
 
     Args:
         soundFile: The string of the file for the sound, not including the file path.
+
+    Returns:
+        sound: A pygame mixer sound object made with the passed sound file.
     """
     global _soundLibrary
     sound = _soundLibrary.get(soundFile)
@@ -54,8 +72,19 @@ def playSound(soundFile):
         try:
             sound = pygame.mixer.Sound(fullPath)
             _soundLibrary[soundFile] = sound
-        except pygame.error:
-            print("ERROR: Cannot find sound '{}'".format(soundFile))
-            pygame.quit()
-            sys.exit()
-    sound.play()
+        except (pygame.error, FileNotFoundError):
+            reportMissingAsset("Cannot find sound '{}'".format(soundFile))
+    return sound
+
+
+def playSound(soundFile):
+    """Play a sound from the passed file location, in the music folder path, loading it with loadSound.
+
+    No sound is played if the game is running in headless mode.
+
+    Args:
+        soundFile: The string of the file for the sound, not including the file path.
+    """
+    if c.HEADLESS:
+        return
+    loadSound(soundFile).play()
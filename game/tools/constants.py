@@ -2,6 +2,9 @@ from enum import Enum
 import os
 import pygame as pg
 
+from game.tools.engine_group import EngineGroup
+from game.tools.spatial_grid import SpatialGrid
+
 
 # # # FILE PATHS # # #
 
@@ -12,6 +15,9 @@ RESOURCE_FOLDER = os.path.join(GAME_FOLDER, "resources")
 SPRITE_SHEET_FOLDER = os.path.join(RESOURCE_FOLDER, "sprite_sheets")
 BACKGROUND_FOLDER = os.path.join(RESOURCE_FOLDER, "backgrounds")
 MUSIC_FOLDER = os.path.join(RESOURCE_FOLDER, "music")
+REPLAY_FOLDER = os.path.join(RESOURCE_FOLDER, "replays")
+PROFILE_FOLDER = os.path.join(RESOURCE_FOLDER, "profiles")
+BENCHMARK_FOLDER = os.path.join(RESOURCE_FOLDER, "benchmarks")
 
 # # # MUSIC FILES # # #
 
@@ -51,9 +57,20 @@ ORANGE = (250, 150, 55)
 PINK = (250, 115, 180)
 CYAN = (60, 180, 250)
 
+# Used as the color key for surfaces that sprites are drawn onto, so it must not appear in any sprite sheet
+MAGENTA = (255, 0, 254)
+
 
 # # # PYGAME CONSTANTS # # #
 
+# If the CLU_HEADLESS environment variable is set to 1 before the game is imported, pygame uses its dummy video and
+# audio drivers. Nothing is ever shown or heard, and no sounds are played, so the game logic can be run as fast as
+# possible with game.gameplay.simulation.
+HEADLESS = os.environ.get("CLU_HEADLESS") == "1"
+if HEADLESS:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
 pg.mixer.pre_init(frequency=44100, buffer=512)
 pg.init()
 pg.font.init()
@@ -61,6 +78,31 @@ pg.font.init()
 CLOCK = pg.time.Clock()
 FPS = 60
 
+# If DIRTY_RECT_RENDERING is True, levels only redraw and update the regions of the screen that change each frame,
+# rather than the whole screen.
+DIRTY_RECT_RENDERING = True
+
+# If FIXED_TIMESTEP is True, levels run their game logic at FPS ticks per second of real time, running several ticks
+# before drawing a frame whenever drawing falls behind. At most MAX_TICKS_PER_FRAME ticks are run before each frame is
+# drawn, so that the game slows down rather than freezing if the computer cannot keep up at all.
+FIXED_TIMESTEP = True
+MAX_TICKS_PER_FRAME = 5
+
+# If the CLU_RECORD_REPLAYS environment variable is set to 1, the seed and inputs of every game are saved to the replay
+# folder, so that any game can be replayed exactly with game.gameplay.simulation.replayGame.
+RECORD_REPLAYS = os.environ.get("CLU_RECORD_REPLAYS") == "1"
+
+# If the CLU_PROFILE environment variable is set to 1, every part of each tick of gameplay is timed. The average times
+# are shown in the top-left of the screen, and the times of the last PROFILE_MAX_FRAMES ticks of each level are saved
+# to the profile folder when it ends. See game.tools.profiler.
+PROFILE_FRAMES = os.environ.get("CLU_PROFILE") == "1"
+PROFILE_MAX_FRAMES = 36000
+
+# If the CLU_GOLD_ENGINE environment variable is set to "numpy", the gold sprites of each level are updated all at once
+# by a GoldEngine, which steps their states with NumPy arrays. If NumPy is not installed, the gold sprites are updated
+# one at a time as usual. See game.gameplay.gold_engine.
+GOLD_ENGINE = os.environ.get("CLU_GOLD_ENGINE") == "numpy"
+
 
 # # # FONT AND TEXT # # #
 
@@ -143,6 +185,21 @@ class Directions(Enum):
     COUNTER = "counter-clockwise"
 
 
+class GameEvents(Enum):
+    """Possible events published to the eventBus during gameplay (See event_bus.py for the arguments of each)."""
+    GOLD_STATE_CHANGED = "gold state changed"
+    GOLD_COLLECTED = "gold collected"
+    ENEMY_SPAWNED = "enemy spawned"
+    ENEMY_KILLED = "enemy killed"
+    PLAYER_DIED = "player died"
+    GAME_OVER = "game over"
+    ITEM_COLLECTED = "item collected"
+    TRAP_REVEALED = "trap revealed"
+    FREEZE_STARTED = "freeze started"
+    FREEZE_ENDED = "freeze ended"
+    TIME_LOW = "time low"
+
+
 # The directionsDict associates each string representation of the four cardinal directions with the corresponding
 # Directions Enum, to assign the Enum value to a variable when passed the string.
 # The directionList is ordered such that 90 * [index] is the number of degrees an image facing right would have to
@@ -157,7 +214,7 @@ displayGroup = pg.sprite.Group()
 itemGroup = pg.sprite.Group()
 blackHoleGroup = pg.sprite.Group()
 enemyGroup = pg.sprite.Group()
-goldGroup = pg.sprite.Group()
+goldGroup = EngineGroup()
 rubberGroup = pg.sprite.Group()
 armGroup = pg.sprite.Group()
 playerGroup = pg.sprite.Group()
@@ -172,3 +229,14 @@ textGroup = pg.sprite.Group()
 oneLevelOnlyGroups = (displayGroup, blackHoleGroup, enemyGroup, goldGroup, rubberGroup, attackGroup, textGroup)
 allGroups = (displayGroup, itemGroup, blackHoleGroup, enemyGroup, goldGroup, rubberGroup, armGroup, playerGroup,
              attackGroup, textGroup)
+
+# The spatial grids index the sprites of the matching groups by the level tiles they overlap, so that collision checks
+# only need to look at nearby sprites.
+# oneLevelOnlyGrids includes all grids that should be cleared at the start of each level, along with
+# oneLevelOnlyGroups.
+goldGrid = SpatialGrid()
+rubberGrid = SpatialGrid()
+enemyGrid = SpatialGrid()
+playerGrid = SpatialGrid()
+
+oneLevelOnlyGrids = (goldGrid, rubberGrid, enemyGrid)
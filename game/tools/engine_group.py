@@ -0,0 +1,25 @@
+import pygame as pg
+
+
+class EngineGroup(pg.sprite.Group):
+    """Create a sprite group whose updates can be handed to an engine that updates all of its sprites at once.
+
+    While engine is None, the group updates like any other group, by calling the update method of each of its
+    sprites. Otherwise, calling update calls the engine's step method instead. Either way, the group is drawn and
+    iterated over like any other group.
+
+    Attributes:
+        engine: An object with a step method that updates every sprite in the group, or None.
+    """
+
+    def __init__(self, *sprites):
+        """Init EngineGroup using any number of sprites to add to it."""
+        super().__init__(*sprites)
+        self.engine = None
+
+    def update(self, *args, **kwargs):
+        """Update every sprite in the group, using the engine if there is one."""
+        if self.engine is not None:
+            self.engine.step()
+        else:
+            super().update(*args, **kwargs)
@@ -0,0 +1,139 @@
+import inspect
+
+import game.tools.constants as c
+
+
+# eventArguments associates each GameEvents Enum instance with the names of the arguments it is published with, in
+# order. Every listener subscribed to an event is called with exactly these arguments.
+eventArguments = {
+    c.GameEvents.GOLD_STATE_CHANGED: ("gold", "oldState", "newState"),
+    c.GameEvents.GOLD_COLLECTED: ("gold", "player"),
+    c.GameEvents.ENEMY_SPAWNED: ("enemy", "blackHole"),
+    c.GameEvents.ENEMY_KILLED: ("enemy", "player"),
+    c.GameEvents.PLAYER_DIED: ("player",),
+    c.GameEvents.GAME_OVER: ("player",),
+    c.GameEvents.ITEM_COLLECTED: ("item", "player"),
+    c.GameEvents.TRAP_REVEALED: ("trap", "player"),
+    c.GameEvents.FREEZE_STARTED: ("item", "player"),
+    c.GameEvents.FREEZE_ENDED: ("item", "player"),
+    c.GameEvents.TIME_LOW: ("timeCount",),
+}
+
+
+class EventBus:
+    """Pass gameplay events from the objects they happen to, to every function that has subscribed to them.
+
+    This lets the parts of the game react to each other only when something changes, rather than every part
+    checking the others' states every frame. The event types and the arguments each is published with are listed
+    in eventArguments:
+        GOLD_STATE_CHANGED: A gold sprite in goldGroup was created, killed, or changed its goldState. A state of
+            None means the sprite was not in goldGroup.
+        GOLD_COLLECTED: A player passed over a gold sprite that had not been revealed before.
+        ENEMY_SPAWNED: A black hole sprite spawned an enemy.
+        ENEMY_KILLED: A player crushed an enemy against a wall.
+        PLAYER_DIED: A player finished their death animation, and has either lost a life or run out of lives.
+        GAME_OVER: A player who ran out of lives entered the DEAD state, and will not respawn.
+        ITEM_COLLECTED: A player collected a revealed item.
+        TRAP_REVEALED: A player bounced off of a rubber trap that had not been revealed before.
+        FREEZE_STARTED: A player collected a clock item, freezing every enemy and every other player.
+        FREEZE_ENDED: The clock item's effect ran out.
+        TIME_LOW: The timer of a regular level dropped below 200.
+    Events are published during the level's logic ticks, in the same order in playLevel and in a LevelSimulation,
+    so anything subscribed to them sees the same events when a replay is played back.
+
+    Attributes:
+        listeners: A dict associating each GameEvents Enum instance with a tuple of the functions subscribed to it,
+            in the order they subscribed.
+    """
+
+    def __init__(self):
+        """Init EventBus."""
+        self.listeners = {eventType: () for eventType in c.GameEvents}
+
+    def subscribe(self, eventType, listener):
+        """Call a function every time an event of eventType is published.
+
+        The listener's arguments are checked here, once, rather than every time an event is published.
+
+        Args:
+            eventType: The GameEvents Enum instance of the event to subscribe to.
+            listener: The function to call, which takes the arguments listed in eventArguments for eventType.
+
+        Raises:
+            TypeError: If listener cannot be called with the arguments of eventType.
+        """
+        try:
+            inspect.signature(listener).bind(*eventArguments[eventType])
+        except TypeError:
+            raise TypeError("{} events are published with the arguments {}, which {} cannot take.".format(
+                eventType.name, eventArguments[eventType], listener.__qualname__)) from None
+        if listener not in self.listeners[eventType]:
+            self.listeners[eventType] += (listener,)
+
+    def unsubscribe(self, eventType, listener):
+        """Stop calling a function when an event of eventType is published.
+
+        Args:
+            eventType: The GameEvents Enum instance of the event to unsubscribe from.
+            listener: The function to stop calling. Nothing happens if it was never subscribed.
+        """
+        self.listeners[eventType] = tuple(function for function in self.listeners[eventType] if function != listener)
+
+    def publish(self, eventType, *args):
+        """Call every function subscribed to eventType with the arguments of the event.
+
+        Functions that subscribe or unsubscribe while the event is being published only take effect for the next
+        event.
+
+        Args:
+            eventType: The GameEvents Enum instance of the event that happened.
+            *args: The arguments listed in eventArguments for eventType.
+        """
+        for listener in self.listeners[eventType]:
+            listener(*args)
+
+
+class EventCounter:
+    """Count how many times each of several types of event is published to the eventBus, such as to report how
+    often enemies were killed during a simulated level.
+
+    Attributes:
+        counts: A dict associating each GameEvents Enum instance being counted with how many times it has been
+            published since the counter was started.
+        listeners: A dict associating each GameEvents Enum instance being counted with the function subscribed to
+            it.
+    """
+
+    def __init__(self, eventTypes):
+        """Init EventCounter using the iterable eventTypes of GameEvents Enum instances to count."""
+        self.counts = {eventType: 0 for eventType in eventTypes}
+        self.listeners = {eventType: self.makeListener(eventType) for eventType in self.counts}
+
+    def makeListener(self, eventType):
+        """Make a function that counts one event of eventType each time it is called.
+
+        Args:
+            eventType: The GameEvents Enum instance to count.
+
+        Returns:
+            countEvent: A function that takes any arguments, to be subscribed to eventType.
+        """
+
+        def countEvent(*args):
+            """Count one more event of eventType."""
+            self.counts[eventType] += 1
+
+        return countEvent
+
+    def start(self):
+        """Subscribe to every event being counted."""
+        for eventType, listener in self.listeners.items():
+            eventBus.subscribe(eventType, listener)
+
+    def stop(self):
+        """Unsubscribe from every event being counted, keeping the counts so far."""
+        for eventType, listener in self.listeners.items():
+            eventBus.unsubscribe(eventType, listener)
+
+
+eventBus = EventBus()
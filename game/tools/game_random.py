@@ -0,0 +1,22 @@
+import random
+
+
+# gameRandom is the only source of randomness used by the gameplay. It is reseeded at the start of every game, so
+# that the same seed and the same inputs always play out in exactly the same way.
+gameRandom = random.Random()
+
+
+def seedGame(seed=None):
+    """Seed the random number generator used by the gameplay.
+
+    Args:
+        seed: An integer to seed the random number generator with. Defaults to None, meaning that a new seed is
+            chosen at random.
+
+    Returns:
+        seed: The integer that the random number generator was seeded with.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    gameRandom.seed(seed)
+    return seed
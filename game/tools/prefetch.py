@@ -0,0 +1,59 @@
+import pygame as pg
+import queue
+import sys
+import threading
+
+
+_prefetchQueue = queue.Queue()
+_prefetchThread = None
+_prefetchErrors = []
+
+
+def prefetch(function, *args):
+    """Call the passed function with the passed arguments on the prefetch thread, without waiting for it.
+
+    This is used to load assets into their caches (Such as with getImage or loadSound) while the game is idle,
+    such as during the title screen or the start-of-level delay, so they are already loaded when they are needed.
+    Tasks are run one at a time, in the order they are passed. The prefetch thread is started the first time this
+    is called, and is a daemon thread, so it never keeps the game from closing.
+    Because the asset caches are only ever added to, the worst case of the main thread needing an asset the prefetch
+    thread has not finished loading is that both threads load it.
+    If an asset cannot be loaded, the error is kept until the main thread calls checkPrefetchErrors, as only the main
+    thread can close the game.
+
+    Args:
+        function: The function to call. It should only load assets into a cache, and never touch any sprite
+            groups or draw to the screen.
+        args: The arguments to pass to function.
+    """
+    global _prefetchThread
+    if _prefetchThread is None:
+        _prefetchThread = threading.Thread(target=runPrefetchTasks, name="prefetch", daemon=True)
+        _prefetchThread.start()
+    _prefetchQueue.put((function, args))
+
+
+def runPrefetchTasks():
+    """Run every task passed to prefetch, forever. This is the target of the prefetch thread.
+
+    A task that fails to load an asset raises a pygame.error (See reportMissingAsset in asset_cache.py). Its message,
+    or that of any other error a task raises, is stored for checkPrefetchErrors, and the thread moves on to the next
+    task.
+    """
+    while True:
+        function, args = _prefetchQueue.get()
+        try:
+            function(*args)
+        except Exception as error:
+            _prefetchErrors.append(str(error))
+
+
+def checkPrefetchErrors():
+    """Print an error message and close the game if any task passed to prefetch failed to load an asset.
+
+    This must only be called on the main thread.
+    """
+    if _prefetchErrors:
+        print("ERROR: {}".format(_prefetchErrors[0]))
+        pg.quit()
+        sys.exit()
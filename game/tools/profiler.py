@@ -0,0 +1,258 @@
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import csv
+import json
+import os
+import statistics
+import time
+
+import pygame as pg
+
+import game.tools.constants as c
+
+
+_overlayInterval = 30
+_overlayFont = None
+_nullSection = nullcontext()
+
+
+class FrameProfiler:
+    """Time how long each part of every tick of gameplay takes, show the averages onscreen, and save every tick's
+    timings to CSV and JSON files.
+
+    Each part of a tick is timed by calling begin and end with the same section name, or by running it inside a with
+    statement on section. A section can be timed more than once in a tick, and its times are added together. The
+    times of every section are stored in milliseconds.
+    Spatial grid queries (The broad phase of every collision check) are timed as the "collisions" section. Since
+    those queries are made by the sprites' update methods, the "collisions" time is also counted in the "update"
+    sections.
+    Profiling is only done when PROFILE_FRAMES is True (See constants.py). Otherwise, playLevel uses a NullProfiler
+    instead, which does no timing at all.
+
+    Attributes:
+        frames: A deque with one dict for each of the most recent ticks, associating each section's name with the
+            milliseconds it took during that tick.
+        sectionNames: A list of every section name that has been timed, in the order they were first timed.
+        groupSections: A list with the name of the section each group in allGroups is updated in, in the same order.
+        image: A Surface object showing the average time of each section over the last _overlayInterval ticks, or
+            None if no ticks have been timed yet.
+        coordinates: A tuple location to draw the image at. The image and coordinates let the profiler be drawn
+            like a sprite.
+    """
+
+    def __init__(self, maxFrames=None):
+        """Init FrameProfiler using the integer maxFrames.
+
+        If maxFrames is None, the PROFILE_MAX_FRAMES constant is used instead.
+
+        Instance variables:
+            currentFrame: A dict of the section times of the tick currently being timed.
+            startTimes: A dict associating each section name with the time its latest call to begin was made.
+            frameStartTime: The time the current tick began.
+            instrumentedGrids: A list of the SpatialGrid objects whose queries are being timed.
+            tickCount: An integer count of how many ticks have been timed.
+        """
+        self.frames = deque(maxlen=maxFrames or c.PROFILE_MAX_FRAMES)
+        self.sectionNames = []
+        self.groupSections = ["update " + name[:-len("Group")] for group in c.allGroups
+                              for name, value in vars(c).items() if value is group]
+        self.image = None
+        self.coordinates = (4, 40)
+        self.currentFrame = {}
+        self.startTimes = {}
+        self.frameStartTime = time.perf_counter()
+        self.instrumentedGrids = []
+        self.tickCount = 0
+        for grid in (c.goldGrid, c.rubberGrid, c.enemyGrid, c.playerGrid):
+            self.instrumentGrid(grid)
+
+    def instrumentGrid(self, grid):
+        """Make every query of a spatial grid be timed as part of the "collisions" section.
+
+        The timed query methods are set on the grid object itself, so removing them in finish restores the
+        SpatialGrid class's methods.
+
+        Args:
+            grid: The SpatialGrid object to be timed.
+        """
+        def timeQuery(queryMethod):
+            def timedQuery(*args):
+                startTime = time.perf_counter()
+                nearbyObjects = queryMethod(*args)
+                self.addTime("collisions", time.perf_counter() - startTime)
+                return nearbyObjects
+            return timedQuery
+
+        grid.query = timeQuery(grid.query)
+        grid.queryPoint = timeQuery(grid.queryPoint)
+        self.instrumentedGrids.append(grid)
+
+    def startFrame(self):
+        """Begin timing a new tick."""
+        self.currentFrame = {}
+        self.frameStartTime = time.perf_counter()
+
+    def begin(self, section):
+        """Start timing a section of the current tick.
+
+        Args:
+            section: The string name of the section.
+        """
+        self.startTimes[section] = time.perf_counter()
+
+    def end(self, section):
+        """Stop timing a section of the current tick, adding the time since begin was called to it.
+
+        Args:
+            section: The string name of the section.
+        """
+        self.addTime(section, time.perf_counter() - self.startTimes[section])
+
+    @contextmanager
+    def section(self, section):
+        """Time the body of a with statement as a section of the current tick.
+
+        Args:
+            section: The string name of the section.
+        """
+        self.begin(section)
+        try:
+            yield
+        finally:
+            self.end(section)
+
+    def addTime(self, section, seconds):
+        """Add time to a section of the current tick.
+
+        Args:
+            section: The string name of the section.
+            seconds: A float number of seconds to add.
+        """
+        if section not in self.currentFrame:
+            self.currentFrame[section] = 0
+            if section not in self.sectionNames:
+                self.sectionNames.append(section)
+        self.currentFrame[section] += 1000 * seconds
+
+    def endFrame(self):
+        """Finish timing the current tick, storing its total time. The overlay image is remade every
+        _overlayInterval ticks."""
+        self.addTime("total", time.perf_counter() - self.frameStartTime)
+        self.frames.append(self.currentFrame)
+        self.tickCount += 1
+        if self.tickCount % _overlayInterval == 0 or self.image is None:
+            self.createOverlayImage()
+
+    def getAverages(self, frameCount=None):
+        """Get the average time of every section over the most recent ticks.
+
+        Args:
+            frameCount: An integer number of the most recent ticks to average. Defaults to None, meaning every
+                stored tick is used.
+
+        Returns:
+            averages: A dict associating each section name with its average time in milliseconds.
+        """
+        frames = list(self.frames)[-frameCount:] if frameCount else list(self.frames)
+        if not frames:
+            return {}
+        return {section: sum(frame.get(section, 0) for frame in frames) / len(frames) for section in
+                self.sectionNames}
+
+    def createOverlayImage(self):
+        """Render the average time of each section over the last _overlayInterval ticks to the overlay image."""
+        global _overlayFont
+        if _overlayFont is None:
+            _overlayFont = pg.font.Font(None, 16)
+        averages = self.getAverages(_overlayInterval)
+        lines = [_overlayFont.render("{:<18}{:6.2f} ms".format(section, averages[section]), True, c.WHITE, c.BLACK)
+                 for section in sorted(averages, key=lambda section: (section != "total", section))]
+        self.image = pg.Surface((max(line.get_width() for line in lines), 14 * len(lines)))
+        for num, line in enumerate(lines):
+            self.image.blit(line, (0, 14 * num))
+
+    def getSummary(self):
+        """Get the mean, 95th percentile, and maximum time of every section over every stored tick.
+
+        Returns:
+            summary: A dict associating each section name with a dict of its "mean", "p95" and "max" times in
+                milliseconds.
+        """
+        summary = {}
+        for section in self.sectionNames:
+            times = sorted(frame.get(section, 0) for frame in self.frames)
+            if times:
+                summary[section] = {"mean": statistics.mean(times), "p95": times[int(0.95 * (len(times) - 1))],
+                                    "max": times[-1]}
+        return summary
+
+    def save(self, fileName, folder=c.PROFILE_FOLDER):
+        """Write every stored tick's section times to a CSV file, and the times along with their summary to a JSON
+        file. The folder is created if it does not exist.
+
+        Args:
+            fileName: The string name of the files to write, not including the file path or extension.
+            folder: The string path of the folder to write the files to. Defaults to the profile folder.
+        """
+        os.makedirs(folder, exist_ok=True)
+        filePath = os.path.join(folder, fileName)
+        with open(filePath + ".csv", "w", newline="") as csvFile:
+            writer = csv.writer(csvFile)
+            writer.writerow(["tick"] + self.sectionNames)
+            for num, frame in enumerate(self.frames):
+                writer.writerow([num] + ["{:.4f}".format(frame.get(section, 0)) for section in self.sectionNames])
+        with open(filePath + ".json", "w") as jsonFile:
+            json.dump({"sections": self.sectionNames, "summary": self.getSummary(), "frames": list(self.frames)},
+                      jsonFile)
+
+    def finish(self, fileName=None):
+        """Stop timing spatial grid queries, and save every stored tick's section times to the profile folder.
+
+        Args:
+            fileName: The string name of the files to write, not including the file path or extension. Defaults to
+                None, meaning that nothing is saved.
+        """
+        for grid in self.instrumentedGrids:
+            del grid.query
+            del grid.queryPoint
+        self.instrumentedGrids = []
+        if fileName is not None:
+            self.save(fileName)
+
+
+class NullProfiler:
+    """Stand in for a FrameProfiler when profiling is off, so that playLevel can time each part of a tick the same
+    way whether or not it is profiling.
+
+    Every method does nothing, and section returns a context manager that does nothing.
+
+    Attributes:
+        groupSections: A list with the name of the section each group in allGroups is updated in, as in
+            FrameProfiler.
+        image: None, as there is never an overlay image to draw.
+    """
+
+    def __init__(self):
+        """Init NullProfiler."""
+        self.groupSections = ["update " + name[:-len("Group")] for group in c.allGroups
+                              for name, value in vars(c).items() if value is group]
+        self.image = None
+
+    def startFrame(self):
+        """Do nothing, as no tick is timed."""
+
+    def begin(self, section):
+        """Do nothing, as no section is timed."""
+
+    def end(self, section):
+        """Do nothing, as no section is timed."""
+
+    def section(self, section):
+        """Get a context manager that does nothing, as no section is timed."""
+        return _nullSection
+
+    def endFrame(self):
+        """Do nothing, as no tick is timed."""
+
+    def finish(self, fileName=None):
+        """Do nothing, as there are no times to save."""
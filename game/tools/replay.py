@@ -0,0 +1,109 @@
+import json
+import os
+
+import game.tools.constants as c
+
+
+# Each control is stored as a single character, to keep the saved input logs small.
+CONTROL_CODES = {"up": "u", "down": "d", "left": "l", "right": "r", "shoot": "s", "pause": "p"}
+CODE_CONTROLS = {code: control for control, code in CONTROL_CODES.items()}
+
+
+class InputLog:
+    """Record the seed of a game and the inputs used in every frame of its gameplay, so the game can be replayed
+    exactly.
+
+    For each level, only the frames where a player presses a control, or changes which controls they are holding,
+    are stored. Every other frame repeats the held controls of the frame before it.
+
+    Attributes:
+        seed: The integer that gameRandom was seeded with at the start of the game.
+        numberOfPlayers: An integer showing how many players played the game.
+    """
+
+    def __init__(self, seed, numberOfPlayers):
+        """Init InputLog using the integers seed and numberOfPlayers.
+
+        Instance variables:
+            levels: A list with one dict for each level played, in the form {"frames": frameCount, "inputs":
+                inputList}.
+                inputList is a list of [frameIndex, pressedCodes, heldCodes] lists, where pressedCodes and
+                heldCodes are lists with one string of control codes for each player.
+            previousHeldCodes: The list of heldCodes recorded for the most recent frame.
+        """
+        self.seed = seed
+        self.numberOfPlayers = numberOfPlayers
+        self.levels = []
+        self.previousHeldCodes = None
+
+    def startLevel(self):
+        """Begin recording the inputs for a new level."""
+        self.levels.append({"frames": 0, "inputs": []})
+        self.previousHeldCodes = ["" for _ in range(self.numberOfPlayers)]
+
+    def recordFrame(self, playerInputs):
+        """Record the inputs used during one frame of the current level.
+
+        Args:
+            playerInputs: A list with one tuple for each player, in the form (pressedControls, heldControls), as
+                used by applyPlayerInputs.
+        """
+        currentLevel = self.levels[-1]
+        pressedCodes = ["".join(CONTROL_CODES[control] for control in pressedControls)
+                        for pressedControls, _ in playerInputs]
+        heldCodes = ["".join(CONTROL_CODES[control] for control in heldControls) for _, heldControls in playerInputs]
+        if any(pressedCodes) or heldCodes != self.previousHeldCodes:
+            currentLevel["inputs"].append([currentLevel["frames"], pressedCodes, heldCodes])
+            self.previousHeldCodes = heldCodes
+        currentLevel["frames"] += 1
+
+    def getLevelInputs(self, levelIndex):
+        """Get the inputs used during every frame of a level.
+
+        Args:
+            levelIndex: The integer index of the level in the order it was played, starting from 0.
+
+        Returns:
+            levelInputs: A list with the playerInputs of each frame of the level, in order.
+        """
+        level = self.levels[levelIndex]
+        levelInputs = []
+        playerInputs = [([], []) for _ in range(self.numberOfPlayers)]
+        inputIndex = 0
+        for frameIndex in range(level["frames"]):
+            if inputIndex < len(level["inputs"]) and level["inputs"][inputIndex][0] == frameIndex:
+                _, pressedCodes, heldCodes = level["inputs"][inputIndex]
+                playerInputs = [([CODE_CONTROLS[code] for code in pressed], [CODE_CONTROLS[code] for code in held])
+                                for pressed, held in zip(pressedCodes, heldCodes)]
+                inputIndex += 1
+            else:
+                playerInputs = [([], heldControls) for _, heldControls in playerInputs]
+            levelInputs.append(playerInputs)
+        return levelInputs
+
+    def save(self, fileName):
+        """Write the input log to a JSON file in the replay folder, creating the folder if it does not exist.
+
+        Args:
+            fileName: The string of the file to write, not including the file path.
+        """
+        os.makedirs(c.REPLAY_FOLDER, exist_ok=True)
+        with open(os.path.join(c.REPLAY_FOLDER, fileName), "w") as replayFile:
+            json.dump({"seed": self.seed, "players": self.numberOfPlayers, "levels": self.levels}, replayFile,
+                      separators=(",", ":"))
+
+
+def loadInputLog(filePath):
+    """Read an input log from a JSON file written by InputLog.save.
+
+    Args:
+        filePath: The string path of the file to read.
+
+    Returns:
+        inputLog: An InputLog object holding the seed and inputs of the saved game.
+    """
+    with open(filePath, "r") as replayFile:
+        replayData = json.load(replayFile)
+    inputLog = InputLog(replayData["seed"], replayData["players"])
+    inputLog.levels = replayData["levels"]
+    return inputLog
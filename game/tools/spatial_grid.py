@@ -0,0 +1,131 @@
+class SpatialGrid:
+    """Create a spatial index that sorts objects into the square tiles of a uniform grid.
+
+    The spatial grid is used as a broad phase for collision checks. Rather than checking a rect against every
+    sprite in a group, a sprite checks it only against the objects that share at least one tile with it.
+    The returned objects still need to be checked for collision with colliderect or collidepoint.
+    Each object must be inserted with a rect that contains every rect it will be checked against, and must be
+    inserted again whenever that rect moves.
+
+    Attributes:
+        tileSize: An integer width and height of each tile in the grid, in pixels.
+            Defaults to 48, the size of the tiles of each level.
+    """
+
+    def __init__(self, tileSize=48):
+        """Init SpatialGrid using the integer tileSize.
+
+        Instance variables:
+            tiles: A dict associating (column, row) tuples with dicts of the objects inside of that tile.
+            objectTiles: A dict associating the id of each inserted object with the list of tiles it is in.
+            objectOrder: A dict associating the id of each inserted object with the order it was first inserted.
+                Queries return objects in this order, so they are checked in the same order as their groups.
+            insertCount: An integer count of how many objects have been inserted since the grid was last cleared.
+        """
+        self.tileSize = tileSize
+        self.tiles = {}
+        self.objectTiles = {}
+        self.objectOrder = {}
+        self.insertCount = 0
+
+    def clear(self):
+        """Remove all objects from the grid."""
+        self.tiles = {}
+        self.objectTiles = {}
+        self.objectOrder = {}
+        self.insertCount = 0
+
+    def getTiles(self, rect):
+        """Get the (column, row) tuples of every tile that the passed rect overlaps.
+
+        Args:
+            rect: A rect object, or a tuple in the form (x, y, width, height).
+
+        Returns:
+            A list of (column, row) tuples.
+        """
+        left, top, width, height = rect
+        firstColumn = left // self.tileSize
+        lastColumn = (left + max(width, 1) - 1) // self.tileSize
+        firstRow = top // self.tileSize
+        lastRow = (top + max(height, 1) - 1) // self.tileSize
+        return [(column, row) for column in range(firstColumn, lastColumn + 1)
+                for row in range(firstRow, lastRow + 1)]
+
+    def insert(self, gridObject, rect):
+        """Insert an object into every tile that the passed rect overlaps.
+
+        If the object is already in the grid, it is first removed from its old tiles, but keeps its order.
+
+        Args:
+            gridObject: The object to be inserted.
+            rect: A rect object covering every rect of gridObject that will be checked for collision.
+        """
+        objectId = id(gridObject)
+        if objectId in self.objectTiles:
+            self.removeFromTiles(objectId)
+        else:
+            self.objectOrder[objectId] = self.insertCount
+            self.insertCount += 1
+        tileList = self.getTiles(rect)
+        for tile in tileList:
+            self.tiles.setdefault(tile, {})[objectId] = gridObject
+        self.objectTiles[objectId] = tileList
+
+    def remove(self, gridObject):
+        """Remove an object from the grid. If the object is not in the grid, this method is ignored.
+
+        Args:
+            gridObject: The object to be removed.
+        """
+        objectId = id(gridObject)
+        if objectId in self.objectTiles:
+            self.removeFromTiles(objectId)
+            del self.objectTiles[objectId]
+            del self.objectOrder[objectId]
+
+    def removeFromTiles(self, objectId):
+        """Remove the object with the passed id from each tile it is in, without forgetting its order.
+
+        Args:
+            objectId: The integer id of the object to be removed.
+        """
+        for tile in self.objectTiles[objectId]:
+            tileObjects = self.tiles[tile]
+            del tileObjects[objectId]
+            if not tileObjects:
+                del self.tiles[tile]
+
+    def query(self, rect):
+        """Get every object that shares at least one tile with the passed rect.
+
+        Args:
+            rect: A rect object, or a tuple in the form (x, y, width, height).
+
+        Returns:
+            A list of the objects near rect, in the order they were first inserted.
+        """
+        nearbyObjects = {}
+        for tile in self.getTiles(rect):
+            tileObjects = self.tiles.get(tile)
+            if tileObjects:
+                nearbyObjects.update(tileObjects)
+        if len(nearbyObjects) < 2:
+            return list(nearbyObjects.values())
+        return [nearbyObjects[objectId] for objectId in sorted(nearbyObjects, key=self.objectOrder.__getitem__)]
+
+    def queryPoint(self, point):
+        """Get every object in the tile containing the passed point.
+
+        Args:
+            point: A tuple in the form (x, y).
+
+        Returns:
+            A list of the objects in the same tile as point, in the order they were first inserted.
+        """
+        tileObjects = self.tiles.get((point[0] // self.tileSize, point[1] // self.tileSize))
+        if not tileObjects:
+            return []
+        if len(tileObjects) < 2:
+            return list(tileObjects.values())
+        return [tileObjects[objectId] for objectId in sorted(tileObjects, key=self.objectOrder.__getitem__)]
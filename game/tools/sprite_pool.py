@@ -0,0 +1,110 @@
+_spritePools = {}
+
+
+class SpritePool:
+    """Store sprites that have left the game, so they can be reused instead of creating new sprites.
+
+    Every pooled sprite class must have a reset method that takes the same arguments as its __init__ method, and
+    puts the sprite back into the state __init__ leaves it in (Including adding it to its group). Reusing a sprite
+    this way skips creating its rects and looking up its shared images, and keeps the game from creating garbage
+    every time a level starts or an enemy spawns.
+
+    Attributes:
+        spriteClass: The sprite class whose objects this pool stores.
+        maxSize: The integer maximum number of sprites the pool stores. Any sprites released past this are left
+            for the garbage collector.
+        freeSprites: A dict associating the id of each stored sprite with the sprite. A dict is used so that a
+            sprite released twice is only stored once.
+    """
+
+    def __init__(self, spriteClass, maxSize=256):
+        """Init SpritePool using the sprite class spriteClass and the integer maxSize."""
+        self.spriteClass = spriteClass
+        self.maxSize = maxSize
+        self.freeSprites = {}
+
+    def get(self, *args):
+        """Get a sprite from the pool, or create a new sprite if the pool is empty.
+
+        Args:
+            *args: The arguments to pass to the sprite's reset or __init__ method.
+
+        Returns:
+            sprite: A sprite of spriteClass, in the same state as a newly created one.
+        """
+        if self.freeSprites:
+            sprite = self.freeSprites.popitem()[1]
+            sprite.reset(*args)
+            return sprite
+        return self.spriteClass(*args)
+
+    def release(self, sprite):
+        """Store a sprite in the pool to be reused. The sprite should already be removed from all of its groups.
+
+        Args:
+            sprite: The sprite of spriteClass to store.
+        """
+        if len(self.freeSprites) < self.maxSize:
+            self.freeSprites[id(sprite)] = sprite
+
+
+def getSpritePool(spriteClass):
+    """Get the pool for a sprite class, creating it if it does not exist yet.
+
+    Args:
+        spriteClass: The sprite class whose pool to get.
+
+    Returns:
+        The SpritePool object for spriteClass.
+    """
+    spritePool = _spritePools.get(spriteClass)
+    if spritePool is None:
+        spritePool = _spritePools[spriteClass] = SpritePool(spriteClass)
+    return spritePool
+
+
+def getSpritePools():
+    """Get the dict of every sprite pool, so it can be stored and put back with setSpritePools.
+
+    Returns:
+        A dict associating each pooled sprite class with its SpritePool object.
+    """
+    return _spritePools
+
+
+def setSpritePools(spritePools):
+    """Replace every sprite pool with those of the passed dict, as returned by getSpritePools.
+
+    Args:
+        spritePools: A dict associating each pooled sprite class with its SpritePool object.
+    """
+    global _spritePools
+    _spritePools = spritePools
+
+
+def getPooledSprite(spriteClass, *args):
+    """Get a sprite of the passed class, reusing one from its pool if possible.
+
+    Args:
+        spriteClass: The sprite class of the sprite to get.
+        *args: The arguments to pass to the sprite's reset or __init__ method.
+
+    Returns:
+        A sprite of spriteClass, in the same state as a newly created one.
+    """
+    return getSpritePool(spriteClass).get(*args)
+
+
+def releaseGroup(group):
+    """Empty a sprite group, storing every sprite in it that has a pool to be reused.
+
+    Pooled sprite classes store themselves in their pool when they are killed, so those sprites are killed, and
+    the rest are only removed from the group.
+
+    Args:
+        group: The sprite group to empty.
+    """
+    for sprite in group.sprites():
+        if type(sprite) in _spritePools:
+            sprite.kill()
+    group.empty()
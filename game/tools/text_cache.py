@@ -0,0 +1,38 @@
+from collections import OrderedDict
+
+import game.tools.constants as c
+
+
+_textLibrary = OrderedDict()
+_maxTextCount = 256
+
+
+def renderText(text, color=c.WHITE, font=c.FONT):
+    """Get the passed text rendered in the passed color and font, without antialiasing.
+
+    If the text has not already been rendered with this color and font, it renders it as a new Surface object.
+    If it has already been rendered recently, it simply returns the rendered text.
+    This increases speed, as the level data and scores would otherwise render the same text every frame.
+    Only the most recently used texts are kept, so texts that change constantly (Such as the time remaining) do not
+    fill up memory. Because the rendered texts are shared, they should never be drawn on or have their color key
+    changed.
+
+    Args:
+        text: The string to be rendered.
+        color: A tuple representing the color of the text.
+        font: The pygame Font object to render the text with.
+
+    Returns:
+        image: A Surface object of the rendered text.
+    """
+    global _textLibrary
+    textKey = (font, text, color)
+    image = _textLibrary.get(textKey)
+    if image is None:
+        image = font.render(text, False, color)
+        _textLibrary[textKey] = image
+        if len(_textLibrary) > _maxTextCount:
+            _textLibrary.popitem(last=False)
+    else:
+        _textLibrary.move_to_end(textKey)
+    return image
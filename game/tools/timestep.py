@@ -0,0 +1,71 @@
+import time
+
+import game.tools.constants as c
+
+
+class FixedTimestep:
+    """Schedule game logic ticks at a fixed rate of real time, independently of how long each frame takes to draw.
+
+    Real time that passes is added to an accumulator, and one tick is due for every tickLength seconds it holds.
+    If a frame takes too long to draw, the ticks that were missed are run before the next frame is drawn, so slow
+    frames only lower the number of frames drawn, rather than slowing down the gameplay.
+
+    Attributes:
+        tickRate: An integer number of logic ticks to run per second. Defaults to FPS.
+        maxTicksPerFrame: An integer limit on how many ticks can be run before each frame is drawn.
+            Any more ticks that were due are dropped. Defaults to MAX_TICKS_PER_FRAME.
+        isFixed: A boolean indicating if ticks should be scheduled by real time. If it is False, exactly one tick is
+            run per frame, and the clock simply waits as it would with c.CLOCK.tick(tickRate).
+            Defaults to FIXED_TIMESTEP.
+    """
+
+    def __init__(self, tickRate=None, maxTicksPerFrame=None, isFixed=None):
+        """Init FixedTimestep using the integers tickRate and maxTicksPerFrame and the boolean isFixed.
+
+        Instance variables:
+            tickLength: A float number of seconds between each tick.
+            accumulator: A float number of seconds of real time that have not been run as ticks yet.
+            previousTime: The float time, in seconds, that the accumulator was last updated at.
+                Set to None until waitForTicks is first called.
+        """
+        self.tickRate = c.FPS if tickRate is None else tickRate
+        self.maxTicksPerFrame = c.MAX_TICKS_PER_FRAME if maxTicksPerFrame is None else maxTicksPerFrame
+        self.isFixed = c.FIXED_TIMESTEP if isFixed is None else isFixed
+        self.tickLength = 1 / self.tickRate
+        self.accumulator = 0
+        self.previousTime = None
+
+    def reset(self):
+        """Forget any time that has passed, so no ticks are due until tickLength seconds from now.
+
+        This should be called after anything that blocks the game for a while (Such as pausing), so the blocked
+        time is not run as ticks.
+        """
+        self.accumulator = 0
+        self.previousTime = time.perf_counter()
+
+    def waitForTicks(self):
+        """Wait until at least one tick is due, then get how many ticks should be run before the next frame is
+        drawn.
+
+        Returns:
+            ticksDue: An integer number of ticks to run, from 1 to maxTicksPerFrame.
+        """
+        if not self.isFixed:
+            c.CLOCK.tick(self.tickRate)
+            return 1
+        if self.previousTime is None:
+            self.reset()
+        while True:
+            currentTime = time.perf_counter()
+            self.accumulator += currentTime - self.previousTime
+            self.previousTime = currentTime
+            if self.accumulator >= self.tickLength:
+                break
+            time.sleep(self.tickLength - self.accumulator)
+
+        ticksDue = int(self.accumulator // self.tickLength)
+        self.accumulator -= ticksDue * self.tickLength
+        if ticksDue > self.maxTicksPerFrame:
+            ticksDue = self.maxTicksPerFrame
+        return ticksDue
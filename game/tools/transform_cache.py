@@ -0,0 +1,107 @@
+import pygame as pg
+
+
+_rotationLibrary = {}
+_flipLibrary = {}
+# Maps every flipped image made by getFlippedImage to the image and flips it was made from, so that flipping it
+# again reuses the original image instead of making a new Surface object.
+_flipSources = {}
+_transformCount = 0
+
+
+def getRotatedImage(image, degrees):
+    """Get the passed image rotated by the passed number of degrees to the left.
+
+    If this rotation of the image has not already been made, it rotates the image with pg.transform.rotate.
+    If it has already been made before, it simply returns the rotated image.
+    This increases speed, as it prevents sprites from creating a new Surface object whenever they rotate their
+    image in their update methods.
+    Because the rotated images are shared, neither the passed image nor the returned image should be drawn on or
+    have their color key changed.
+
+    Args:
+        image: The Surface object to be rotated.
+        degrees: An integer number of degrees to rotate the image to the left.
+
+    Returns:
+        rotatedImage: A Surface object of the rotated image.
+    """
+    global _rotationLibrary, _transformCount
+    if degrees == 0:
+        return image
+    rotatedImage = _rotationLibrary.get((image, degrees))
+    if rotatedImage is None:
+        rotatedImage = pg.transform.rotate(image, degrees)
+        _rotationLibrary[(image, degrees)] = rotatedImage
+        _transformCount += 1
+    return rotatedImage
+
+
+def getFlippedImage(image, flipHorizontally, flipVertically):
+    """Get the passed image flipped horizontally, vertically, or both.
+
+    If this flip of the image has not already been made, it flips the image with pg.transform.flip.
+    If it has already been made before, it simply returns the flipped image.
+    If the passed image was itself made by this function, the flips are combined and applied to its source image
+    instead, so a chain of flips never makes more than the three flips of the source image.
+    Because the flipped images are shared, neither the passed image nor the returned image should be drawn on or
+    have their color key changed.
+
+    Args:
+        image: The Surface object to be flipped.
+        flipHorizontally: A boolean indicating if the image should be flipped horizontally.
+        flipVertically: A boolean indicating if the image should be flipped vertically.
+
+    Returns:
+        flippedImage: A Surface object of the flipped image.
+    """
+    global _flipLibrary, _flipSources, _transformCount
+    if image in _flipSources:
+        image, sourceFlipHorizontally, sourceFlipVertically = _flipSources[image]
+        flipHorizontally = flipHorizontally != sourceFlipHorizontally
+        flipVertically = flipVertically != sourceFlipVertically
+    if not flipHorizontally and not flipVertically:
+        return image
+    flippedImage = _flipLibrary.get((image, flipHorizontally, flipVertically))
+    if flippedImage is None:
+        flippedImage = pg.transform.flip(image, flipHorizontally, flipVertically)
+        _flipLibrary[(image, flipHorizontally, flipVertically)] = flippedImage
+        _flipSources[flippedImage] = (image, flipHorizontally, flipVertically)
+        _transformCount += 1
+    return flippedImage
+
+
+def cacheImageVariants(images, rotations=(0,), flips=((True, False), (False, True), (True, True))):
+    """Make every listed rotation of the passed images, and every listed flip of each of those rotations.
+
+    This is to be called when a sprite class loads its images, so that the rotations and flips its update method
+    asks for are already stored, and no pg.transform call is made while a level is being played.
+
+    Args:
+        images: An iterable of the Surface objects to be rotated and flipped.
+        rotations: An iterable of integer numbers of degrees to rotate each image to the left.
+        flips: An iterable of (flipHorizontally, flipVertically) boolean tuples to flip each rotated image by.
+    """
+    for image in images:
+        for degrees in rotations:
+            rotatedImage = getRotatedImage(image, degrees)
+            for flipHorizontally, flipVertically in flips:
+                getFlippedImage(rotatedImage, flipHorizontally, flipVertically)
+
+
+def getTransformCount():
+    """Get how many rotated or flipped images have been created since the count was last reset.
+
+    As every sprite class makes its rotations and flips with cacheImageVariants when it loads its images, this
+    count should not increase while a level is being played.
+
+    Returns:
+        An integer count of the pg.transform calls made by this module.
+    """
+    return _transformCount
+
+
+def resetTransformCount():
+    """Reset the count returned by getTransformCount to 0, without clearing any stored images."""
+    global _transformCount
+    _transformCount = 0
@@ -0,0 +1,39 @@
+import argparse
+import os
+import time
+
+# The environment variable must be set before the game is imported, so pygame starts with its dummy drivers.
+os.environ["CLU_HEADLESS"] = "1"
+
+from game.gameplay.simulation import replayGame, simulateGame
+from game.tools.replay import loadInputLog
+
+
+def main():
+    """Simulate games without a display, then print the results of each level and how long they took to run."""
+    parser = argparse.ArgumentParser(description="Run Clu Clu Land games headlessly, as fast as possible.")
+    parser.add_argument("--players", type=int, default=1, choices=range(1, 5), help="number of players")
+    parser.add_argument("--levels", type=int, default=None, help="maximum number of levels to play")
+    parser.add_argument("--games", type=int, default=1, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the first game, increased by 1 each game")
+    parser.add_argument("--replay", default=None, help="path of a saved input log to replay instead")
+    args = parser.parse_args()
+
+    for gameNumber in range(args.games):
+        startTime = time.perf_counter()
+        if args.replay is not None:
+            results = replayGame(loadInputLog(args.replay))
+        else:
+            seed = None if args.seed is None else args.seed + gameNumber
+            results = simulateGame(args.players, maxLevels=args.levels, seed=seed)
+        elapsedTime = time.perf_counter() - startTime
+        frameCount = sum(result["frames"] for result in results)
+        print("GAME {}: {} levels, {} frames in {:.2f}s ({:.0f} frames/s)".format(
+            gameNumber + 1, len(results), frameCount, elapsedTime, frameCount / max(elapsedTime, 1e-9)))
+        for result in results:
+            print("  {levelCount:>3} {level:<16} cleared={cleared!s:<5} frames={frames:<6} scores={scores} "
+                  "lives={lives}".format(**result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import json
+import os
+
+# The environment variable must be set before the game is imported, so pygame starts with its dummy drivers.
+os.environ["CLU_HEADLESS"] = "1"
+
+from game.gameplay.batch_simulation import POLICIES
+from game.gameplay.level import BonusLevel, levelsByName
+from game.gameplay.stress import runStressTest
+
+
+def main():
+    """Play one level crowded with enemies, then print the frame rate it sustained and the cost of each part of a
+    frame."""
+    levelNames = [name for name, level in levelsByName.items() if not isinstance(level, BonusLevel)]
+    parser = argparse.ArgumentParser(description="Stress test Clu Clu Land with many enemies on large boards.")
+    parser.add_argument("--level", default="HEART", choices=sorted(levelNames), metavar="LEVEL",
+                        help="name of the level to tile into the board")
+    parser.add_argument("--urchins", type=int, default=20, help="number of urchins to keep on the board")
+    parser.add_argument("--black-holes", type=int, default=None,
+                        help="number of black holes to spawn urchins from (default: those of every copy of the level)")
+    parser.add_argument("--columns", type=int, default=1, help="number of copies of the level placed side by side")
+    parser.add_argument("--rows", type=int, default=1, help="number of copies of the level placed above one another")
+    parser.add_argument("--players", type=int, default=1, choices=range(1, 5), help="number of players")
+    parser.add_argument("--frames", type=int, default=1800, help="number of frames to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the game, the policy and the black holes")
+    parser.add_argument("--policy", default="random",
+                        help="input policy: one of {}, or module.path:functionName".format(", ".join(POLICIES)))
+    parser.add_argument("--draw", action="store_true", help="draw every frame, as the game would")
+    parser.add_argument("--output", default=None, help="path of a JSON file to write the result to")
+    parser.add_argument("--profile-output", default=None,
+                        help="path, without an extension, of the CSV and JSON files to write every frame's times to")
+    args = parser.parse_args()
+
+    result = runStressTest(args.level, args.urchins, args.black_holes, args.columns, args.rows, args.players,
+                           args.frames, args.seed, args.policy, args.draw, args.profile_output)
+    print("{levelName} tiled {columns}x{rows} ({boardSize[0]}x{boardSize[1]} px): {urchins} urchins, "
+          "{blackHoles} black holes, {gold} gold, {players} player(s)".format(**result))
+    print("{frames} frames in {seconds:.2f}s ({framesPerSecond:.1f} frames/s)".format(**result))
+    print("frame: mean {frameMean:.3f} ms, p95 {frameP95:.3f} ms, max {frameMax:.3f} ms "
+          "({budgetPercent:.1f}% of the 60 FPS budget)".format(**result))
+    print("{:<22}{:>10}{:>10}{:>10}{:>9}".format("SECTION", "MEAN(ms)", "P95(ms)", "MAX(ms)", "SHARE"))
+    for section, times in sorted(result["sections"].items(), key=lambda item: -item[1]["mean"]):
+        print("{:<22}{:>10.3f}{:>10.3f}{:>10.3f}{:>9.1%}".format(section, times["mean"], times["p95"], times["max"],
+                                                                  times["mean"] / max(result["frameMean"], 1e-9)))
+
+    if args.output is not None:
+        with open(args.output, "w") as outputFile:
+            json.dump(result, outputFile, indent=1)
+
+
+if __name__ == "__main__":
+    main()